@@ -1,23 +1,80 @@
 #!/usr/bin/env python3
 
+import argparse
 import asyncio
 import logging
 
 import mcp.server.stdio
+import uvicorn
 from mcp.server.lowlevel import NotificationOptions
 from mcp.server.models import InitializationOptions
 
 from src.gmail_mcp_server import configs, mcp_server
+from src.gmail_mcp_server.http_app import create_http_app, is_loopback_host
+from src.gmail_mcp_server.resources import preload_email_guidelines
+from src.gmail_mcp_server.services import google_oauth_credentials_manager
+from src.gmail_mcp_server.services.google_oauth_credentials import (
+    OAUTH_CALLBACK_PORT,
+)
 
 SERVER_NAME = configs.get("server_name")
 SERVER_VERSION = configs.get("server_version")
+TRANSPORTS = ("stdio", "http")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logging.getLogger(SERVER_NAME)
 
 
-async def main():
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Gmail MCP server")
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default=configs.get("transport", "stdio"),
+        help="stdio for one client per process, http for one shared server",
+    )
+    parser.add_argument("--host", default=configs.get("host", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=configs.get("port", 8000))
+    parser.add_argument(
+        "--allow-remote",
+        action="store_true",
+        default=configs.get("allow_remote", False),
+        help="allow a non-loopback --host; the server has no authentication, "
+        "so anyone who can reach it can read the mailbox",
+    )
+    args = parser.parse_args()
+
+    if args.transport == "http":
+        if not args.allow_remote and not is_loopback_host(args.host):
+            parser.error(
+                f"refusing to listen on {args.host} without authentication; "
+                "pass --allow-remote to expose the mailbox on that interface"
+            )
+        if args.port == OAUTH_CALLBACK_PORT:
+            parser.error(
+                f"port {args.port} is the OAuth callback port; choose another "
+                "--port or change oauth_callback_port in settings.toml"
+            )
+    return args
+
+
+async def main(args: argparse.Namespace):
+    # Load credentials up front so token refreshes happen off the tool-call path
+    await google_oauth_credentials_manager.start()
+    if configs.get("preload_email_guidelines", False):
+        await preload_email_guidelines()
+
+    try:
+        if args.transport == "http":
+            await run_http(args.host, args.port)
+        else:
+            await run_stdio()
+    finally:
+        google_oauth_credentials_manager.stop()
+
+
+async def run_stdio():
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await mcp_server.run(
             read_stream,
@@ -33,5 +90,16 @@ async def main():
         )
 
 
+async def run_http(host: str, port: int):
+    # Every client session shares this process's services, credentials and caches
+    config = uvicorn.Config(
+        create_http_app(),
+        host=host,
+        port=port,
+        log_level=configs.get("log_level", "info"),
+    )
+    await uvicorn.Server(config).serve()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(parse_args()))
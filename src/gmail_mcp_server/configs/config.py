@@ -20,6 +20,9 @@ configs = Dynaconf(
 
 configs.client_secrets_file = _base_dir / "credentials" / "client_secrets.json"
 configs.token_file = _base_dir / "credentials" / "token.json"
+configs.message_cache_dir = Path(
+    configs.get("message_cache_dir") or _base_dir / ".cache"
+)
 
 # `envvar_prefix` = export envvars with `export DYNACONF_FOO=bar`.
 # `settings_files` = Load these files in the order.
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+"""
+Streamable HTTP transport for the MCP server.
+
+With stdio every client spawns its own server process, each with cold caches
+and its own credentials. Over Streamable HTTP one long-lived process serves
+concurrent client sessions, all sharing the same API services, credentials and
+caches.
+
+The server has no authentication of its own: whoever can reach the port can
+read the mailbox and create drafts. It should therefore listen on a loopback
+address unless it sits behind something that authenticates clients.
+
+Reference: https://modelcontextprotocol.io/specification/2025-06-18/basic/transports#streamable-http
+"""
+
+import contextlib
+import ipaddress
+import logging
+from collections.abc import AsyncIterator
+
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.types import Receive, Scope, Send
+
+from .server import mcp_server
+
+MCP_PATH = "/mcp"
+
+logger = logging.getLogger(__name__)
+
+
+def is_loopback_host(host: str) -> bool:
+    """
+    Return whether binding to `host` keeps the server reachable only locally.
+
+    example:
+        is_loopback_host("127.0.0.1")  # True
+        is_loopback_host("0.0.0.0")  # False
+    """
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def create_http_app(json_response: bool = False) -> Starlette:
+    """
+    Build the ASGI app that serves `mcp_server` over Streamable HTTP.
+
+    parameters:
+        json_response (bool): Answer with JSON bodies instead of SSE streams.
+
+    returns:
+        Starlette: An app exposing the MCP endpoint at `/mcp`.
+
+    example:
+        uvicorn.run(create_http_app(), host="127.0.0.1", port=8000)
+    """
+    session_manager = StreamableHTTPSessionManager(
+        app=mcp_server, json_response=json_response
+    )
+
+    async def handle_mcp_request(scope: Scope, receive: Receive, send: Send) -> None:
+        await session_manager.handle_request(scope, receive, send)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with session_manager.run():
+            logger.info(f"Serving MCP sessions over Streamable HTTP at {MCP_PATH}")
+            yield
+
+    return Starlette(
+        routes=[Mount(MCP_PATH, app=handle_mcp_request)],
+        lifespan=lifespan,
+    )
@@ -10,7 +10,7 @@ async def draft_professional_reply(arguments: dict[str, str]):
 
 **CHAIN OF THOUGHT PROCESS:**
 
-1. **Retrieve Context**: First, use the get_unread_emails tool to retrieve the original email for thread_id: {thread_id}
+1. **Retrieve Context**: First, use the get_thread tool to retrieve the original email for thread_id: {thread_id}
 
 2. **Analyze the Email**:
 - Identify the sender's tone and relationship level
@@ -11,14 +11,14 @@ async def schedule_meeting_reply(arguments: dict[str, str]):
 
 **CONTEXTUAL REASONING PROCESS:**
 
-1. **Retrieve Original Email**: Use get_unread_emails to fetch thread_id: {thread_id}
+1. **Retrieve Original Email**: Use get_thread to fetch thread_id: {thread_id}
    - Identify: Who is requesting the meeting?
    - Extract: What is the meeting about?
    - Check: Are specific times already proposed?
 
 2. **Check Calendar Availability**:
    - Access calendar resource: calendar:///availability/{date_range_start}/{date_range_end}
-   - Identify free slots in your calendar
+   - The resource returns JSON: pick options from `freeSlots` (already within working hours, in `timeZone`)
    - Note: You must propose exactly 2 time slot options (per AI directive scheduling protocol)
 
 3. **Access Guidelines**:
@@ -8,7 +8,7 @@ async def suggest_template(arguments: dict[str, str]):
 
 **FEW-SHOT TEMPLATE MATCHING PROCESS:**
 
-1. **Retrieve the Email**: Use get_unread_emails to fetch thread_id: {thread_id}
+1. **Retrieve the Email**: Use get_thread to fetch thread_id: {thread_id}
 
 2. **Access Template Library**: Read resource file:///personal-templates.md
    - Available templates (11 total):
@@ -1,6 +1,12 @@
 """Resources module for Gmail MCP Server."""
 
 from .calendar_availability import get_calendar_availability
-from .email_guidelines import get_email_guidelines
+from .email_guidelines import get_email_guidelines, preload_email_guidelines
+from .server_metrics import get_server_metrics
 
-__all__ = ["get_email_guidelines", "get_calendar_availability"]
+__all__ = [
+    "get_email_guidelines",
+    "get_calendar_availability",
+    "get_server_metrics",
+    "preload_email_guidelines",
+]
@@ -2,11 +2,28 @@
 
 """Calendar availability resources for checking user's calendar."""
 
+import json
 import logging
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
 
 from googleapiclient.errors import HttpError
 
-from ..services import get_google_calendar_api_service
+from ..configs import configs
+from ..services import (
+    calendar_list_cache,
+    get_google_calendar_api_service,
+    query_freebusy,
+)
+from ..utils import compute_free_slots, merge_intervals
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+TIME_ZONE = configs.get("time_zone", "UTC")
+WORKING_HOURS_START = configs.get("working_hours_start", "09:00")
+WORKING_HOURS_END = configs.get("working_hours_end", "17:00")
+WORKING_DAYS = [day.lower() for day in configs.get("working_days", WEEKDAYS[:5])]
+MIN_FREE_SLOT_MINUTES = configs.get("min_free_slot_minutes", 30)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +40,11 @@ async def get_calendar_availability(
     """
     Retrieves calendar availability for a given time range.
 
+    Busy periods from every calendar are merged and subtracted from the working
+    hours configured in settings.toml (`time_zone`, `working_hours_start`,
+    `working_hours_end`, `working_days`), leaving ready-to-propose free slots
+    of at least `min_free_slot_minutes`.
+
     Reference: https://developers.google.com/calendar/api/v3/reference
 
     parameters:
@@ -30,7 +52,7 @@ async def get_calendar_availability(
         end_date_time_str (str): End date/time in ISO 8601 format
 
     returns:
-        str: Calendar availability information
+        str: Calendar availability as JSON, with free slots and busy periods
 
     raises:
         GoogleCalendarAPIError: If there's an error retrieving calendar data
@@ -54,64 +76,36 @@ async def get_calendar_availability(
         logger.info("Fetching Google Calendar service")
         google_calendar_service = get_google_calendar_api_service()
 
-        # Get the user's calendar IDs (synchronous call, no await)
+        # Get the user's calendars as an ID -> name index (cached)
         logger.info("Retrieving user's calendar list")
-        calendar_list_result = google_calendar_service.calendarList().list().execute()
+        calendar_names = await calendar_list_cache.get_calendar_names(
+            google_calendar_service
+        )
 
-        calendar_ids = [cal["id"] for cal in calendar_list_result.get("items", [])]
+        calendar_ids = list(calendar_names)
 
         logger.info(f"Found {len(calendar_ids)} calendars")
 
-        # Query freebusy information for all calendars
+        # Query freebusy information for all calendars, split into groups of
+        # calendars and windows of time that the API accepts
         # Reference: https://developers.google.com/workspace/calendar/api/v3/reference/freebusy/query
         logger.info("Querying freebusy information")
-        freebusy_query = {
-            "timeMin": start_date_time_str,
-            "timeMax": end_date_time_str,
-            "items": [{"id": cal_id} for cal_id in calendar_ids],
-        }
-
-        freebusy_result = (
-            google_calendar_service.freebusy().query(body=freebusy_query).execute()
+        calendars_info = await query_freebusy(
+            google_calendar_service,
+            calendar_ids,
+            start_date_time_str,
+            end_date_time_str,
         )
 
-        # Format the availability results
-        calendars_info = freebusy_result.get("calendars", {})
-
-        availability_message = "# Calendar Availability\n\n"
-        availability_message += (
-            f"**Time Range:** {start_date_time_str} to {end_date_time_str}\n\n"
+        availability = _build_availability(
+            start_date_time_str, end_date_time_str, calendars_info, calendar_names
         )
 
-        for cal_id, cal_data in calendars_info.items():
-            busy_periods = cal_data.get("busy", [])
-
-            # Get calendar name from the list
-            cal_name = next(
-                (
-                    cal.get("summary", cal_id)
-                    for cal in calendar_list_result.get("items", [])
-                    if cal.get("id") == cal_id
-                ),
-                cal_id,
-            )
-
-            availability_message += f"## {cal_name}\n"
-
-            if not busy_periods:
-                availability_message += "**Free** - No busy periods\n\n"
-            else:
-                availability_message += (
-                    f"**Busy** - {len(busy_periods)} busy period(s):\n"
-                )
-                for period in busy_periods:
-                    start = period.get("start", "N/A")
-                    end = period.get("end", "N/A")
-                    availability_message += f"  - {start} to {end}\n"
-                availability_message += "\n"
-
-        logger.info("Successfully retrieved calendar availability")
-        return availability_message
+        logger.info(
+            f"Successfully retrieved calendar availability: "
+            f"{len(availability['freeSlots'])} free slot(s)"
+        )
+        return json.dumps(availability, indent=2)
 
     except HttpError as e:
         error_msg = f"Google Calendar API Error: {str(e)}"
@@ -121,3 +115,83 @@ async def get_calendar_availability(
         error_msg = f"Unexpected Error retrieving calendar availability: {str(e)}"
         logger.error(error_msg)
         raise GoogleCalendarAPIError(error_msg)
+
+
+def _build_availability(
+    start_date_time_str: str,
+    end_date_time_str: str,
+    calendars_info: dict[str, dict],
+    calendar_names: dict[str, str],
+) -> dict:
+    """
+    Build the availability document from per-calendar free/busy results.
+
+    returns:
+        dict: The time range, working hours, merged busy periods, free slots
+              and each calendar's own busy periods.
+    """
+    tz = ZoneInfo(TIME_ZONE)
+    range_start = datetime.fromisoformat(start_date_time_str)
+    range_end = datetime.fromisoformat(end_date_time_str)
+
+    calendars = []
+    busy_intervals = []
+    for cal_id, cal_data in calendars_info.items():
+        busy_periods = cal_data.get("busy", [])
+        calendar = {
+            "id": cal_id,
+            "name": calendar_names.get(cal_id, cal_id),
+            "busy": busy_periods,
+        }
+        if cal_data.get("errors"):
+            calendar["errors"] = cal_data["errors"]
+        calendars.append(calendar)
+        busy_intervals.extend(
+            (
+                datetime.fromisoformat(period["start"]),
+                datetime.fromisoformat(period["end"]),
+            )
+            for period in busy_periods
+        )
+
+    working_days = [WEEKDAYS.index(day[:3]) for day in WORKING_DAYS]
+    free_slots = compute_free_slots(
+        busy_intervals,
+        range_start,
+        range_end,
+        working_hours=(
+            time.fromisoformat(WORKING_HOURS_START),
+            time.fromisoformat(WORKING_HOURS_END),
+        ),
+        working_days=working_days,
+        tz=tz,
+        min_duration=timedelta(minutes=MIN_FREE_SLOT_MINUTES),
+    )
+
+    return {
+        "timeMin": start_date_time_str,
+        "timeMax": end_date_time_str,
+        "timeZone": TIME_ZONE,
+        "workingHours": {
+            "start": WORKING_HOURS_START,
+            "end": WORKING_HOURS_END,
+            "days": [WEEKDAYS[day] for day in working_days],
+        },
+        "minSlotMinutes": MIN_FREE_SLOT_MINUTES,
+        "freeSlots": [
+            {
+                "start": slot_start.isoformat(),
+                "end": slot_end.isoformat(),
+                "minutes": int((slot_end - slot_start).total_seconds() // 60),
+            }
+            for slot_start, slot_end in free_slots
+        ],
+        "busy": [
+            {
+                "start": busy_start.astimezone(tz).isoformat(),
+                "end": busy_end.astimezone(tz).isoformat(),
+            }
+            for busy_start, busy_end in merge_intervals(busy_intervals)
+        ],
+        "calendars": calendars,
+    }
@@ -2,13 +2,14 @@
 
 """Email guidelines resources for AI-assisted email drafting."""
 
+import asyncio
 import logging
 from typing import Literal
 
 from googleapiclient.errors import HttpError
 
 from ..configs import configs
-from ..services import get_google_drive_api_service
+from ..services import drive_export_cache, get_google_drive_api_service
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,10 @@ logger = logging.getLogger(__name__)
 GuidelineName = Literal["7cs", "email_templates", "directive"]
 
 
+# Define valid guideline names
+VALID_GUIDELINES = {"7cs", "email_templates", "directive"}
+
+
 class GoogleDriveAPIError(Exception):
     """Exception raised when there is an error with the Google Drive API."""
 
@@ -29,6 +34,7 @@ async def get_email_guidelines(
     Retrieves email guideline documents from Google Drive.
 
     The guideline documents are stored as Google Docs and exported as markdown.
+    Exports are cached and revalidated against the document's modifiedTime.
 
     Reference:  https://developers.google.com/drive/api/v3/reference/files/export
                 https://developers.google.com/drive/api/guides/ref-export-formats
@@ -46,9 +52,6 @@ async def get_email_guidelines(
         await get_email_guidelines('7cs')
     """
 
-    # Define valid guideline names
-    VALID_GUIDELINES = {"7cs", "email_templates", "directive"}
-
     try:
         logger.debug(f"Retrieving guideline: {guideline_name}")
 
@@ -69,14 +72,12 @@ async def get_email_guidelines(
             logger.error(error_msg)
             raise GoogleDriveAPIError(error_msg)
 
-        logger.info(f"Exporting Google Doc {doc_file_id} as markdown")
         google_drive_service = get_google_drive_api_service()
 
-        # Export the Google Doc as markdown (returns bytes)
-        guideline_doc = (
-            google_drive_service.files()
-            .export(fileId=doc_file_id, mimeType="text/markdown")
-            .execute()
+        # Export the Google Doc as markdown (returns bytes), re-exporting only
+        # when the document has changed since it was last cached
+        guideline_doc = await drive_export_cache.export(
+            google_drive_service, doc_file_id, "text/markdown"
         )
 
         logger.info(f"Successfully retrieved guideline: {guideline_name}")
@@ -94,3 +95,21 @@ async def get_email_guidelines(
         raise GoogleDriveAPIError(
             f"Unexpected Error retrieving guideline '{guideline_name}': {str(e)}"
         )
+
+
+async def preload_email_guidelines() -> None:
+    """
+    Export every guideline document into the cache ahead of the first read.
+
+    Failures are logged and left for the first resource read to report.
+
+    example:
+        await preload_email_guidelines()
+    """
+    names = sorted(VALID_GUIDELINES)
+    results = await asyncio.gather(
+        *(get_email_guidelines(name) for name in names), return_exceptions=True
+    )
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Could not preload guideline '{name}': {result}")
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+"""Server metrics resource for observing API quota usage."""
+
+import json
+
+from ..services import metrics
+
+
+async def get_server_metrics() -> str:
+    """
+    Returns the server's in-process metrics.
+
+    Includes per-API quota units spent, requests queued for quota right now
+    (`quota.<api>.queue_depth`) and how long requests waited for it
+    (`quota.<api>.wait_seconds`).
+
+    returns:
+        str: A metrics snapshot as JSON
+
+    example:
+        await get_server_metrics()
+    """
+    return json.dumps(metrics.snapshot(), indent=2, sort_keys=True)
@@ -8,11 +8,21 @@ from pydantic import AnyUrl, FileUrl
 
 from .configs import configs
 from .prompts import draft_professional_reply, schedule_meeting_reply, suggest_template
-from .resources import get_calendar_availability, get_email_guidelines
-from .tools import create_draft_reply, get_unread_emails
+from .resources import (
+    get_calendar_availability,
+    get_email_guidelines,
+    get_server_metrics,
+)
+from .tools import (
+    create_draft_reply,
+    get_email,
+    get_mailbox_stats,
+    get_thread,
+    get_unread_emails,
+)
 from .utils import format_to_rfc3339
 
-mcp_server = Server(configs["server_name"])
+mcp_server = Server(configs["server_name"], version=configs.get("server_version"))
 
 
 @mcp_server.list_tools()
@@ -29,7 +39,66 @@ async def handle_list_tools() -> list[types.Tool]:
                         "description": "The maximum number of emails to retrieve",
                         "default": configs["max_email_limit"],
                     },
+                    "mode": {
+                        "type": "string",
+                        "enum": ["metadata", "snippet", "full"],
+                        "description": "metadata: one line of sender, subject and date per email; snippet: the same plus a short preview; full: the email bodies",
+                        "default": "full",
+                    },
+                    "group_by_thread": {
+                        "type": "boolean",
+                        "description": "Return one entry per conversation, with repeated bodies shown once",
+                        "default": False,
+                    },
+                },
+            },
+        ),
+        types.Tool(
+            name="get_email",
+            description="Get one email by ID, paging through its body with offset and length",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "message_id": {
+                        "type": "string",
+                        "description": "The ID of the email obtained from get_unread_emails",
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Body character offset to read from, as given in a truncation marker",
+                        "default": 0,
+                    },
+                    "length": {
+                        "type": "integer",
+                        "description": "Maximum body characters to return",
+                        "default": configs["max_body_chars"],
+                    },
+                },
+                "required": ["message_id"],
+            },
+        ),
+        types.Tool(
+            name="get_thread",
+            description="Get every message of an email thread, paging through it with offset and length",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "thread_id": {
+                        "type": "string",
+                        "description": "The ID of the email thread obtained from get_unread_emails",
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Character offset to read from, as given in a truncation marker",
+                        "default": 0,
+                    },
+                    "length": {
+                        "type": "integer",
+                        "description": "Maximum characters to return",
+                        "default": configs["max_response_chars"],
+                    },
                 },
+                "required": ["thread_id"],
             },
         ),
         types.Tool(
@@ -50,6 +119,11 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["thread_id", "reply_body"],
             },
         ),
+        types.Tool(
+            name="mailbox_stats",
+            description="Count unread and total emails in the mailbox and per label, without downloading any emails",
+            inputSchema={"type": "object", "properties": {}},
+        ),
     ]
 
 
@@ -58,10 +132,26 @@ async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent
     match name:
         case "get_unread_emails":
             return await get_unread_emails(
-                arguments.get("limit", configs["max_email_limit"])
+                arguments.get("limit", configs["max_email_limit"]),
+                arguments.get("mode", "full"),
+                arguments.get("group_by_thread", False),
+            )
+        case "get_email":
+            return await get_email(
+                arguments.get("message_id"),
+                arguments.get("offset", 0),
+                arguments.get("length"),
+            )
+        case "get_thread":
+            return await get_thread(
+                arguments.get("thread_id"),
+                arguments.get("offset", 0),
+                arguments.get("length"),
             )
         case "create_draft_email":
             return await create_draft_reply(arguments)
+        case "mailbox_stats":
+            return await get_mailbox_stats()
         case _:
             raise ValueError(f"Unknown tool: {name}")
 
@@ -87,6 +177,12 @@ async def handle_list_resources() -> list[types.Resource]:
             description="Comprehensive directive for AI-assisted email drafting incorporating Dale Carnegie, Robert Cialdini, and Stephen Covey principles.",
             mimeType="text/markdown",
         ),
+        types.Resource(
+            uri=AnyUrl("metrics:///server"),
+            name="Server Metrics",
+            description="Google API quota usage: units spent, requests queued for quota and time spent waiting.",
+            mimeType="application/json",
+        ),
     ]
 
 
@@ -125,6 +221,8 @@ async def handle_read_resource(
             return await get_email_guidelines("directive")
         case "file:///personal-templates.md":
             return await get_email_guidelines("email_templates")
+        case "metrics:///server":
+            return await get_server_metrics()
         case _:
             raise ValueError(f"Unknown resource: {uri_str}")
 
@@ -1,11 +1,53 @@
+from .batch_request import execute_batch
+from .calendar_list_cache import calendar_list_cache
+from .drive_export_cache import drive_export_cache
+from .freebusy import query_freebusy
+from .freebusy_cache import freebusy_cache
+from .gmail_fields import (
+    MESSAGE_DISPLAY_FIELDS,
+    MESSAGE_TRIAGE_FIELDS,
+    THREAD_DISPLAY_FIELDS,
+    THREAD_MESSAGE_IDS_FIELDS,
+    THREAD_TRIAGE_FIELDS,
+    TRIAGE_HEADERS,
+    metadata_params,
+)
+from .google_oauth_credentials import google_oauth_credentials_manager
 from .google_workspace_service import (
     get_gmail_api_service,
     get_google_calendar_api_service,
     get_google_drive_api_service,
+    google_service_registry,
 )
+from .label_stats_cache import label_stats_cache
+from .mailbox_sync import unread_mailbox_sync
+from .message_cache import message_cache
+from .metrics import metrics
+from .quota_scheduler import quota_scheduler
+from .request_executor import execute_request
 
 __all__ = [
+    "MESSAGE_DISPLAY_FIELDS",
+    "MESSAGE_TRIAGE_FIELDS",
+    "THREAD_DISPLAY_FIELDS",
+    "THREAD_MESSAGE_IDS_FIELDS",
+    "THREAD_TRIAGE_FIELDS",
+    "TRIAGE_HEADERS",
+    "calendar_list_cache",
+    "drive_export_cache",
+    "execute_batch",
+    "execute_request",
+    "freebusy_cache",
     "get_gmail_api_service",
     "get_google_calendar_api_service",
     "get_google_drive_api_service",
+    "google_oauth_credentials_manager",
+    "google_service_registry",
+    "label_stats_cache",
+    "message_cache",
+    "metadata_params",
+    "metrics",
+    "query_freebusy",
+    "quota_scheduler",
+    "unread_mailbox_sync",
 ]
@@ -0,0 +1,116 @@
+"""
+Execute many Google API requests through the batch HTTP endpoint.
+
+A batch sends up to 100 sub-requests in a single multipart HTTP round trip.
+Larger request lists are split into chunks of `batch_size` (settings.toml),
+the chunks run concurrently on the request executor, and only idempotent
+sub-requests that failed with a transient error are retried, following
+`retry_policy`.
+
+Reference: https://developers.google.com/workspace/gmail/api/guides/batch
+"""
+
+import asyncio
+from logging import getLogger
+from typing import Any, Sequence
+
+from ..configs import configs
+from .metrics import metrics
+from .request_executor import execute_request
+from .retry_policy import RETRY_MAX_ATTEMPTS, RetryPolicy, is_idempotent
+
+MAX_BATCH_SIZE = 100
+BATCH_SIZE = min(configs.get("batch_size", 50), MAX_BATCH_SIZE)
+
+logger = getLogger(__name__)
+
+
+async def execute_batch(
+    service,
+    requests: Sequence[Any],
+    *,
+    batch_size: int = BATCH_SIZE,
+    max_attempts: int = RETRY_MAX_ATTEMPTS,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Execute requests through the service's batch endpoint.
+
+    parameters:
+        service: The API service the requests were built from.
+        requests: The `HttpRequest` objects to execute.
+        batch_size (int): Maximum sub-requests per batch (capped at 100).
+        max_attempts (int): Attempts per sub-request before giving up.
+        return_exceptions (bool): Return failures in place instead of raising.
+
+    returns:
+        list: Responses in the same order as `requests`.
+
+    raises:
+        HttpError: The first failure, unless `return_exceptions` is set.
+
+    example:
+        await execute_batch(gmail_service, [messages.get(userId="me", id=i) for i in ids])
+    """
+    batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+    policy = RetryPolicy(max_attempts=max_attempts)
+    deadline = policy.deadline()
+    results: list[Any] = [None] * len(requests)
+    pending = list(range(len(requests)))
+    delay = 0.0
+
+    for attempt in range(1, max_attempts + 1):
+        if not pending:
+            break
+        if attempt > 1:
+            logger.info(
+                f"Retrying {len(pending)} failed batch sub-request(s) in {delay:.2f}s"
+            )
+            metrics.increment("requests.batch.sub_request_retries", len(pending))
+            await asyncio.sleep(delay)
+
+        chunks = [
+            pending[start : start + batch_size]
+            for start in range(0, len(pending), batch_size)
+        ]
+        chunk_results = await asyncio.gather(
+            *(_execute_chunk(service, requests, chunk) for chunk in chunks)
+        )
+
+        pending = []
+        delay = 0.0
+        for chunk_result in chunk_results:
+            for index, (response, exception) in chunk_result.items():
+                if exception is None:
+                    results[index] = response
+                    continue
+                results[index] = exception
+                if not is_idempotent(requests[index]):
+                    continue
+                retry_delay = policy.next_delay(attempt, exception, deadline)
+                if retry_delay is not None:
+                    # Wait for the longest Retry-After among the failures
+                    pending.append(index)
+                    delay = max(delay, retry_delay)
+
+    failures = [result for result in results if isinstance(result, Exception)]
+    if failures and not return_exceptions:
+        logger.error(f"{len(failures)} batch sub-request(s) failed")
+        raise failures[0]
+    return results
+
+
+async def _execute_chunk(service, requests, indices):
+    """Send one batch and collect (response, exception) per request index."""
+    outcomes: dict[int, tuple[Any, Exception | None]] = {}
+
+    def _callback(request_id, response, exception):
+        outcomes[int(request_id)] = (response, exception)
+
+    batch = service.new_batch_http_request(callback=_callback)
+    for index in indices:
+        batch.add(requests[index], request_id=str(index))
+
+    logger.debug(f"Executing batch of {len(indices)} request(s)")
+    await execute_request(batch)
+    return outcomes
@@ -0,0 +1,124 @@
+"""
+Cached index of the user's calendar list.
+
+The calendar list rarely changes, yet availability reads need it every time to
+know which calendars to query and what to call them. The list is kept as a
+calendar ID -> display name index for `calendar_list_cache_ttl_seconds`.
+After that it is refreshed with the `nextSyncToken` from the previous listing,
+so only entries changed since then are transferred; an expired sync token
+(HTTP 410) falls back to a full listing.
+
+Reference: https://developers.google.com/workspace/calendar/api/guides/sync
+"""
+
+import asyncio
+import time
+from logging import getLogger
+from typing import Mapping, Optional
+
+from googleapiclient.errors import HttpError
+
+from ..configs import configs
+from .request_executor import execute_request
+
+CALENDAR_LIST_CACHE_TTL_SECONDS = configs.get("calendar_list_cache_ttl_seconds", 300)
+# calendarList.list returns at most 250 entries per page
+CALENDAR_LIST_PAGE_SIZE = 250
+CALENDAR_LIST_FIELDS = "items(id,summary,deleted,hidden),nextPageToken,nextSyncToken"
+
+logger = getLogger(__name__)
+
+
+class CalendarListCache:
+    """Calendar ID -> name index refreshed incrementally with sync tokens."""
+
+    def __init__(self, ttl_seconds: float = CALENDAR_LIST_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._names: dict[str, str] = {}
+        self._sync_token: Optional[str] = None
+        self._refreshed_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def get_calendar_names(self, calendar_service) -> Mapping[str, str]:
+        """
+        Return the user's calendars as an ID -> display name mapping.
+
+        The mapping is replaced, never modified, on refresh, so callers may
+        keep using one they already hold.
+
+        parameters:
+            calendar_service: The Google Calendar API service.
+
+        returns:
+            Mapping[str, str]: Calendar names keyed by calendar ID, in list order.
+
+        example:
+            names = await calendar_list_cache.get_calendar_names(calendar_service)
+        """
+        if self._is_fresh():
+            return self._names
+
+        async with self._lock:
+            if self._is_fresh():
+                return self._names
+
+            if self._sync_token is not None:
+                try:
+                    await self._refresh(calendar_service, self._sync_token)
+                    return self._names
+                except HttpError as e:
+                    if e.resp.status != 410:
+                        raise
+                    logger.info("Calendar list sync token expired, relisting")
+
+            await self._refresh(calendar_service)
+            return self._names
+
+    def clear(self) -> None:
+        """Forget the cached calendar list."""
+        self._names = {}
+        self._sync_token = None
+        self._refreshed_at = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at < self.ttl_seconds
+        )
+
+    async def _refresh(self, calendar_service, sync_token: Optional[str] = None):
+        """List every page, applying changes onto a copy of the index."""
+        names = dict(self._names) if sync_token else {}
+        page_token = None
+        while True:
+            params = {
+                "maxResults": CALENDAR_LIST_PAGE_SIZE,
+                "fields": CALENDAR_LIST_FIELDS,
+            }
+            if sync_token:
+                params["syncToken"] = sync_token
+            if page_token:
+                params["pageToken"] = page_token
+            response = await execute_request(
+                calendar_service.calendarList().list(**params)
+            )
+
+            for entry in response.get("items", []):
+                # Incremental results include deleted and hidden entries
+                if entry.get("deleted") or entry.get("hidden"):
+                    names.pop(entry["id"], None)
+                else:
+                    names[entry["id"]] = entry.get("summary", entry["id"])
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+        logger.info(f"Calendar list cache holds {len(names)} calendar(s)")
+        self._names = names
+        self._sync_token = response.get("nextSyncToken")
+        self._refreshed_at = time.monotonic()
+
+
+calendar_list_cache = CalendarListCache()
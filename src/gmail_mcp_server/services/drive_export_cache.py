@@ -0,0 +1,107 @@
+"""
+In-memory cache of Google Drive document exports.
+
+Exporting a Google Doc re-renders the whole document on every call. The
+exported bytes are kept together with the file's `version` and
+`modifiedTime`; once `drive_export_cache_ttl_seconds` has passed, a cheap
+`files.get(fields="modifiedTime,version")` decides whether the cached export
+is still current before exporting again.
+
+Reference: https://developers.google.com/drive/api/reference/rest/v3/files/get
+"""
+
+import asyncio
+import time
+from logging import getLogger
+from typing import NamedTuple, Optional
+
+from googleapiclient.errors import HttpError
+
+from ..configs import configs
+from .request_executor import execute_request
+
+DRIVE_EXPORT_CACHE_TTL_SECONDS = configs.get("drive_export_cache_ttl_seconds", 300)
+REVISION_FIELDS = "modifiedTime,version"
+
+logger = getLogger(__name__)
+
+
+class _CachedExport(NamedTuple):
+    content: bytes
+    revision: tuple[Optional[str], Optional[str]]
+    checked_at: float
+
+
+class DriveExportCache:
+    """Cache of exported Drive files keyed by file ID and MIME type."""
+
+    def __init__(self, ttl_seconds: float = DRIVE_EXPORT_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple[str, str], _CachedExport] = {}
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+    async def export(self, drive_service, file_id: str, mime_type: str) -> bytes:
+        """
+        Return the file exported as `mime_type`, exporting only when it changed.
+
+        parameters:
+            drive_service: The Google Drive API service.
+            file_id (str): The Drive file ID.
+            mime_type (str): The export MIME type, e.g. "text/markdown".
+
+        returns:
+            bytes: The exported content.
+
+        example:
+            await drive_export_cache.export(drive_service, doc_id, "text/markdown")
+        """
+        key = (file_id, mime_type)
+        entry = self._entries.get(key)
+        if entry is not None and self._is_fresh(entry):
+            logger.debug(f"Serving cached export of {file_id}")
+            return entry.content
+
+        # One export per file at a time; concurrent readers wait for it
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            entry = self._entries.get(key)
+            if entry is not None and self._is_fresh(entry):
+                return entry.content
+
+            try:
+                revision = await self._get_revision(drive_service, file_id)
+            except HttpError as e:
+                if entry is None:
+                    raise
+                logger.warning(f"Serving stale export of {file_id}: {e}")
+                return entry.content
+
+            if entry is not None and entry.revision == revision:
+                logger.debug(f"Export of {file_id} is unchanged")
+                self._entries[key] = entry._replace(checked_at=time.monotonic())
+                return entry.content
+
+            logger.info(f"Exporting Drive file {file_id} as {mime_type}")
+            content = await execute_request(
+                drive_service.files().export(fileId=file_id, mimeType=mime_type)
+            )
+            self._entries[key] = _CachedExport(content, revision, time.monotonic())
+            return content
+
+    def clear(self) -> None:
+        """Drop every cached export."""
+        self._entries.clear()
+        self._locks.clear()
+
+    def _is_fresh(self, entry: _CachedExport) -> bool:
+        return time.monotonic() - entry.checked_at < self.ttl_seconds
+
+    async def _get_revision(self, drive_service, file_id: str):
+        # Taken before exporting so the stored revision is never newer than
+        # the content it describes
+        metadata = await execute_request(
+            drive_service.files().get(fileId=file_id, fields=REVISION_FIELDS)
+        )
+        return (metadata.get("version"), metadata.get("modifiedTime"))
+
+
+drive_export_cache = DriveExportCache()
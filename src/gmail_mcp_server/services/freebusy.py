@@ -0,0 +1,184 @@
+"""
+Free/busy queries split into groups of calendars and windows of time.
+
+A single `freebusy.query` accepts a limited number of calendars and time span,
+so wide ranges or accounts with many calendars fail or slow down. Queries are
+planned as groups of at most `freebusy_max_calendars` calendars and windows of
+at most `freebusy_max_window_days` days, run concurrently on the request
+executor, and the busy intervals are merged back into one result per calendar.
+
+Reference: https://developers.google.com/workspace/calendar/api/v3/reference/freebusy/query
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from logging import getLogger
+from typing import Sequence
+
+from ..configs import configs
+from .freebusy_cache import freebusy_cache, to_rfc3339
+from .request_executor import execute_request
+
+FREEBUSY_MAX_CALENDARS = min(configs.get("freebusy_max_calendars", 50), 50)
+FREEBUSY_MAX_WINDOW_DAYS = configs.get("freebusy_max_window_days", 60)
+
+logger = getLogger(__name__)
+
+
+async def query_freebusy(
+    calendar_service,
+    calendar_ids: Sequence[str],
+    time_min: str,
+    time_max: str,
+) -> dict[str, dict]:
+    """
+    Query free/busy information for any number of calendars and any range.
+
+    Ranges already held in the free/busy cache are answered locally; only the
+    gaps in each calendar's cached coverage are queried.
+
+    parameters:
+        calendar_service: The Google Calendar API service.
+        calendar_ids: The calendars to query.
+        time_min (str): Start of the range in RFC 3339 format.
+        time_max (str): End of the range in RFC 3339 format.
+
+    returns:
+        dict[str, dict]: Per-calendar results shaped like the API's
+        `calendars` field, with busy intervals sorted and merged.
+
+    example:
+        await query_freebusy(calendar_service, ["primary"], "2025-01-01T00:00:00Z", "2025-06-01T00:00:00Z")
+    """
+    if not calendar_ids:
+        return {}
+
+    try:
+        start = datetime.fromisoformat(time_min)
+        end = datetime.fromisoformat(time_max)
+        if start.tzinfo is None or end.tzinfo is None or start >= end:
+            raise ValueError("not an absolute, non-empty range")
+    except (TypeError, ValueError):
+        # Leave anything unparseable for the API to accept or reject, uncached
+        responses = await _run_queries(
+            calendar_service,
+            [(group, time_min, time_max) for group in _groups(calendar_ids)],
+        )
+        return _merge_responses({}, responses)
+
+    # Calendars missing the same gaps share queries
+    calendars: dict[str, dict] = {}
+    gaps_by_calendars: dict[tuple, list[str]] = {}
+    for calendar_id in calendar_ids:
+        calendars[calendar_id] = {
+            "busy": freebusy_cache.get_busy(calendar_id, start, end)
+        }
+        gaps = tuple(freebusy_cache.missing(calendar_id, start, end))
+        if gaps:
+            gaps_by_calendars.setdefault(gaps, []).append(calendar_id)
+
+    queries = [
+        (group, window_min, window_max)
+        for gaps, missing_ids in gaps_by_calendars.items()
+        for gap_start, gap_end in gaps
+        for window_min, window_max in _split_time_range(gap_start, gap_end)
+        for group in _groups(missing_ids)
+    ]
+    logger.info(
+        f"Answered {len(calendar_ids) - sum(map(len, gaps_by_calendars.values()))} "
+        f"of {len(calendar_ids)} calendar(s) from cache; sending "
+        f"{len(queries)} free/busy query(ies)"
+    )
+    responses = await _run_queries(
+        calendar_service,
+        [
+            (group, to_rfc3339(window_min), to_rfc3339(window_max))
+            for group, window_min, window_max in queries
+        ],
+    )
+
+    for (_, window_min, window_max), response in zip(queries, responses):
+        for calendar_id, data in response.get("calendars", {}).items():
+            if not data.get("errors"):
+                freebusy_cache.put(
+                    calendar_id, window_min, window_max, data.get("busy", [])
+                )
+    return _merge_responses(calendars, responses)
+
+
+def _groups(calendar_ids: Sequence[str]) -> list[list[str]]:
+    return [
+        list(calendar_ids[start : start + FREEBUSY_MAX_CALENDARS])
+        for start in range(0, len(calendar_ids), FREEBUSY_MAX_CALENDARS)
+    ]
+
+
+async def _run_queries(calendar_service, queries) -> list[dict]:
+    """Send (calendar group, timeMin, timeMax) queries concurrently."""
+    return await asyncio.gather(
+        *(
+            execute_request(
+                calendar_service.freebusy().query(
+                    body={
+                        "timeMin": window_min,
+                        "timeMax": window_max,
+                        "items": [{"id": calendar_id} for calendar_id in group],
+                    }
+                )
+            )
+            for group, window_min, window_max in queries
+        )
+    )
+
+
+def _merge_responses(
+    calendars: dict[str, dict], responses: list[dict]
+) -> dict[str, dict]:
+    """Add each response's busy periods and errors to the per-calendar results."""
+    for response in responses:
+        for calendar_id, data in response.get("calendars", {}).items():
+            merged = calendars.setdefault(calendar_id, {"busy": []})
+            merged["busy"].extend(data.get("busy", []))
+            if data.get("errors"):
+                merged.setdefault("errors", []).extend(data["errors"])
+
+    for data in calendars.values():
+        data["busy"] = _merge_busy_periods(data["busy"])
+    return calendars
+
+
+def _split_time_range(
+    start: datetime, end: datetime
+) -> list[tuple[datetime, datetime]]:
+    """Split a range into consecutive windows no longer than the maximum."""
+    max_window = timedelta(days=FREEBUSY_MAX_WINDOW_DAYS)
+    windows = []
+    while start < end:
+        window_end = min(start + max_window, end)
+        windows.append((start, window_end))
+        start = window_end
+    return windows
+
+
+def _merge_busy_periods(periods: list[dict]) -> list[dict]:
+    """Sort busy periods and join those that overlap or touch."""
+    try:
+        timed = [
+            (datetime.fromisoformat(p["start"]), datetime.fromisoformat(p["end"]), p)
+            for p in periods
+        ]
+    except (KeyError, TypeError, ValueError):
+        return periods
+    timed.sort(key=lambda item: item[0])
+
+    merged: list[dict] = []
+    merged_end = None
+    for start, end, period in timed:
+        if merged and start <= merged_end:
+            if end > merged_end:
+                merged_end = end
+                merged[-1] = {**merged[-1], "end": period["end"]}
+        else:
+            merged.append(period)
+            merged_end = end
+    return merged
@@ -0,0 +1,143 @@
+"""
+Interval cache of free/busy results per calendar.
+
+Scheduling flows often read overlapping availability ranges in a row. For each
+calendar the cache remembers which time ranges have been queried (coverage)
+and the busy periods found in them, for `freebusy_cache_ttl_seconds`. A
+request inside fresh coverage is answered locally; otherwise only the gaps in
+coverage need to be queried.
+"""
+
+import time
+from datetime import datetime
+from logging import getLogger
+from typing import NamedTuple
+
+from ..configs import configs
+
+FREEBUSY_CACHE_TTL_SECONDS = configs.get("freebusy_cache_ttl_seconds", 120)
+
+logger = getLogger(__name__)
+
+# A busy period as (start, end, API representation)
+_Busy = tuple[datetime, datetime, dict]
+
+
+class _Segment(NamedTuple):
+    start: datetime
+    end: datetime
+    busy: list[_Busy]
+    fetched_at: float
+
+
+class FreeBusyCache:
+    """Per-calendar coverage segments with the busy periods inside them."""
+
+    def __init__(self, ttl_seconds: float = FREEBUSY_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        # Sorted, non-overlapping segments per calendar ID
+        self._segments: dict[str, list[_Segment]] = {}
+
+    def missing(
+        self, calendar_id: str, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        """Return the parts of [start, end) not covered by fresh cached data."""
+        gaps = []
+        cursor = start
+        for segment in self._fresh_segments(calendar_id):
+            if segment.end <= cursor:
+                continue
+            if segment.start >= end:
+                break
+            if segment.start > cursor:
+                gaps.append((cursor, segment.start))
+            cursor = max(cursor, segment.end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def get_busy(self, calendar_id: str, start: datetime, end: datetime) -> list[dict]:
+        """Return cached busy periods within [start, end), clipped to it."""
+        periods = []
+        for segment in self._fresh_segments(calendar_id):
+            if segment.end <= start or segment.start >= end:
+                continue
+            periods.extend(period for _, _, period in _clip(segment.busy, start, end))
+        return periods
+
+    def put(
+        self, calendar_id: str, start: datetime, end: datetime, busy: list[dict]
+    ) -> None:
+        """Record that [start, end) was queried and had the given busy periods."""
+        if self.ttl_seconds <= 0:
+            return
+        try:
+            parsed = [
+                (
+                    datetime.fromisoformat(period["start"]),
+                    datetime.fromisoformat(period["end"]),
+                    period,
+                )
+                for period in busy
+            ]
+        except (KeyError, TypeError, ValueError):
+            logger.debug(f"Not caching unparseable busy periods for {calendar_id}")
+            return
+
+        # Newer data replaces whatever older segments said about the range
+        segments = []
+        for segment in self._fresh_segments(calendar_id):
+            if segment.end <= start or segment.start >= end:
+                segments.append(segment)
+                continue
+            if segment.start < start:
+                segments.append(
+                    segment._replace(
+                        end=start, busy=_clip(segment.busy, segment.start, start)
+                    )
+                )
+            if segment.end > end:
+                segments.append(
+                    segment._replace(
+                        start=end, busy=_clip(segment.busy, end, segment.end)
+                    )
+                )
+        segments.append(_Segment(start, end, parsed, time.monotonic()))
+        segments.sort(key=lambda segment: segment.start)
+        self._segments[calendar_id] = segments
+
+    def clear(self) -> None:
+        """Drop every cached segment."""
+        self._segments.clear()
+
+    def _fresh_segments(self, calendar_id: str) -> list[_Segment]:
+        segments = self._segments.get(calendar_id, [])
+        now = time.monotonic()
+        fresh = [s for s in segments if now - s.fetched_at < self.ttl_seconds]
+        if len(fresh) != len(segments):
+            self._segments[calendar_id] = fresh
+        return fresh
+
+
+def _clip(busy: list[_Busy], start: datetime, end: datetime) -> list[_Busy]:
+    """Restrict busy periods to [start, end), as the API does for timeMin/timeMax."""
+    clipped = []
+    for busy_start, busy_end, period in busy:
+        if busy_end <= start or busy_start >= end:
+            continue
+        if busy_start < start:
+            busy_start = start
+            period = {**period, "start": to_rfc3339(start)}
+        if busy_end > end:
+            busy_end = end
+            period = {**period, "end": to_rfc3339(end)}
+        clipped.append((busy_start, busy_end, period))
+    return clipped
+
+
+def to_rfc3339(value: datetime) -> str:
+    """Format a datetime the way the Calendar API does, with Z for UTC."""
+    return value.isoformat().replace("+00:00", "Z")
+
+
+freebusy_cache = FreeBusyCache()
@@ -0,0 +1,97 @@
+"""
+Partial-response field masks for Gmail API calls.
+
+By default `messages.get` and `threads.get` return every header, every MIME
+part's headers and attachment metadata. Passing a `fields=` mask (any call) or
+`format="metadata"` with `metadataHeaders` (get calls) makes Gmail return only
+what is asked for, which shrinks responses and JSON parse time considerably on
+HTML-heavy mail.
+
+Reference: https://developers.google.com/workspace/gmail/api/guides/performance#partial-response
+"""
+
+from typing import Optional, Sequence
+
+# Fields masks cannot recurse, so nested MIME parts are spelled out to a fixed
+# depth; anything deeper is returned whole.
+MAX_PART_DEPTH = 4
+
+
+def part_fields(fields: str, depth: int = MAX_PART_DEPTH) -> str:
+    """
+    Build a mask selecting `fields` on a MIME part and its nested parts.
+
+    example:
+        part_fields("mimeType,body/data", 2)
+        # "mimeType,body/data,parts(mimeType,body/data,parts)"
+    """
+    mask = "parts"
+    for _ in range(depth):
+        mask = f"parts({fields},{mask})"
+    return mask[len("parts(") : -1]
+
+
+# messages.list: only the IDs are used; messages are fetched separately
+MESSAGE_LIST_FIELDS = "messages(id,threadId),nextPageToken"
+
+# history.list: the message ID and its current labels for each change, and
+# the labels a labelsAdded change added
+_HISTORY_MESSAGE = "message(id,threadId,labelIds)"
+HISTORY_FIELDS = (
+    f"history(id,messagesAdded/{_HISTORY_MESSAGE},messagesDeleted/message/id,"
+    f"labelsAdded(labelIds,{_HISTORY_MESSAGE}),labelsRemoved/{_HISTORY_MESSAGE}),"
+    "historyId,nextPageToken"
+)
+
+# messages.get: what format_email_for_display renders (top-level headers and
+# text bodies), plus the bookkeeping kept alongside cached messages. Part
+# headers, filenames and attachment IDs are left out.
+MESSAGE_DISPLAY_FIELDS = (
+    "id,threadId,historyId,labelIds,snippet,internalDate,"
+    f"payload(headers,{part_fields('mimeType,body/data')})"
+)
+
+# messages.get with format="metadata": the triage line of get_unread_emails,
+# at a fraction of the size of a full message
+TRIAGE_HEADERS = ("From", "Subject", "Date")
+MESSAGE_TRIAGE_FIELDS = "id,threadId,labelIds,snippet,internalDate,payload/headers"
+
+# threads.get: just the message IDs; bodies come from the message cache
+THREAD_MESSAGE_IDS_FIELDS = "id,messages/id"
+
+# labels.list: which labels exist; their counts need a labels.get each
+LABEL_LIST_FIELDS = "labels(id,name,type)"
+LABEL_STATS_FIELDS = (
+    "id,name,type,messagesTotal,messagesUnread,threadsTotal,threadsUnread"
+)
+
+# threads.get: every message as messages.get returns it with the masks above
+THREAD_DISPLAY_FIELDS = f"id,messages({MESSAGE_DISPLAY_FIELDS})"
+THREAD_TRIAGE_FIELDS = f"id,messages({MESSAGE_TRIAGE_FIELDS})"
+
+
+def metadata_params(
+    headers: Sequence[str], fields: Optional[str] = None
+) -> dict[str, object]:
+    """
+    Keyword arguments for a get call that returns only the named headers.
+
+    parameters:
+        headers: Header names to return, e.g. ["Subject", "From"].
+        fields (str): An optional partial-response mask.
+
+    returns:
+        dict: `format`, `metadataHeaders` and, if given, `fields`.
+
+    example:
+        gmail_service.users().threads().get(
+            userId="me", id=thread_id, **metadata_params(["Subject"])
+        )
+    """
+    params: dict[str, object] = {
+        "format": "metadata",
+        "metadataHeaders": list(headers),
+    }
+    if fields:
+        params["fields"] = fields
+    return params
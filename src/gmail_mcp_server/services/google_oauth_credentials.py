@@ -1,5 +1,12 @@
+import asyncio
+import os
 import os.path
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
 from logging import getLogger
+from pathlib import Path
+from typing import Optional
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -10,38 +17,223 @@ from ..configs import configs
 SCOPES = configs.get("google_scopes")
 CLIENT_SECRETS_FILE = configs.get("client_secrets_file")
 TOKEN_FILE = configs.get("token_file")
+TOKEN_REFRESH_MARGIN_SECONDS = configs.get("token_refresh_margin_seconds", 300)
+# Local port the OAuth consent flow redirects to; must differ from the HTTP
+# transport's port
+OAUTH_CALLBACK_PORT = configs.get("oauth_callback_port", 8100)
+REFRESH_RETRY_SECONDS = 60
 
 
 logger = getLogger(__name__)
 
 
+class GoogleOAuthCredentialsManager:
+    """
+    Keeps Google OAuth credentials in memory and refreshes them ahead of expiry.
+
+    Credentials are loaded from the token file once. When an event loop is
+    running, a timer refreshes them `refresh_margin` before they expire so tool
+    calls never wait on a token refresh. Concurrent refresh requests share a
+    single in-flight refresh, and the token file is only rewritten (atomically)
+    when the token actually changed.
+    """
+
+    def __init__(
+        self,
+        token_file=TOKEN_FILE,
+        client_secrets_file=CLIENT_SECRETS_FILE,
+        scopes=SCOPES,
+        refresh_margin: timedelta = timedelta(seconds=TOKEN_REFRESH_MARGIN_SECONDS),
+    ):
+        self.token_file = token_file
+        self.client_secrets_file = client_secrets_file
+        self.scopes = scopes
+        self.refresh_margin = refresh_margin
+
+        self._credentials: Optional[Credentials] = None
+        self._persisted_token_json: Optional[str] = None
+        self._lock = threading.RLock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_timer: Optional[asyncio.TimerHandle] = None
+        self._inflight_refresh: Optional[asyncio.Future] = None
+
+    def get_credentials(self) -> Credentials:
+        """
+        Return valid credentials, loading or refreshing them only when needed.
+        """
+        with self._lock:
+            if self._credentials is None:
+                self._credentials = self._load_credentials()
+            if not self._credentials.valid:
+                self._refresh_credentials()
+            credentials = self._credentials
+
+        self._schedule_refresh()
+        return credentials
+
+    async def start(self) -> None:
+        """
+        Load stored credentials off the event loop and start the refresh timer.
+
+        No OAuth flow is started here; without a token file the first tool call
+        still runs the interactive flow.
+        """
+        self._loop = asyncio.get_running_loop()
+        if self._credentials is None and not os.path.exists(self.token_file):
+            logger.info("No stored credentials found, skipping preload.")
+            return
+        await asyncio.to_thread(self.get_credentials)
+
+    async def refresh(self) -> Credentials:
+        """
+        Refresh the credentials, sharing one in-flight refresh between callers.
+        """
+        if self._inflight_refresh is None or self._inflight_refresh.done():
+            self._inflight_refresh = asyncio.ensure_future(
+                asyncio.to_thread(self._refresh_if_due)
+            )
+        credentials = await asyncio.shield(self._inflight_refresh)
+        self._schedule_refresh()
+        return credentials
+
+    def stop(self) -> None:
+        """Cancel the background refresh timer."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    def reset(self) -> None:
+        """Forget the in-memory credentials so they are reloaded on next use."""
+        self.stop()
+        with self._lock:
+            self._credentials = None
+            self._persisted_token_json = None
+        self._inflight_refresh = None
+        self._loop = None
+
+    def _load_credentials(self) -> Credentials:
+        logger.info("Getting google oauth credentials...")
+        creds = None
+        # First check if there are valid credentials available
+        if os.path.exists(self.token_file):
+            logger.info("Loading existing credentials from file.")
+            creds = Credentials.from_authorized_user_file(self.token_file, self.scopes)
+            self._persisted_token_json = creds.to_json()
+        if creds and (creds.valid or (creds.expired and creds.refresh_token)):
+            return creds
+
+        # If there are no (valid) credentials available, let the user log in.
+        logger.info("Requesting new credentials google. Initializing OAuth flow.")
+        flow = InstalledAppFlow.from_client_secrets_file(
+            self.client_secrets_file, self.scopes
+        )
+        creds = flow.run_local_server(
+            port=OAUTH_CALLBACK_PORT,
+            success_message="Successfully authorized! You can now close this window.",
+        )
+        self._save_credentials(creds)
+        return creds
+
+    def _refresh_credentials(self) -> None:
+        logger.info("Refreshing existing credentials.")
+        assert self._credentials is not None
+        self._credentials.refresh(Request())
+        self._save_credentials(self._credentials)
+
+    def _refresh_if_due(self) -> Credentials:
+        with self._lock:
+            if self._credentials is None:
+                self._credentials = self._load_credentials()
+            # Another caller may have refreshed while this one was waiting
+            if self._is_refresh_due(self._credentials):
+                self._refresh_credentials()
+            return self._credentials
+
+    def _is_refresh_due(self, creds: Credentials) -> bool:
+        if not creds.valid:
+            return True
+        expiry = creds.expiry
+        if not isinstance(expiry, datetime):
+            return False
+        return expiry - self.refresh_margin <= _utcnow()
+
+    def _save_credentials(self, creds: Credentials) -> None:
+        token_json = creds.to_json()
+        if token_json == self._persisted_token_json:
+            logger.debug("Credentials unchanged, not rewriting token file.")
+            return
+
+        logger.info("Saving credentials to file.")
+        token_path = Path(self.token_file)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=token_path.parent, prefix=f".{token_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as token:
+                token.write(token_json)
+                token.flush()
+                os.fsync(token.fileno())
+            os.replace(tmp_path, token_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._persisted_token_json = token_json
+
+    def _schedule_refresh(self) -> None:
+        """Arm the refresh timer for `refresh_margin` before the token expires."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = self._loop
+            if loop is None or loop.is_closed():
+                return
+            # Called from a worker thread, hop back onto the loop
+            loop.call_soon_threadsafe(self._schedule_refresh_on_loop, loop)
+            return
+        self._schedule_refresh_on_loop(loop)
+
+    def _schedule_refresh_on_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        creds = self._credentials
+        if creds is None or not isinstance(creds.expiry, datetime):
+            return
+
+        delay = (creds.expiry - self.refresh_margin - _utcnow()).total_seconds()
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        self._refresh_timer = loop.call_later(
+            max(delay, 0), self._on_refresh_timer, loop
+        )
+        logger.debug(f"Next credentials refresh in {max(delay, 0):.0f}s")
+
+    def _on_refresh_timer(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._refresh_timer = None
+        task = loop.create_task(self.refresh())
+        task.add_done_callback(self._on_refresh_done)
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.error(f"Background credentials refresh failed: {task.exception()}")
+        # Back off instead of re-arming immediately against a stale expiry
+        loop = task.get_loop()
+        self._refresh_timer = loop.call_later(
+            REFRESH_RETRY_SECONDS, self._on_refresh_timer, loop
+        )
+
+
+def _utcnow() -> datetime:
+    # google-auth stores expiry as a naive UTC datetime
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+google_oauth_credentials_manager = GoogleOAuthCredentialsManager()
+
+
 def get_google_oauth_credentials():
     """
     Get or refresh Google OAuth credentials.
     Reference: https://developers.google.com/workspace/gmail/api/quickstart/python
     """
-    logger.info("Getting google oauth credentials...")
-    creds = None
-    # First check if there are valid credentials available
-    if os.path.exists(TOKEN_FILE):
-        logger.info("Loading existing credentials from file.")
-        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
-    # If there are no (valid) credentials available, let the user log in.
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            logger.info("Refreshing existing credentials.")
-            creds.refresh(Request())
-        else:
-            logger.info("Requesting new credentials google. Initializing OAuth flow.")
-            flow = InstalledAppFlow.from_client_secrets_file(
-                CLIENT_SECRETS_FILE, SCOPES
-            )
-            creds = flow.run_local_server(
-                port=8100,
-                success_message="Successfully authorized! You can now close this window.",
-            )
-        # Save the credentials for the next run
-        logger.info("Saving credentials to file.")
-        with open(TOKEN_FILE, "w") as token:
-            token.write(creds.to_json())
-    return creds
+    return google_oauth_credentials_manager.get_credentials()
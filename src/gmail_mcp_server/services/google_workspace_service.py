@@ -7,7 +7,9 @@ Returns:
 Reference: https://developers.google.com/workspace/gmail/api/quickstart/python
 """
 
+import threading
 from logging import getLogger
+from typing import Any, NamedTuple
 
 from googleapiclient.discovery import build
 
@@ -23,16 +25,69 @@ logger = getLogger(__name__)
 logger.info("Scopes: %s", SCOPES)
 
 
+class _CachedService(NamedTuple):
+    service: Any
+    credentials: Any
+    scopes: tuple[str, ...]
+
+
+class GoogleWorkspaceServiceRegistry:
+    """
+    Process-wide registry of Google API service clients.
+
+    Each (api_name, api_version) client is built once with a shared credentials
+    object and reused until the configured scopes or the credentials change.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._services: dict[tuple[str, str], _CachedService] = {}
+        self._credentials = None
+
+    def get_service(self, api_name: str, api_version: str):
+        with self._lock:
+            credentials = self._get_credentials()
+            scopes = tuple(configs.get("google_scopes") or ())
+            cached = self._services.get((api_name, api_version))
+
+            if (
+                cached is not None
+                and cached.credentials is credentials
+                and cached.scopes == scopes
+            ):
+                return cached.service
+
+            logger.info(f"Building {api_name} {api_version} api service...")
+            service = build(api_name, api_version, credentials=credentials)
+            self._services[(api_name, api_version)] = _CachedService(
+                service, credentials, scopes
+            )
+            return service
+
+    def clear(self) -> None:
+        """Drop all cached clients and credentials so the next call rebuilds them."""
+        with self._lock:
+            self._services.clear()
+            self._credentials = None
+
+    def _get_credentials(self):
+        # Only go back to the credentials store when the shared object can no
+        # longer be used as-is.
+        if self._credentials is None or not self._credentials.valid:
+            self._credentials = get_google_oauth_credentials()
+        return self._credentials
+
+
+google_service_registry = GoogleWorkspaceServiceRegistry()
+
+
 def get_gmail_api_service():
-    logger.info("Building gmail api service...")
-    return build("gmail", "v1", credentials=get_google_oauth_credentials())
+    return google_service_registry.get_service("gmail", "v1")
 
 
 def get_google_drive_api_service():
-    logger.info("Building google drive api service...")
-    return build("drive", "v3", credentials=get_google_oauth_credentials())
+    return google_service_registry.get_service("drive", "v3")
 
 
 def get_google_calendar_api_service():
-    logger.info("Building google calendar api service...")
-    return build("calendar", "v3", credentials=get_google_oauth_credentials())
+    return google_service_registry.get_service("calendar", "v3")
@@ -0,0 +1,104 @@
+"""
+Cached per-label message and thread counts.
+
+Gmail keeps `messagesUnread`, `threadsUnread` and the matching totals on every
+label, so "how many unread, and where" costs one `labels.list` plus one
+`labels.get` per label (one quota unit each, sent as a single batch) instead
+of downloading messages. The counts are kept for
+`label_stats_cache_ttl_seconds`, so polling clients share one refresh.
+
+Reference: https://developers.google.com/workspace/gmail/api/reference/rest/v1/users.labels
+"""
+
+import asyncio
+import time
+from logging import getLogger
+from typing import Optional
+
+from googleapiclient.errors import HttpError
+
+from ..configs import configs
+from .batch_request import execute_batch
+from .gmail_fields import LABEL_LIST_FIELDS, LABEL_STATS_FIELDS
+from .request_executor import execute_request
+
+LABEL_STATS_CACHE_TTL_SECONDS = configs.get("label_stats_cache_ttl_seconds", 60)
+
+logger = getLogger(__name__)
+
+
+class LabelStatsCache:
+    """Label counts from labels.get, refreshed at most once per TTL."""
+
+    def __init__(self, ttl_seconds: float = LABEL_STATS_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._labels: list[dict] = []
+        self._refreshed_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def get_label_stats(self, gmail_service) -> list[dict]:
+        """
+        Return every label with its message and thread counts.
+
+        The list is replaced, never modified, on refresh, so callers may keep
+        using one they already hold.
+
+        parameters:
+            gmail_service: The Gmail API service.
+
+        returns:
+            list[dict]: labels.get resources with `id`, `name`, `type`,
+                `messagesTotal`, `messagesUnread`, `threadsTotal` and
+                `threadsUnread`, in labels.list order.
+
+        example:
+            labels = await label_stats_cache.get_label_stats(gmail_service)
+        """
+        if self._is_fresh():
+            return self._labels
+
+        async with self._lock:
+            if not self._is_fresh():
+                await self._refresh(gmail_service)
+            return self._labels
+
+    def clear(self) -> None:
+        """Forget the cached counts."""
+        self._labels = []
+        self._refreshed_at = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at < self.ttl_seconds
+        )
+
+    async def _refresh(self, gmail_service) -> None:
+        labels = gmail_service.users().labels()
+        response = await execute_request(
+            labels.list(userId="me", fields=LABEL_LIST_FIELDS)
+        )
+        label_ids = [label["id"] for label in response.get("labels", [])]
+
+        requests = [
+            labels.get(userId="me", id=label_id, fields=LABEL_STATS_FIELDS)
+            for label_id in label_ids
+        ]
+        stats = []
+        for result in await execute_batch(
+            gmail_service, requests, return_exceptions=True
+        ):
+            if isinstance(result, HttpError) and result.resp.status == 404:
+                # Deleted between listing and fetching
+                continue
+            if isinstance(result, Exception):
+                raise result
+            stats.append(result)
+
+        logger.info(f"Label stats cache holds {len(stats)} label(s)")
+        self._labels = stats
+        self._refreshed_at = time.monotonic()
+
+
+label_stats_cache = LabelStatsCache()
@@ -0,0 +1,281 @@
+"""
+Incremental sync of the unread message index using users.history.list.
+
+The first request lists the UNREAD label in full, page by page, and records
+the mailbox `historyId` taken just before listing. Later requests replay only
+the changes since that `historyId` (messages added or deleted, UNREAD added or
+removed) onto the in-memory index, so polling costs O(changes) instead of
+O(mailbox). When Gmail no longer has the requested history (HTTP 404), or the
+index does not reach deep enough for the requested limit, it falls back to a
+full resync. Label changes and deletions are also written to the message
+cache, one batch per history page on a worker thread.
+
+The index is kept in Gmail's date order, newest last. New mail is appended.
+A message that becomes unread again (marked unread, untrashed) is older than
+its position at the end would suggest, and history records carry no
+`internalDate` to place it by, so it triggers a full resync instead. The
+listing comes back in date order.
+
+Reference: https://developers.google.com/workspace/gmail/api/guides/sync
+"""
+
+import asyncio
+from itertools import islice
+from logging import getLogger
+from typing import AsyncIterator, Optional
+
+from googleapiclient.errors import HttpError
+
+from ..configs import configs
+from .gmail_fields import HISTORY_FIELDS, MESSAGE_LIST_FIELDS
+from .message_cache import message_cache
+from .request_executor import execute_request
+
+# messages.list returns at most 500 IDs per page
+MAX_LIST_PAGE_SIZE = 500
+LIST_PAGE_SIZE = min(configs.get("list_page_size", 100), MAX_LIST_PAGE_SIZE)
+HISTORY_PAGE_SIZE = 500
+
+# Labels that hide a message from messages.list unless includeSpamTrash is set
+HIDDEN_LABELS = {"SPAM", "TRASH"}
+
+logger = getLogger(__name__)
+
+
+class UnreadMailboxSync:
+    """In-memory index of unread message IDs kept current from mailbox history."""
+
+    def __init__(self):
+        self._history_id: Optional[str] = None
+        # Message ID to thread ID, oldest first, so newly unread messages are
+        # appended
+        self._unread: dict[str, Optional[str]] = {}
+        self._complete = False
+        # Set when a change would put the index out of date order
+        self._misordered = False
+        self._lock = asyncio.Lock()
+
+    async def iter_unread_message_id_pages(
+        self, gmail_service, limit: int
+    ) -> AsyncIterator[list[str]]:
+        """
+        Yield pages of up to `limit` unread message IDs, newest first.
+
+        parameters:
+            gmail_service: The Gmail API service.
+            limit (int): The maximum number of message IDs to yield.
+
+        yields:
+            list[str]: Message IDs, at most `list_page_size` per page.
+        """
+        async for page in self.iter_unread_message_pages(gmail_service, limit):
+            yield list(page)
+
+    async def iter_unread_message_pages(
+        self, gmail_service, limit: int
+    ) -> AsyncIterator[dict[str, Optional[str]]]:
+        """
+        Yield pages of up to `limit` unread messages, newest first.
+
+        parameters:
+            gmail_service: The Gmail API service.
+            limit (int): The maximum number of messages to yield.
+
+        yields:
+            dict[str, str | None]: Message ID to thread ID, at most
+                `list_page_size` per page. The thread ID is None if Gmail did
+                not report it.
+        """
+        if await self._sync_from_history(gmail_service, limit):
+            messages = list(islice(reversed(self._unread.items()), limit))
+            logger.info(f"Serving {len(messages)} unread ID(s) from sync index")
+            for start in range(0, len(messages), LIST_PAGE_SIZE):
+                yield dict(messages[start : start + LIST_PAGE_SIZE])
+            return
+
+        async for page in self._full_resync(gmail_service, limit):
+            yield page
+
+    def reset(self) -> None:
+        """Forget the index so the next request performs a full resync."""
+        self._history_id = None
+        self._unread = {}
+        self._complete = False
+        self._misordered = False
+        self._lock = asyncio.Lock()
+
+    async def _sync_from_history(self, gmail_service, limit: int) -> bool:
+        """Apply changes since the last historyId; False if a resync is needed."""
+        async with self._lock:
+            if self._history_id is None:
+                return False
+
+            try:
+                await self._apply_history(gmail_service)
+            except HttpError as e:
+                if e.resp.status != 404:
+                    raise
+                logger.info("Mailbox history expired, falling back to full resync")
+                self._history_id = None
+                self._unread = {}
+                self._complete = False
+                return False
+
+            if self._misordered:
+                logger.info("Older message became unread, falling back to full resync")
+                self._history_id = None
+                self._unread = {}
+                self._complete = False
+                self._misordered = False
+                return False
+
+            return self._complete or len(self._unread) >= limit
+
+    async def _apply_history(self, gmail_service) -> None:
+        page_token = None
+        changes = 0
+        while True:
+            params = {
+                "userId": "me",
+                "startHistoryId": self._history_id,
+                "maxResults": HISTORY_PAGE_SIZE,
+                "fields": HISTORY_FIELDS,
+            }
+            if page_token:
+                params["pageToken"] = page_token
+            response = await execute_request(
+                gmail_service.users().history().list(**params)
+            )
+
+            cache_updates: list[tuple[str, Optional[list[str]], Optional[str]]] = []
+            for record in response.get("history", []):
+                changes += self._apply_history_record(record, cache_updates)
+            if cache_updates and message_cache.enabled:
+                await asyncio.to_thread(_update_message_cache, cache_updates)
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                self._history_id = response.get("historyId", self._history_id)
+                break
+
+        logger.info(f"Applied {changes} mailbox change(s) since last sync")
+
+    def _apply_history_record(
+        self,
+        record: dict,
+        cache_updates: list[tuple[str, Optional[list[str]], Optional[str]]],
+    ) -> int:
+        """
+        Apply one history record to the index.
+
+        Changes for the message cache are appended to `cache_updates` as
+        (message ID, label IDs or None if deleted, history ID), to be written
+        off the event loop.
+        """
+        changes = 0
+        for deleted in record.get("messagesDeleted", []):
+            message_id = deleted["message"]["id"]
+            self._unread.pop(message_id, None)
+            cache_updates.append((message_id, None, None))
+            changes += 1
+
+        for key in ("messagesAdded", "labelsAdded", "labelsRemoved"):
+            for change in record.get(key, []):
+                message = change["message"]
+                label_ids = message.get("labelIds", [])
+                if key != "messagesAdded":
+                    cache_updates.append((message["id"], label_ids, record.get("id")))
+                if "UNREAD" in label_ids and not HIDDEN_LABELS & set(label_ids):
+                    if key == "messagesAdded" or message["id"] in self._unread:
+                        self._unread.setdefault(message["id"], message.get("threadId"))
+                    elif self._complete or (
+                        key == "labelsAdded" and "UNREAD" in change.get("labelIds", [])
+                    ):
+                        # Not new mail, so appending would rank it newest
+                        self._misordered = True
+                    # Otherwise it is an unread message past the end of a
+                    # partial index, and stays out of it
+                else:
+                    self._unread.pop(message["id"], None)
+                changes += 1
+        return changes
+
+    async def _full_resync(
+        self, gmail_service, limit: int
+    ) -> AsyncIterator[dict[str, Optional[str]]]:
+        """
+        List the UNREAD label from scratch, yielding pages as they arrive.
+
+        The request for the following page is sent before the current page is
+        handed to the caller, so listing overlaps with message retrieval.
+        """
+        logger.info("Performing full unread mailbox sync")
+        # Take the history cursor first so changes made while listing are
+        # replayed on the next sync rather than lost.
+        profile = await execute_request(gmail_service.users().getProfile(userId="me"))
+        history_id = profile.get("historyId")
+
+        listed: dict[str, Optional[str]] = {}
+        remaining = limit
+        complete = False
+        next_request: Optional[asyncio.Future] = asyncio.ensure_future(
+            _list_unread_page(gmail_service, min(remaining, LIST_PAGE_SIZE))
+        )
+        try:
+            while next_request is not None:
+                response = await next_request
+                next_request = None
+
+                messages = {
+                    m["id"]: m.get("threadId")
+                    for m in response.get("messages", [])[:remaining]
+                }
+                remaining -= len(messages)
+                listed.update(messages)
+
+                page_token = response.get("nextPageToken")
+                complete = not page_token
+                if page_token and remaining > 0:
+                    next_request = asyncio.ensure_future(
+                        _list_unread_page(
+                            gmail_service, min(remaining, LIST_PAGE_SIZE), page_token
+                        )
+                    )
+
+                if messages:
+                    yield messages
+        finally:
+            if next_request is not None:
+                next_request.cancel()
+
+        async with self._lock:
+            self._unread = dict(reversed(listed.items()))
+            self._complete = complete
+            self._history_id = history_id
+
+
+def _update_message_cache(
+    updates: list[tuple[str, Optional[list[str]], Optional[str]]],
+) -> None:
+    """Write label changes and deletions to the message cache, in history order"""
+    for message_id, label_ids, history_id in updates:
+        if label_ids is None:
+            message_cache.invalidate([message_id])
+        else:
+            message_cache.update_labels(message_id, label_ids, history_id)
+
+
+async def _list_unread_page(gmail_service, max_results: int, page_token=None):
+    """List one page of unread message IDs"""
+    params = {
+        "userId": "me",
+        "labelIds": ["UNREAD"],
+        "maxResults": max_results,
+        "fields": MESSAGE_LIST_FIELDS,
+    }
+    if page_token:
+        params["pageToken"] = page_token
+    return await execute_request(gmail_service.users().messages().list(**params))
+
+
+unread_mailbox_sync = UnreadMailboxSync()
@@ -0,0 +1,244 @@
+"""
+Persistent local cache of Gmail messages keyed by message ID.
+
+Message content never changes for a given ID, so once a message has been
+downloaded it can be served from disk on every later request. Only the labels
+can change; each entry keeps the message's `historyId` so label updates are
+applied only when they are newer than what is stored.
+
+Entries are evicted least-recently-used first once the cache exceeds
+`message_cache_max_entries` or `message_cache_max_bytes`.
+
+SQLite calls block, so coroutines use `aget_many` and `aput_many`, which run
+them on a worker thread instead of the event loop.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from logging import getLogger
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..configs import configs
+
+MESSAGE_CACHE_ENABLED = configs.get("message_cache_enabled", True)
+MESSAGE_CACHE_PATH = Path(configs.get("message_cache_dir")) / "messages.sqlite3"
+MESSAGE_CACHE_MAX_ENTRIES = configs.get("message_cache_max_entries", 5000)
+MESSAGE_CACHE_MAX_BYTES = configs.get("message_cache_max_bytes", 50 * 1024 * 1024)
+
+# SQLite caps the number of bound parameters per statement
+_MAX_SQL_PARAMS = 500
+
+logger = getLogger(__name__)
+
+
+class MessageCache:
+    """SQLite-backed LRU cache of Gmail API message resources."""
+
+    def __init__(
+        self,
+        path: Path = MESSAGE_CACHE_PATH,
+        max_entries: int = MESSAGE_CACHE_MAX_ENTRIES,
+        max_bytes: int = MESSAGE_CACHE_MAX_BYTES,
+        enabled: bool = MESSAGE_CACHE_ENABLED,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def get_many(self, message_ids: Iterable[str]) -> dict[str, dict]:
+        """Return the cached messages among `message_ids`, keyed by ID."""
+        message_ids = list(dict.fromkeys(message_ids))
+        if not self.enabled or not message_ids:
+            return {}
+
+        found: dict[str, dict] = {}
+        with self._lock:
+            connection = self._connect()
+            for chunk in _chunks(message_ids):
+                placeholders = ",".join("?" * len(chunk))
+                rows = connection.execute(
+                    f"SELECT id, data FROM messages WHERE id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                found.update((row[0], json.loads(row[1])) for row in rows)
+                connection.execute(
+                    f"UPDATE messages SET accessed_at = ? WHERE id IN ({placeholders})",
+                    [time.time(), *chunk],
+                )
+
+        logger.debug(f"Message cache hit {len(found)}/{len(message_ids)}")
+        return found
+
+    async def aget_many(self, message_ids: Iterable[str]) -> dict[str, dict]:
+        """`get_many` on a worker thread, for use from coroutines."""
+        message_ids = list(message_ids)
+        if not self.enabled or not message_ids:
+            return {}
+        return await asyncio.to_thread(self.get_many, message_ids)
+
+    def put_many(self, messages: dict[str, dict]) -> None:
+        """Store messages keyed by ID, keeping the entry with the newer historyId."""
+        if not self.enabled or not messages:
+            return
+
+        now = time.time()
+        rows = []
+        for message_id, message in messages.items():
+            data = json.dumps(message, separators=(",", ":"))
+            rows.append((message_id, _history_id(message), data, len(data), now, now))
+
+        with self._lock:
+            connection = self._connect()
+            connection.executemany(
+                """
+                INSERT INTO messages (id, history_id, data, size, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    history_id = excluded.history_id,
+                    data = excluded.data,
+                    size = excluded.size,
+                    accessed_at = excluded.accessed_at
+                WHERE excluded.history_id >= messages.history_id
+                """,
+                rows,
+            )
+            self._evict(connection)
+
+    async def aput_many(self, messages: dict[str, dict]) -> None:
+        """`put_many` on a worker thread, for use from coroutines."""
+        if not self.enabled or not messages:
+            return
+        await asyncio.to_thread(self.put_many, messages)
+
+    def update_labels(
+        self, message_id: str, label_ids: list[str], history_id: Optional[str]
+    ) -> None:
+        """Apply a label change to a cached message if it is newer than the entry."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT history_id, data FROM messages WHERE id = ?", (message_id,)
+            ).fetchone()
+            if row is None:
+                return
+            stored_history_id, data = row
+            if history_id is not None and _as_int(history_id) < stored_history_id:
+                return
+            message = json.loads(data)
+            message["labelIds"] = label_ids
+            if history_id is not None:
+                message["historyId"] = history_id
+            data = json.dumps(message, separators=(",", ":"))
+            connection.execute(
+                "UPDATE messages SET history_id = ?, data = ?, size = ? WHERE id = ?",
+                (_history_id(message), data, len(data), message_id),
+            )
+
+    def invalidate(self, message_ids: Iterable[str]) -> None:
+        """Remove messages from the cache."""
+        message_ids = list(message_ids)
+        if not self.enabled or not message_ids:
+            return
+
+        with self._lock:
+            connection = self._connect()
+            for chunk in _chunks(message_ids):
+                placeholders = ",".join("?" * len(chunk))
+                connection.execute(
+                    f"DELETE FROM messages WHERE id IN ({placeholders})", chunk
+                )
+
+    def clear(self) -> None:
+        """Remove every cached message."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._connect().execute("DELETE FROM messages")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Opening message cache at {self.path}")
+            # Access is serialised by self._lock, so worker threads may share it
+            connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS messages (
+                    id TEXT PRIMARY KEY,
+                    history_id INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS messages_accessed_at ON messages (accessed_at)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        count, total_bytes = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM messages"
+        ).fetchone()
+        if count <= self.max_entries and total_bytes <= self.max_bytes:
+            return
+
+        evicted = []
+        for message_id, size in connection.execute(
+            "SELECT id, size FROM messages ORDER BY accessed_at ASC"
+        ).fetchall():
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            evicted.append(message_id)
+            count -= 1
+            total_bytes -= size
+
+        for chunk in _chunks(evicted):
+            placeholders = ",".join("?" * len(chunk))
+            connection.execute(
+                f"DELETE FROM messages WHERE id IN ({placeholders})", chunk
+            )
+        logger.info(f"Evicted {len(evicted)} message(s) from the message cache")
+
+
+def _history_id(message: dict) -> int:
+    return _as_int(message.get("historyId"))
+
+
+def _as_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _chunks(items: list, size: int = _MAX_SQL_PARAMS):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+message_cache = MessageCache()
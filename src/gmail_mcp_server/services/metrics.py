@@ -0,0 +1,61 @@
+"""
+In-process metrics for the services layer.
+
+Counters only go up, gauges hold the latest value, and timings keep a count,
+total and maximum. Everything is kept in memory and read back as one
+snapshot, e.g. by the `metrics:///server` resource.
+"""
+
+import threading
+from typing import Any
+
+
+class Metrics:
+    """Thread-safe registry of counters, gauges and timings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._timings: dict[str, dict[str, float]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Add `value` to a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def add_to_gauge(self, name: str, delta: float) -> None:
+        """Move a gauge up or down by `delta`."""
+        with self._lock:
+            self._gauges[name] = self._gauges.get(name, 0) + delta
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record one timing sample."""
+        with self._lock:
+            timing = self._timings.setdefault(
+                name, {"count": 0, "total": 0.0, "max": 0.0}
+            )
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["max"] = max(timing["max"], seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of every metric."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "timings": {
+                    name: dict(timing) for name, timing in self._timings.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """Clear every metric."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timings.clear()
+
+
+metrics = Metrics()
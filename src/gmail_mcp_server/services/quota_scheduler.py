@@ -0,0 +1,140 @@
+"""
+Quota-aware scheduling of Google API requests.
+
+Google enforces per-user rate limits in quota units, and Gmail charges each
+method a different number of units (`messages.get` 5, `threads.get` 10,
+`drafts.create` 10, ...). Every request passes through a token bucket for its
+API before it is sent; when the bucket is empty the request waits its turn
+instead of being rejected with a rate-limit error.
+
+Bucket rates (units per second) are set under `[default.api_quotas]` in
+settings.toml. Queue depth, wait time and units spent are recorded in
+`metrics`.
+
+Reference: https://developers.google.com/workspace/gmail/api/reference/quota
+"""
+
+import asyncio
+import time
+from logging import getLogger
+from typing import Optional
+
+from googleapiclient.http import BatchHttpRequest
+
+from ..configs import configs
+from .metrics import metrics
+
+# Gmail quota units per method; anything not listed costs one unit
+METHOD_QUOTA_UNITS = {
+    "gmail.users.getProfile": 1,
+    "gmail.users.drafts.create": 10,
+    "gmail.users.drafts.get": 5,
+    "gmail.users.drafts.list": 5,
+    "gmail.users.drafts.send": 100,
+    "gmail.users.history.list": 2,
+    "gmail.users.labels.get": 1,
+    "gmail.users.labels.list": 1,
+    "gmail.users.messages.get": 5,
+    "gmail.users.messages.list": 5,
+    "gmail.users.messages.modify": 5,
+    "gmail.users.messages.send": 100,
+    "gmail.users.threads.get": 10,
+    "gmail.users.threads.list": 10,
+}
+
+# Default per-user limits: Gmail 250 units/s, Drive 12,000 and Calendar 600
+# queries per minute
+API_QUOTA_UNITS_PER_SECOND = {
+    "gmail": configs.get("api_quotas.gmail", 250),
+    "drive": configs.get("api_quotas.drive", 200),
+    "calendar": configs.get("api_quotas.calendar", 10),
+}
+
+logger = getLogger(__name__)
+
+
+class _TokenBucket:
+    """
+    Token bucket that hands out reservations instead of refusing.
+
+    Taking more tokens than are available drives the balance negative; the
+    caller then waits until the refill would have covered it. Later callers
+    queue behind earlier ones, so waiting is first come, first served.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    def reserve(self, units: float) -> float:
+        """Take `units` and return how many seconds to wait before using them."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+        self._tokens -= units
+        return max(0.0, -self._tokens / self.rate)
+
+
+class QuotaScheduler:
+    """Per-API token buckets weighted by method cost."""
+
+    def __init__(self, rates: dict[str, float] = API_QUOTA_UNITS_PER_SECOND):
+        self.rates = dict(rates)
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    async def acquire(self, request) -> None:
+        """
+        Wait until the request's API has quota for it.
+
+        Requests whose API cannot be determined are not throttled.
+
+        parameters:
+            request: A googleapiclient `HttpRequest` or `BatchHttpRequest`.
+        """
+        api, units = request_quota_cost(request)
+        if api is None or api not in self.rates:
+            return
+
+        bucket = self._buckets.get(api)
+        if bucket is None:
+            bucket = self._buckets[api] = _TokenBucket(self.rates[api])
+
+        metrics.increment(f"quota.{api}.requests")
+        metrics.increment(f"quota.{api}.units", units)
+        wait = bucket.reserve(units)
+        metrics.observe(f"quota.{api}.wait_seconds", wait)
+        if wait <= 0:
+            return
+
+        logger.debug(f"Waiting {wait:.2f}s for {api} quota ({units} unit(s))")
+        metrics.add_to_gauge(f"quota.{api}.queue_depth", 1)
+        try:
+            await asyncio.sleep(wait)
+        finally:
+            metrics.add_to_gauge(f"quota.{api}.queue_depth", -1)
+
+    def reset(self) -> None:
+        """Refill every bucket."""
+        self._buckets.clear()
+
+
+def request_quota_cost(request) -> tuple[Optional[str], int]:
+    """Return the (API name, quota units) a request will consume."""
+    if isinstance(request, BatchHttpRequest):
+        # Each request in a batch is charged as if sent on its own
+        costs = [request_quota_cost(r) for r in request._requests.values()]
+        apis = {api for api, _ in costs}
+        api = apis.pop() if len(apis) == 1 else None
+        return api, sum(units for _, units in costs)
+
+    method_id = getattr(request, "methodId", None)
+    if not isinstance(method_id, str):
+        return None, 0
+    return method_id.split(".", 1)[0], METHOD_QUOTA_UNITS.get(method_id, 1)
+
+
+quota_scheduler = QuotaScheduler()
@@ -0,0 +1,112 @@
+"""
+Run blocking Google API requests off the event loop.
+
+googleapiclient's `execute()` is synchronous, so calling it from a coroutine
+blocks every other MCP request. Requests are instead executed on a bounded
+thread pool whose size is set by `max_concurrent_requests` in settings.toml.
+
+httplib2 connections are not thread-safe, so each worker thread executes
+requests over its own authorized HTTP object that shares the request's
+credentials.
+
+Before a request is handed to the pool it waits for quota from
+`quota_scheduler`, so bursts are queued rather than rate-limited by Google.
+Idempotent requests that still fail transiently are retried as `retry_policy`
+prescribes.
+
+Reference: https://googleapis.github.io/google-api-python-client/docs/thread_safety.html
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import BatchHttpRequest, build_http
+
+from ..configs import configs
+from .metrics import metrics
+from .quota_scheduler import quota_scheduler, request_quota_cost
+from .retry_policy import is_idempotent, retry_policy
+
+MAX_CONCURRENT_REQUESTS = configs.get("max_concurrent_requests", 10)
+
+logger = getLogger(__name__)
+
+_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="google-api"
+)
+_thread_local = threading.local()
+
+
+async def execute_request(request):
+    """
+    Execute a Google API request on the bounded worker pool.
+
+    parameters:
+        request: A googleapiclient `HttpRequest` (or batch request).
+
+    returns:
+        The deserialized API response.
+
+    raises:
+        HttpError: Once retries are exhausted, or at once for non-idempotent calls.
+
+    example:
+        await execute_request(gmail_service.users().messages().get(userId="me", id=message_id))
+    """
+    api = request_quota_cost(request)[0] or "other"
+    idempotent = is_idempotent(request)
+    deadline = retry_policy.deadline()
+    loop = asyncio.get_running_loop()
+
+    attempt = 1
+    while True:
+        # Every attempt spends quota, retries included
+        await quota_scheduler.acquire(request)
+        metrics.increment(f"requests.{api}.attempts")
+        try:
+            return await loop.run_in_executor(_executor, _execute_in_worker, request)
+        except Exception as e:
+            delay = (
+                retry_policy.next_delay(attempt, e, deadline) if idempotent else None
+            )
+            if delay is None:
+                metrics.increment(f"requests.{api}.failures")
+                raise
+            metrics.increment(f"requests.{api}.retries")
+            logger.info(
+                f"Retrying {api} request in {delay:.2f}s after attempt {attempt}: {e}"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def _execute_in_worker(request):
+    http = _get_thread_http(_request_http(request))
+    if http is None:
+        return request.execute()
+    return request.execute(http=http)
+
+
+def _request_http(request):
+    if isinstance(request, BatchHttpRequest):
+        # A batch has no transport of its own; execute() borrows the first
+        # sub-request's, so do the same when picking the thread's client.
+        first = next(iter(request._requests.values()), None)
+        return getattr(first, "http", None)
+    return getattr(request, "http", None)
+
+
+def _get_thread_http(http):
+    """Return this thread's own AuthorizedHttp for the request's credentials."""
+    if not isinstance(http, AuthorizedHttp):
+        return None
+
+    cached = getattr(_thread_local, "http", None)
+    if cached is None or cached.credentials is not http.credentials:
+        logger.debug(f"Creating HTTP client for {threading.current_thread().name}")
+        cached = AuthorizedHttp(http.credentials, http=build_http())
+        _thread_local.http = cached
+    return cached
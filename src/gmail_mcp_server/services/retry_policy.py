@@ -0,0 +1,139 @@
+"""
+Retry policy for transient Google API errors.
+
+Rate limits (429, 403 rateLimitExceeded) and server errors (5xx) are usually
+over within seconds, so surfacing them to the client only turns a short blip
+into a failed tool call and a client-side retry. Failed calls are instead
+retried with exponential backoff and full jitter, waiting at least as long as
+the response's `Retry-After` header asks. Retries stop after
+`retry_max_attempts` attempts or once the next wait would run past
+`retry_deadline_seconds` from the first attempt.
+
+Only idempotent calls are retried: a retried `drafts.create` could create the
+draft twice.
+
+Reference: https://developers.google.com/workspace/gmail/api/guides/handle-errors#exponential-backoff
+"""
+
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest
+
+from ..configs import configs
+
+RETRY_MAX_ATTEMPTS = configs.get("retry_max_attempts", 4)
+RETRY_BASE_DELAY_SECONDS = configs.get("retry_base_delay_seconds", 0.5)
+RETRY_MAX_DELAY_SECONDS = configs.get("retry_max_delay_seconds", 16)
+RETRY_DEADLINE_SECONDS = configs.get("retry_deadline_seconds", 30)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRYABLE_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "backendError"}
+
+IDEMPOTENT_HTTP_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# POST methods that only read, so repeating them is harmless
+READ_ONLY_POST_METHODS = {"calendar.freebusy.query"}
+
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter and a total deadline."""
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        base_delay_seconds: float = RETRY_BASE_DELAY_SECONDS,
+        max_delay_seconds: float = RETRY_MAX_DELAY_SECONDS,
+        deadline_seconds: float = RETRY_DEADLINE_SECONDS,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.deadline_seconds = deadline_seconds
+
+    def deadline(self) -> float:
+        """Return the monotonic time after which no retry may start."""
+        return time.monotonic() + self.deadline_seconds
+
+    def next_delay(
+        self, attempt: int, exception: Exception, deadline: float
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt should be retried.
+
+        parameters:
+            attempt (int): The attempt that just failed, starting at 1.
+            exception (Exception): What it failed with.
+            deadline (float): The value `deadline()` returned before attempt 1.
+
+        returns:
+            float | None: Seconds to wait before the next attempt, or None to give up.
+        """
+        if attempt >= self.max_attempts or not is_retryable(exception):
+            return None
+
+        ceiling = min(
+            self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1)
+        )
+        delay = random.uniform(0, ceiling)
+        retry_after = _retry_after_seconds(exception)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if time.monotonic() + delay > deadline:
+            return None
+        return delay
+
+
+def is_retryable(exception: Exception) -> bool:
+    """Return whether an error is transient: a rate limit or server error."""
+    if not isinstance(exception, HttpError):
+        return False
+    if exception.resp.status in RETRYABLE_STATUS_CODES:
+        return True
+    reasons = {
+        detail.get("reason")
+        for detail in (exception.error_details or [])
+        if isinstance(detail, dict)
+    }
+    return exception.resp.status == 403 and bool(reasons & RETRYABLE_REASONS)
+
+
+def is_idempotent(request) -> bool:
+    """Return whether sending a request twice has the same effect as once."""
+    if isinstance(request, BatchHttpRequest):
+        return all(is_idempotent(r) for r in request._requests.values())
+
+    method = getattr(request, "method", None)
+    if not isinstance(method, str):
+        return False
+    return (
+        method.upper() in IDEMPOTENT_HTTP_METHODS
+        or getattr(request, "methodId", None) in READ_ONLY_POST_METHODS
+    )
+
+
+def _retry_after_seconds(exception: Exception) -> Optional[float]:
+    """Read the Retry-After header (seconds or HTTP date) from an HttpError."""
+    headers = getattr(exception, "resp", None)
+    if not isinstance(headers, dict):
+        return None
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+retry_policy = RetryPolicy()
@@ -1,4 +1,13 @@
 from .create_draft_reply import create_draft_reply
+from .get_email import get_email
+from .get_mailbox_stats import get_mailbox_stats
+from .get_thread import get_thread
 from .get_unread_emails import get_unread_emails
 
-__all__ = ["get_unread_emails", "create_draft_reply"]
+__all__ = [
+    "get_unread_emails",
+    "get_email",
+    "get_thread",
+    "get_mailbox_stats",
+    "create_draft_reply",
+]
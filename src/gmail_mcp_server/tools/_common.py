@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Settings, errors and message retrieval shared by the email tools.
+"""
+
+import logging
+from typing import Optional
+
+from ..configs import configs
+from ..services import (
+    MESSAGE_DISPLAY_FIELDS,
+    MESSAGE_TRIAGE_FIELDS,
+    TRIAGE_HEADERS,
+    execute_batch,
+    execute_request,
+    message_cache,
+    metadata_params,
+)
+
+# Body characters shown per message, and for all messages of one response
+MAX_BODY_CHARS = configs.get("max_body_chars", 4000)
+MAX_RESPONSE_CHARS = configs.get("max_response_chars", 20000)
+# Drop quoted replies and signatures from bodies
+STRIP_QUOTED_TEXT = configs.get("strip_quoted_text", False)
+
+# Between the messages of one conversation
+MESSAGE_SEPARATOR = "\n" + "=" * 40 + "\n\n"
+
+logger = logging.getLogger(__name__)
+
+
+class GmailAPIError(Exception):
+    """Exception raised when there is an error with the Gmail API."""
+
+    pass
+
+
+def validate_page(
+    offset: int, length: Optional[int], default: Optional[int] = None
+) -> int:
+    """
+    Validate paging arguments and return the page length.
+
+    parameters:
+        offset (int): Character offset to start from.
+        length (int): Requested page length, or None for `default`.
+        default (int): Page length when none is given, `max_body_chars` if unset.
+
+    returns:
+        int: The page length, at most `max_response_chars`.
+
+    raises:
+        ValueError: If offset is negative or length is not positive.
+    """
+    if offset < 0:
+        raise ValueError("offset must not be negative")
+    if length is None:
+        return MAX_BODY_CHARS if default is None else default
+    if length < 1:
+        raise ValueError("length must be positive")
+    return min(length, MAX_RESPONSE_CHARS)
+
+
+def message_get_params(metadata_only: bool = False) -> dict[str, object]:
+    """
+    Keyword arguments for messages.get (and threads.get, given a threads mask).
+
+    Full messages are fetched with the display mask; `metadata_only` asks for
+    the triage headers and snippet instead.
+    """
+    if metadata_only:
+        return metadata_params(TRIAGE_HEADERS, fields=MESSAGE_TRIAGE_FIELDS)
+    return {"fields": MESSAGE_DISPLAY_FIELDS}
+
+
+async def get_message(gmail_service, message_id: str) -> dict:
+    """
+    Return one full message from the message cache, downloading it if needed.
+
+    example:
+        message = await get_message(gmail_service, "18c2f0a1b2c3d4e5")
+    """
+    cached = await message_cache.aget_many([message_id])
+    if message_id in cached:
+        return cached[message_id]
+
+    logger.info(f"Retrieving email data for message ID: {message_id}")
+    message = await execute_request(
+        gmail_service.users()
+        .messages()
+        .get(userId="me", id=message_id, **message_get_params())
+    )
+    await message_cache.aput_many({message_id: message})
+    return message
+
+
+async def list_email_content(
+    gmail_service, message_ids: list[str], metadata_only: bool = False
+) -> list[dict]:
+    """
+    Retrieve messages by ID in one batch, downloading only uncached ones.
+
+    With `metadata_only`, misses are fetched as headers and snippet only. Cached
+    full messages are still used, but metadata responses are not cached since
+    they cannot be displayed in full.
+
+    returns:
+        list[dict]: The messages, in the order of `message_ids`.
+
+    example:
+        messages = await list_email_content(gmail_service, ["msg1", "msg2"])
+    """
+    messages = await message_cache.aget_many(message_ids)
+    missing_ids = [
+        message_id
+        for message_id in dict.fromkeys(message_ids)
+        if message_id not in messages
+    ]
+
+    if missing_ids:
+        logger.info(f"Retrieving email data for {len(missing_ids)} message(s)")
+        params = message_get_params(metadata_only)
+        requests = [
+            gmail_service.users().messages().get(userId="me", id=message_id, **params)
+            for message_id in missing_ids
+        ]
+        fetched = dict(zip(missing_ids, await execute_batch(gmail_service, requests)))
+        if not metadata_only:
+            await message_cache.aput_many(fetched)
+        messages.update(fetched)
+
+    return [messages[message_id] for message_id in message_ids]
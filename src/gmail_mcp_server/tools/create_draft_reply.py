@@ -9,14 +9,19 @@ import mcp.types as types
 from googleapiclient.errors import HttpError
 
 from ..configs import configs
-from ..services import get_gmail_api_service
+from ..services import execute_request, get_gmail_api_service, metadata_params
 from ..utils import (
+    HeaderIndex,
     build_threading_headers,
     ensure_reply_subject,
     get_header_value,
 )
 
 email_user = configs.get("email_user")
+
+# Only the headers needed to address and thread the reply are fetched
+REPLY_HEADERS = ["Subject", "Message-ID", "References", "From"]
+REPLY_THREAD_FIELDS = "messages(id,payload/headers)"
 logger = logging.getLogger(__name__)
 
 
@@ -51,8 +56,14 @@ async def create_draft_reply(arguments: dict) -> list[types.TextContent]:
 
         # Get the original thread to extract necessary headers for accurate threading
         logger.info(f"Retrieving thread {thread_id} to get original message details")
-        thread = (
-            gmail_service.users().threads().get(userId="me", id=thread_id).execute()
+        thread = await execute_request(
+            gmail_service.users()
+            .threads()
+            .get(
+                userId="me",
+                id=thread_id,
+                **metadata_params(REPLY_HEADERS, fields=REPLY_THREAD_FIELDS),
+            )
         )
 
         if not thread or "messages" not in thread or len(thread["messages"]) == 0:
@@ -60,7 +71,7 @@ async def create_draft_reply(arguments: dict) -> list[types.TextContent]:
 
         # Get the first message in the thread to extract headers
         original_message = thread["messages"][0]
-        headers = original_message["payload"]["headers"]
+        headers = HeaderIndex(original_message["payload"]["headers"])
 
         # Extract necessary headers for threading
         subject = get_header_value(headers, "subject", "")
@@ -88,11 +99,8 @@ async def create_draft_reply(arguments: dict) -> list[types.TextContent]:
         draft_body = {"message": {"raw": raw_message, "threadId": thread_id}}
 
         logger.info(f"Creating draft reply for thread {thread_id}")
-        draft = (
-            gmail_service.users()
-            .drafts()
-            .create(userId="me", body=draft_body)
-            .execute()
+        draft = await execute_request(
+            gmail_service.users().drafts().create(userId="me", body=draft_body)
         )
 
         draft_id = draft.get("id")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import logging
+from typing import Optional
+
+import mcp.types as types
+from googleapiclient.errors import HttpError
+
+from ..services import get_gmail_api_service
+from ..utils import ParsedMessage, format_email_for_display
+from ._common import STRIP_QUOTED_TEXT, GmailAPIError, get_message, validate_page
+
+logger = logging.getLogger(__name__)
+
+
+async def get_email(
+    message_id: str, offset: int = 0, length: Optional[int] = None
+) -> list[types.TextContent]:
+    """
+    Retrieves one email, reading its body a page at a time.
+
+    The message is served from the message cache when possible. This is also
+    the continuation handle for truncated bodies: get_unread_emails ends a
+    cut-off body with the message ID and offset to pass here. Each page ends
+    with a new marker if more of the body remains.
+
+    parameters:
+        message_id (str): The ID of the email.
+        offset (int): Character offset in the decoded body to start from.
+        length (int): Maximum body characters to return, `max_body_chars` by
+            default and at most `max_response_chars`.
+
+    returns:
+        list[types.TextContent]: A list containing the formatted email.
+
+    example:
+        await get_email("18c2f0a1b2c3d4e5", offset=4000)
+    """
+    if not message_id:
+        raise ValueError("Missing message_id argument")
+    length = validate_page(offset, length)
+
+    try:
+        gmail_service = get_gmail_api_service()
+        message = ParsedMessage.from_api(await get_message(gmail_service, message_id))
+        text = format_email_for_display(
+            message,
+            max_body_chars=length,
+            body_offset=offset,
+            strip_quotes=STRIP_QUOTED_TEXT,
+        )
+        return [types.TextContent(type="text", text=text)]
+
+    except HttpError as e:
+        errMessage = f"Gmail API Error: {str(e)}"
+        logger.error(errMessage)
+        raise GmailAPIError(errMessage)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+import logging
+
+import mcp.types as types
+from googleapiclient.errors import HttpError
+
+from ..services import get_gmail_api_service, label_stats_cache
+from ._common import GmailAPIError
+
+logger = logging.getLogger(__name__)
+
+
+async def get_mailbox_stats() -> list[types.TextContent]:
+    """
+    Retrieves unread and total counts for the mailbox and each label.
+
+    Counts come from the labels themselves, cached briefly, so no messages
+    are listed or downloaded however many are unread.
+
+    returns:
+        list[types.TextContent]: A list containing the mailbox statistics.
+
+    example:
+        await get_mailbox_stats()
+    """
+    try:
+        gmail_service = get_gmail_api_service()
+        labels = await label_stats_cache.get_label_stats(gmail_service)
+        return [types.TextContent(type="text", text=_format_stats(labels))]
+
+    except HttpError as e:
+        errMessage = f"Gmail API Error: {str(e)}"
+        logger.error(errMessage)
+        raise GmailAPIError(errMessage)
+
+
+def _format_stats(labels: list[dict]) -> str:
+    """Summarise the mailbox, then list labels with unread mail, most first"""
+    by_id = {label["id"]: label for label in labels}
+    # The UNREAD system label holds every unread message, whatever its folder
+    unread = by_id.get("UNREAD", {})
+    inbox = by_id.get("INBOX", {})
+
+    lines = [
+        f"Unread: {unread.get('messagesTotal', 0)} messages in "
+        f"{unread.get('threadsTotal', 0)} threads",
+        f"Inbox: {inbox.get('messagesUnread', 0)} unread of "
+        f"{inbox.get('messagesTotal', 0)} messages "
+        f"({inbox.get('threadsUnread', 0)} unread threads)",
+    ]
+
+    with_unread = sorted(
+        (
+            label
+            for label in labels
+            if label["id"] != "UNREAD" and label.get("messagesUnread", 0) > 0
+        ),
+        key=lambda label: label["messagesUnread"],
+        reverse=True,
+    )
+    if with_unread:
+        lines += ["", "Unread by label:"]
+        lines += [
+            f"- {label.get('name', label['id'])}: {label['messagesUnread']} messages, "
+            f"{label.get('threadsUnread', 0)} threads"
+            for label in with_unread
+        ]
+    return "\n".join(lines)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+import logging
+from typing import Optional
+
+import mcp.types as types
+from googleapiclient.errors import HttpError
+
+from ..services import (
+    THREAD_MESSAGE_IDS_FIELDS,
+    execute_request,
+    get_gmail_api_service,
+)
+from ..utils import ParsedMessage, format_email_for_display, truncate_text
+from ._common import (
+    MAX_RESPONSE_CHARS,
+    MESSAGE_SEPARATOR,
+    STRIP_QUOTED_TEXT,
+    GmailAPIError,
+    list_email_content,
+    validate_page,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def get_thread(
+    thread_id: str, offset: int = 0, length: Optional[int] = None
+) -> list[types.TextContent]:
+    """
+    Retrieves an email thread as one transcript, a page at a time.
+
+    Only the thread's message IDs are requested from the API; messages
+    already in the message cache are not downloaded again. The messages are
+    formatted oldest first and the transcript is paged by character offset,
+    cut on clean boundaries, with a marker naming the next offset.
+
+    parameters:
+        thread_id (str): The ID of the thread.
+        offset (int): Character offset in the transcript to start from.
+        length (int): Maximum characters to return, `max_response_chars` by
+            default and at most that.
+
+    returns:
+        list[types.TextContent]: A list containing one page of the thread.
+
+    example:
+        await get_thread("18c2f0a1b2c3d4e5", offset=20000)
+    """
+    if not thread_id:
+        raise ValueError("Missing thread_id argument")
+    length = validate_page(offset, length, default=MAX_RESPONSE_CHARS)
+
+    try:
+        gmail_service = get_gmail_api_service()
+        logger.info(f"Retrieving message IDs for thread {thread_id}")
+        thread = await execute_request(
+            gmail_service.users()
+            .threads()
+            .get(
+                userId="me",
+                id=thread_id,
+                format="minimal",
+                fields=THREAD_MESSAGE_IDS_FIELDS,
+            )
+        )
+        message_ids = [message["id"] for message in thread.get("messages", [])]
+        if not message_ids:
+            raise ValueError(f"Thread {thread_id} not found or has no messages")
+
+        messages = await list_email_content(gmail_service, message_ids)
+        transcript = MESSAGE_SEPARATOR.join(
+            format_email_for_display(
+                ParsedMessage.from_api(message), strip_quotes=STRIP_QUOTED_TEXT
+            )
+            for message in messages
+        )
+        return [
+            types.TextContent(
+                type="text",
+                text=_page(thread_id, len(message_ids), transcript, offset, length),
+            )
+        ]
+
+    except HttpError as e:
+        errMessage = f"Gmail API Error: {str(e)}"
+        logger.error(errMessage)
+        raise GmailAPIError(errMessage)
+
+
+def _page(
+    thread_id: str, message_count: int, transcript: str, offset: int, length: int
+) -> str:
+    """Cut one page out of a thread transcript"""
+    header = f"Thread ID: {thread_id}\nMessages: {message_count}\n"
+    if offset > 0 and offset >= len(transcript):
+        return (
+            f"{header}\n[Offset {offset} is beyond the end of the thread "
+            f"({len(transcript)} chars).]\n"
+        )
+
+    page = truncate_text(transcript[offset:], length)
+    end = offset + len(page)
+
+    if offset > 0 or end < len(transcript):
+        header += f"Characters: {offset}-{end} of {len(transcript)}\n"
+    marker = ""
+    if end < len(transcript):
+        marker = (
+            f"\n[Truncated: {len(transcript) - end} more characters. Call "
+            f'get_thread with thread_id "{thread_id}" and offset {end} to read on.]\n'
+        )
+    return f"{header}\n{page}{marker}"
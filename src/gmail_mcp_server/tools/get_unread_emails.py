@@ -1,64 +1,84 @@
 #!/usr/bin/env python3
 
 import asyncio
+import hashlib
 import logging
+from typing import AsyncIterator, Optional
 
 import mcp.types as types
 from googleapiclient.errors import HttpError
 
-from ..services import get_gmail_api_service
-from ..utils import format_email_for_display
+from ..services import (
+    THREAD_DISPLAY_FIELDS,
+    THREAD_TRIAGE_FIELDS,
+    execute_batch,
+    get_gmail_api_service,
+    message_cache,
+    unread_mailbox_sync,
+)
+from ..utils import (
+    ParsedMessage,
+    format_email_for_display,
+    format_email_summary,
+    strip_quoted_text,
+)
+from ._common import (
+    MAX_BODY_CHARS,
+    MAX_RESPONSE_CHARS,
+    MESSAGE_SEPARATOR,
+    STRIP_QUOTED_TEXT,
+    GmailAPIError,
+    list_email_content,
+    message_get_params,
+)
 
-logger = logging.getLogger(__name__)
-
-
-class GmailAPIError(Exception):
-    """Exception raised when there is an error with the Gmail API."""
+# How much of each message get_unread_emails returns: headers only, headers
+# and Gmail's snippet, or the formatted body
+EMAIL_MODES = ("metadata", "snippet", "full")
 
-    pass
+logger = logging.getLogger(__name__)
 
 
-async def get_unread_emails(limit: int = 5) -> list[types.TextContent]:
+async def get_unread_emails(
+    limit: int = 5, mode: str = "full", group_by_thread: bool = False
+) -> list[types.TextContent]:
     """
     Retrieves unread emails from Gmail.
 
+    In "metadata" and "snippet" mode each email is one compact line fetched
+    with `format="metadata"`, so triaging many emails downloads no bodies.
+    With `group_by_thread` unread emails of the same conversation are
+    returned together; see iter_unread_threads.
+
     Reference: https://developers.google.com/workspace/explore?filter=&discoveryUrl=https%3A%2F%2Fgmail.googleapis.com%2F%24discovery%2Frest%3Fversion%3Dv1&discoveryRef=
 
     parameters:
         limit (int): The maximum number of unread emails to retrieve.
+        mode (str): "metadata", "snippet" or "full".
+        group_by_thread (bool): Return one entry per conversation.
 
     returns:
         list[types.TextContent]: A list containing text content with the unread emails.
 
+    raises:
+        ValueError: If mode is not one of EMAIL_MODES.
+
     example:
-        await get_unread_emails(5)
+        await get_unread_emails(50, mode="snippet")
     """
+    if mode not in EMAIL_MODES:
+        raise ValueError(f"mode must be one of {', '.join(EMAIL_MODES)}")
 
     try:
-        logger.debug("Initializing Gmail API service")
-        gmail_service = get_gmail_api_service()
-        # Retrieve unread emails using the Gmail API service
-        logger.info(f"Retrieving up to {limit} unread emails")
-        unread_email_data = (
-            gmail_service.users()
-            .messages()
-            .list(userId="me", labelIds=["UNREAD"], maxResults=limit)
-            .execute()
+        emails = (
+            iter_unread_threads(limit, mode)
+            if group_by_thread
+            else iter_unread_emails(limit, mode)
         )
-        message_ids = unread_email_data.get("messages", [])
+        results = [email async for email in emails]
 
-        if not message_ids:
+        if not results:
             logger.warning("No unread emails found")
-            return []
-
-        messages = await _list_all_email_content(
-            gmail_service, [message_id["id"] for message_id in message_ids]
-        )
-
-        results = []
-        for msg in messages:
-            email_text = format_email_for_display(msg)
-            results.append(types.TextContent(type="text", text=email_text))
 
         return results
 
@@ -71,19 +91,316 @@ async def get_unread_emails(limit: int = 5) -> list[types.TextContent]:
         raise GmailAPIError(f"Unexpected Error retrieving unread emails: {str(e)}")
 
 
-async def _get_email_content(gmail_service, message_id):
-    """Async wrapper for Gmail API call"""
-    logger.info(f"Retrieving email data for message ID: {message_id}")
-    email_data = (
-        gmail_service.users().messages().get(userId="me", id=message_id).execute()
+async def iter_unread_emails(
+    limit: int = 5, mode: str = "full"
+) -> AsyncIterator[types.TextContent]:
+    """
+    Stream unread emails as they become ready, newest first.
+
+    Message IDs come from the incremental mailbox sync, page by page. Each
+    page's messages are fetched while the next page is listed, and at most two
+    pages of messages are held in memory at once, as compact ParsedMessages
+    rather than raw API JSON.
+
+    Bodies are truncated to `max_body_chars` each; a truncated body ends with
+    a marker to continue with get_email. Outside "full" mode only headers and
+    snippets are fetched. The whole response stays within
+    `max_response_chars`: once an email no longer fits, no further pages are
+    fetched and the emails left out are counted in a closing note.
+
+    parameters:
+        limit (int): The maximum number of unread emails to retrieve.
+        mode (str): "metadata", "snippet" or "full".
+
+    yields:
+        types.TextContent: One formatted email at a time.
+
+    example:
+        async for email in iter_unread_emails(50): ...
+    """
+    logger.debug("Initializing Gmail API service")
+    gmail_service = get_gmail_api_service()
+    logger.info(f"Retrieving up to {limit} unread emails")
+
+    budget = _ResponseBudget(MAX_RESPONSE_CHARS, limit)
+    metadata_only = mode != "full"
+    pending_page: asyncio.Future | None = None
+    try:
+        async for message_ids in unread_mailbox_sync.iter_unread_message_id_pages(
+            gmail_service, limit
+        ):
+            next_page = asyncio.ensure_future(
+                _list_parsed_messages(gmail_service, message_ids, metadata_only)
+            )
+            if pending_page is not None:
+                for email in _format_emails(await pending_page, budget, mode):
+                    yield email
+            pending_page = next_page
+            if budget.spent:
+                # Nothing more fits: drop the page being fetched, list no more
+                budget.omitted += len(message_ids)
+                break
+        else:
+            if pending_page is not None:
+                for email in _format_emails(await pending_page, budget, mode):
+                    yield email
+                pending_page = None
+
+        if budget.omitted:
+            yield types.TextContent(type="text", text=budget.omitted_note())
+    finally:
+        if pending_page is not None:
+            pending_page.cancel()
+
+
+async def iter_unread_threads(
+    limit: int = 5, mode: str = "full"
+) -> AsyncIterator[types.TextContent]:
+    """
+    Yield unread emails grouped by conversation, most recent first.
+
+    The unread IDs are grouped by the thread ID the mailbox sync recorded for
+    them. A thread with several uncached unread messages is fetched with one
+    threads.get, other messages with messages.get, all in a single batch.
+    Within a conversation messages are shown oldest first by `internalDate`,
+    and a message whose body repeats an earlier one's is reduced to its
+    summary line. The same `max_response_chars` budget as ungrouped results
+    applies to every line: once it is spent, the remaining conversations are
+    left out and their unread emails counted in a closing note.
+
+    parameters:
+        limit (int): The maximum number of unread emails to retrieve.
+        mode (str): "metadata", "snippet" or "full".
+
+    yields:
+        types.TextContent: One formatted conversation at a time.
+
+    example:
+        async for thread in iter_unread_threads(50): ...
+    """
+    gmail_service = get_gmail_api_service()
+    logger.info(f"Retrieving up to {limit} unread emails by thread")
+
+    threads: dict[str, list[str]] = {}
+    async for page in unread_mailbox_sync.iter_unread_message_pages(
+        gmail_service, limit
+    ):
+        for message_id, thread_id in page.items():
+            threads.setdefault(thread_id or message_id, []).append(message_id)
+
+    budget = _ResponseBudget(MAX_RESPONSE_CHARS, limit)
+    conversations = await _list_thread_messages(
+        gmail_service, threads, metadata_only=mode != "full"
     )
-    return email_data
+    for thread_id, messages in conversations.items():
+        if budget.spent:
+            budget.omitted += len(messages)
+            continue
+        text = _format_thread(thread_id, messages, budget, mode)
+        if text is not None:
+            yield types.TextContent(type="text", text=text)
+
+    if budget.omitted:
+        yield types.TextContent(type="text", text=budget.omitted_note())
 
 
-async def _list_all_email_content(gmail_service, message_ids):
-    """Retrieve email data for a list of message IDs in parallel"""
-    tasks = [
-        _get_email_content(gmail_service, message_id) for message_id in message_ids
-    ]
-    email_data_list = await asyncio.gather(*tasks)
-    return email_data_list
+async def _list_parsed_messages(
+    gmail_service, message_ids, metadata_only: bool = False
+) -> list[ParsedMessage]:
+    """Retrieve a page of messages and keep only what is displayed"""
+    messages = await list_email_content(gmail_service, message_ids, metadata_only)
+    return [ParsedMessage.from_api(message) for message in messages]
+
+
+class _ResponseBudget:
+    """
+    Characters still available to one get_unread_emails response
+
+    Room for the closing note is set aside up front. Once an email does not
+    fit, it and every later one are left out and counted in `omitted`.
+    """
+
+    __slots__ = ("remaining", "omitted")
+
+    def __init__(self, max_chars: int, limit: int):
+        # Emails left out because they did not fit
+        self.omitted = 0
+        self.remaining = max_chars - len(self.omitted_note(limit))
+
+    @property
+    def spent(self) -> bool:
+        return self.omitted > 0
+
+    def format(self, message: ParsedMessage, prefix: str = "") -> Optional[str]:
+        """Format a message with its body cut to fit, or None (counted in `omitted`)"""
+        max_body_chars = min(MAX_BODY_CHARS, self.remaining)
+        while not self.spent and max_body_chars > 0:
+            text = prefix + format_email_for_display(
+                message, max_body_chars=max_body_chars, strip_quotes=STRIP_QUOTED_TEXT
+            )
+            overrun = len(text) - self.remaining
+            if overrun <= 0:
+                self.remaining -= len(text)
+                return text
+            # The headers and marker stay, so shorten the body by the overrun
+            max_body_chars -= overrun
+        self.omitted += 1
+        return None
+
+    def summary(
+        self, message: ParsedMessage, include_snippet: bool, prefix: str = ""
+    ) -> Optional[str]:
+        """Format a summary line, or None (counted in `omitted`) if it does not fit"""
+        return self.add(prefix + format_email_summary(message, include_snippet))
+
+    def add(self, text: str, count: int = 1) -> Optional[str]:
+        """Charge `text` for `count` emails, or None (counted in `omitted`)"""
+        if self.spent or len(text) > self.remaining:
+            self.omitted += count
+            return None
+        self.remaining -= len(text)
+        return text
+
+    def omitted_note(self, count: Optional[int] = None) -> str:
+        count = self.omitted if count is None else count
+        return (
+            f"[Omitted {count} more unread email(s): the response reached "
+            f"{MAX_RESPONSE_CHARS} characters. Ask for a smaller limit.]"
+        )
+
+
+def _format_emails(
+    messages: list[ParsedMessage], budget: _ResponseBudget, mode: str = "full"
+) -> list[types.TextContent]:
+    if mode != "full":
+        include_snippet = mode == "snippet"
+        texts = (budget.summary(msg, include_snippet) for msg in messages)
+    else:
+        texts = (budget.format(msg) for msg in messages)
+    return [types.TextContent(type="text", text=text) for text in texts if text]
+
+
+def _format_thread(
+    thread_id: str, messages: list[ParsedMessage], budget: _ResponseBudget, mode: str
+) -> Optional[str]:
+    """Render the unread messages of one conversation, oldest first; None if none fit"""
+    summary_mode = mode != "full"
+    separator = "\n" if summary_mode else MESSAGE_SEPARATOR
+    header = f"Thread ID: {thread_id}\nUnread messages: {len(messages)}\n\n"
+    # Summary lines end with a newline of their own
+    frame = header + "\n" if summary_mode else header
+    if budget.add(frame, len(messages)) is None:
+        return None
+
+    seen: dict[bytes, str] = {}
+    formatted = []
+    for message in messages:
+        prefix = separator if formatted else ""
+        if summary_mode:
+            text = budget.summary(message, mode == "snippet", prefix)
+        else:
+            digest = _body_digest(message)
+            if digest in seen:
+                text = budget.add(
+                    f"{prefix}{format_email_summary(message)}\n"
+                    f"[Same body as message {seen[digest]}]\n"
+                )
+            else:
+                if digest is not None:
+                    seen[digest] = message.id
+                text = budget.format(message, prefix)
+        if text is not None:
+            formatted.append(text)
+
+    if not formatted:
+        budget.remaining += len(frame)
+        return None
+    return header + "".join(formatted) + ("\n" if summary_mode else "")
+
+
+def _body_digest(message: ParsedMessage) -> Optional[bytes]:
+    """Hash the body as it will be displayed; None for an empty body"""
+    body = message.body
+    if STRIP_QUOTED_TEXT:
+        body = strip_quoted_text(body).text
+    if not body.strip():
+        return None
+    return hashlib.blake2b(body.encode(), digest_size=16).digest()
+
+
+async def _list_thread_messages(
+    gmail_service, threads: dict[str, list[str]], metadata_only: bool = False
+) -> dict[str, list[ParsedMessage]]:
+    """
+    Retrieve the unread messages of each thread, oldest first per thread
+
+    Returns the messages keyed like `threads`, in the same order.
+
+    `threads` maps thread IDs to their unread message IDs. Cached messages are
+    not downloaded again. A thread missing more than one message costs one
+    threads.get (10 quota units) instead of a messages.get (5 units) each;
+    its read messages are cached too, ready for get_thread.
+    """
+    message_ids = [message_id for ids in threads.values() for message_id in ids]
+    messages = await message_cache.aget_many(message_ids)
+
+    thread_requests = []
+    missing_ids = []
+    for thread_id, ids in threads.items():
+        missing = [message_id for message_id in ids if message_id not in messages]
+        if len(missing) > 1:
+            thread_requests.append(thread_id)
+        else:
+            missing_ids.extend(missing)
+
+    if thread_requests or missing_ids:
+        logger.info(
+            f"Retrieving {len(thread_requests)} thread(s) and "
+            f"{len(missing_ids)} message(s)"
+        )
+        message_params = message_get_params(metadata_only)
+        thread_params = {
+            **message_params,
+            "fields": THREAD_TRIAGE_FIELDS if metadata_only else THREAD_DISPLAY_FIELDS,
+        }
+        requests = [
+            gmail_service.users()
+            .threads()
+            .get(userId="me", id=thread_id, **thread_params)
+            for thread_id in thread_requests
+        ] + [
+            gmail_service.users()
+            .messages()
+            .get(userId="me", id=message_id, **message_params)
+            for message_id in missing_ids
+        ]
+        responses = await execute_batch(gmail_service, requests)
+
+        fetched = dict(zip(missing_ids, responses[len(thread_requests) :]))
+        for thread in responses[: len(thread_requests)]:
+            for message in thread.get("messages", []):
+                fetched[message["id"]] = message
+        if not metadata_only:
+            await message_cache.aput_many(fetched)
+        messages.update(fetched)
+
+    conversations = {}
+    for thread_id, ids in threads.items():
+        # Unread IDs are newest first; the stable sort keeps that order,
+        # reversed, for messages without a date
+        parsed = [
+            ParsedMessage.from_api(messages[message_id])
+            for message_id in reversed(ids)
+            if message_id in messages
+        ]
+        if parsed:
+            parsed.sort(key=_internal_date)
+            conversations[thread_id] = parsed
+    return conversations
+
+
+def _internal_date(message: ParsedMessage) -> int:
+    try:
+        return int(message.internal_date or 0)
+    except ValueError:
+        return 0
@@ -7,17 +7,33 @@ including header extraction, body parsing, message formatting, and threading.
 """
 
 from .build_threading_headers import build_threading_headers
+from .compute_free_slots import compute_free_slots, merge_intervals
 from .ensure_reply_subject import ensure_reply_subject
 from .format_date_time import format_to_rfc3339
 from .format_email_for_display import format_email_for_display
+from .format_email_summary import format_email_summary
 from .get_email_body import get_email_body
 from .get_header_value import get_header_value
+from .header_index import HeaderIndex
+from .html_to_text import html_to_text
+from .parsed_message import ParsedMessage
+from .strip_quoted_text import StrippedText, strip_quoted_text
+from .truncate_text import truncate_text
 
 __all__ = [
+    "HeaderIndex",
+    "ParsedMessage",
+    "StrippedText",
     "build_threading_headers",
+    "compute_free_slots",
     "ensure_reply_subject",
     "format_email_for_display",
+    "format_email_summary",
     "format_to_rfc3339",
     "get_email_body",
     "get_header_value",
+    "html_to_text",
+    "merge_intervals",
+    "strip_quoted_text",
+    "truncate_text",
 ]
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Free time slot computation from busy intervals.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Collection, Iterable
+
+Interval = tuple[datetime, datetime]
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """
+    Merge overlapping or touching intervals with a sorted sweep.
+
+    Args:
+        intervals: (start, end) pairs in any order
+
+    Returns:
+        Disjoint intervals sorted by start
+
+    Example:
+        >>> merge_intervals([(t(10), t(11)), (t(9), t(10))])
+        [(t(9), t(11))]
+    """
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def compute_free_slots(
+    busy_intervals: Iterable[Interval],
+    start: datetime,
+    end: datetime,
+    working_hours: tuple[time, time] = (time(9), time(17)),
+    working_days: Collection[int] = (0, 1, 2, 3, 4),
+    tz: tzinfo = timezone.utc,
+    min_duration: timedelta = timedelta(minutes=30),
+) -> list[Interval]:
+    """
+    Compute free slots within working hours that avoid every busy interval.
+
+    Busy intervals from all calendars are merged first, then subtracted from
+    each working day's hours in a single pass over both sorted lists.
+
+    Args:
+        busy_intervals: Busy (start, end) pairs, timezone-aware, from any calendars
+        start: Start of the range to search (timezone-aware)
+        end: End of the range to search (timezone-aware)
+        working_hours: Local (start, end) time of the working day
+        working_days: Working weekdays, Monday = 0
+        tz: Time zone the working hours are expressed in
+        min_duration: Shortest free slot worth returning
+
+    Returns:
+        Free (start, end) slots in `tz`, sorted by start
+
+    Example:
+        >>> compute_free_slots([(nine_thirty, ten)], nine, noon)
+        [(ten, noon)]
+    """
+    busy = merge_intervals(busy_intervals)
+    slots: list[Interval] = []
+    index = 0
+
+    for window_start, window_end in _working_windows(
+        start, end, working_hours, working_days, tz
+    ):
+        # Busy intervals are sorted and disjoint, so skip those already over
+        while index < len(busy) and busy[index][1] <= window_start:
+            index += 1
+
+        cursor = window_start
+        position = index
+        while position < len(busy) and busy[position][0] < window_end:
+            busy_start, busy_end = busy[position]
+            if busy_start > cursor:
+                slots.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+            position += 1
+        if cursor < window_end:
+            slots.append((cursor, window_end))
+
+    return [
+        (slot_start.astimezone(tz), slot_end.astimezone(tz))
+        for slot_start, slot_end in slots
+        if slot_end - slot_start >= min_duration
+    ]
+
+
+def _working_windows(
+    start: datetime,
+    end: datetime,
+    working_hours: tuple[time, time],
+    working_days: Collection[int],
+    tz: tzinfo,
+) -> list[Interval]:
+    """Working-hour windows of each working day, clipped to [start, end)."""
+    day_start, day_end = working_hours
+    windows: list[Interval] = []
+    # Start a day early in case the previous day's hours run past midnight
+    day: date = start.astimezone(tz).date() - timedelta(days=1)
+    last_day = end.astimezone(tz).date()
+
+    while day <= last_day:
+        if day.weekday() in working_days:
+            window_start = datetime.combine(day, day_start, tzinfo=tz)
+            window_end = datetime.combine(day, day_end, tzinfo=tz)
+            if window_end <= window_start:
+                # Working hours that run past midnight
+                window_end += timedelta(days=1)
+            window_start = max(window_start, start)
+            window_end = min(window_end, end)
+            if window_start < window_end:
+                windows.append((window_start, window_end))
+        day += timedelta(days=1)
+
+    return windows
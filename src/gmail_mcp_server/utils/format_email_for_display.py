@@ -3,16 +3,35 @@
 Email formatting utilities for displaying Gmail messages.
 """
 
-from .get_email_body import get_email_body
+from typing import Optional
+
 from .get_header_value import get_header_value
+from .parsed_message import ParsedMessage
+from .strip_quoted_text import strip_quoted_text
+from .truncate_text import truncate_text
 
 
-def format_email_for_display(message: dict) -> str:
+def format_email_for_display(
+    message: dict | ParsedMessage,
+    max_body_chars: Optional[int] = None,
+    body_offset: int = 0,
+    strip_quotes: bool = False,
+) -> str:
     """
     Format a Gmail API message for human-readable display.
 
+    With `max_body_chars` the body is truncated on a clean boundary and ends
+    with a marker naming the `get_email` call that returns the rest. With
+    `strip_quotes` quoted replies and signatures are removed first, so
+    offsets refer to the reduced body. An offset past the end of the body
+    gives a note saying so in place of the body.
+
     Args:
-        message: Gmail API message object with 'id', 'threadId', 'payload', etc.
+        message: Gmail API message object with 'id', 'threadId', 'payload', etc.,
+            or a ParsedMessage built from one
+        max_body_chars: Maximum body characters to include (None for all)
+        body_offset: Character offset in the body to start from
+        strip_quotes: Remove quoted history and signatures from the body
 
     Returns:
         Formatted string containing email metadata and body
@@ -28,18 +47,44 @@ def format_email_for_display(message: dict) -> str:
         Thread ID: thread456
         ...
     """
-    headers = message["payload"]["headers"]
+    if not isinstance(message, ParsedMessage):
+        message = ParsedMessage.from_api(message)
+
+    sender = get_header_value(message.headers, "from", "Unknown")
+    subject = get_header_value(message.headers, "subject", "(No Subject)")
+    date = get_header_value(message.headers, "date", "Unknown")
+
+    body = message.body
+    removed_bytes = 0
+    if strip_quotes:
+        body, removed_bytes = strip_quoted_text(body)
+    shown = body[body_offset:]
+    if max_body_chars is not None:
+        shown = truncate_text(shown, max_body_chars)
+    end = body_offset + len(shown)
 
-    sender = get_header_value(headers, "from", "Unknown")
-    subject = get_header_value(headers, "subject", "(No Subject)")
-    date = get_header_value(headers, "date", "Unknown")
-    body = get_email_body(message["payload"])
+    body_label = "Body:"
+    if body_offset > 0 and body_offset >= len(body):
+        shown = (
+            f"[Offset {body_offset} is beyond the end of the body ({len(body)} chars).]"
+        )
+    elif body_offset > 0:
+        body_label = f"Body (characters {body_offset}-{end} of {len(body)}):"
+    marker = ""
+    if removed_bytes:
+        marker += f"\n[Quoted text and signature removed: {removed_bytes} bytes]\n"
+    if end < len(body):
+        marker += (
+            f"\n[Truncated: {len(body) - end} more characters. Call get_email with "
+            f'message_id "{message.id}" and offset {end} to read on.]\n'
+        )
 
     return (
-        f"ID: {message['id']}\n"
-        f"Thread ID: {message['threadId']}\n"
+        f"ID: {message.id}\n"
+        f"Thread ID: {message.thread_id}\n"
         f"Date: {date}\n"
         f"From: {sender}\n"
         f"Subject: {subject}\n"
-        f"\nBody:\n{body}\n"
+        f"\n{body_label}\n{shown}\n"
+        f"{marker}"
     )
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Compact one-line formatting of Gmail messages for triage.
+"""
+
+from html import unescape
+
+from .get_header_value import get_header_value
+from .parsed_message import ParsedMessage
+
+
+def format_email_summary(
+    message: dict | ParsedMessage, include_snippet: bool = False
+) -> str:
+    """
+    Format a Gmail API message as a single triage line.
+
+    Only the IDs and the From, Subject and Date headers are used, so the
+    message may come from a `format="metadata"` fetch. The snippet Gmail
+    returns is HTML-escaped; it is unescaped here.
+
+    Args:
+        message: Gmail API message object with 'id', 'threadId' and
+            'payload.headers', or a ParsedMessage built from one
+        include_snippet: Add Gmail's snippet of the body on a second line
+
+    Returns:
+        The summary line, followed by the snippet line if requested
+
+    Example:
+        >>> print(format_email_summary(message, include_snippet=True))
+        ID: msg123 | Thread ID: thread456 | Date: Mon, 01 Jan 2024 | From: jane@example.com | Subject: Lunch
+        Snippet: Are you free on Friday?
+    """
+    if not isinstance(message, ParsedMessage):
+        message = ParsedMessage.from_api(message)
+
+    sender = get_header_value(message.headers, "from", "Unknown")
+    subject = get_header_value(message.headers, "subject", "(No Subject)")
+    date = get_header_value(message.headers, "date", "Unknown")
+
+    summary = (
+        f"ID: {message.id} | Thread ID: {message.thread_id} | Date: {date} | "
+        f"From: {sender} | Subject: {subject}"
+    )
+    if include_snippet:
+        summary += f"\nSnippet: {unescape(message.snippet)}"
+    return summary
@@ -5,12 +5,17 @@ Email body extraction utilities for Gmail API messages.
 
 import base64
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+from .html_to_text import html_to_text
+
+if TYPE_CHECKING:
+    from .parsed_message import ParsedMessage
 
 logger = logging.getLogger(__name__)
 
 
-def get_email_body(payload: dict) -> str:
+def get_email_body(payload: "dict | ParsedMessage", html_as_text: bool = False) -> str:
     """
     Extract email body from message payload.
 
@@ -18,7 +23,10 @@ def get_email_body(payload: dict) -> str:
     preferring text/plain over text/html content.
 
     Args:
-        payload: Gmail API message payload dictionary
+        payload: Gmail API message payload dictionary, or a ParsedMessage
+            (whose body is decoded once and cached, with HTML as text)
+        html_as_text: Convert HTML-only bodies to plain text instead of
+            returning the markup
 
     Returns:
         Decoded email body text, or empty string if no body found
@@ -28,6 +36,8 @@ def get_email_body(payload: dict) -> str:
         >>> get_email_body(payload)
         'Hello World'
     """
+    if not isinstance(payload, dict):
+        return payload.body
 
     def _decode_base64(data: str) -> str:
         """Decode base64 urlsafe encoded string"""
@@ -66,7 +76,12 @@ def get_email_body(payload: dict) -> str:
                 if not text_html:
                     text_html = _decode_base64(part["body"]["data"])
 
-        return text_plain or text_html
+        if text_plain:
+            return text_plain
+        return _html_body(text_html) if text_html else text_html
+
+    def _html_body(html: str) -> str:
+        return html_to_text(html) if html_as_text else html
 
     # Handle multipart messages
     if "parts" in payload:
@@ -76,7 +91,10 @@ def get_email_body(payload: dict) -> str:
 
     # Handle simple messages
     if "body" in payload and "data" in payload["body"]:
-        return _decode_base64(payload["body"]["data"])
+        body = _decode_base64(payload["body"]["data"])
+        if payload.get("mimeType") == "text/html":
+            return _html_body(body)
+        return body
 
     logger.warning("No email body found in payload")
     return ""
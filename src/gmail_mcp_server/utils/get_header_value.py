@@ -5,15 +5,21 @@ Header extraction utilities for Gmail API messages.
 
 from typing import Optional
 
+from .header_index import HeaderIndex
+
 
 def get_header_value(
-    headers: list[dict], header_name: str, default: Optional[str] = None
+    headers: list[dict] | HeaderIndex, header_name: str, default: Optional[str] = None
 ) -> Optional[str]:
     """
     Extract a header value from email headers by name.
 
+    For several lookups on the same message, build a `HeaderIndex` once and
+    pass it instead of the list.
+
     Args:
-        headers: List of email header dictionaries with 'name' and 'value' keys
+        headers: List of email header dictionaries with 'name' and 'value' keys,
+            or a HeaderIndex built from them
         header_name: Name of the header to extract (case-insensitive)
         default: Default value if header not found
 
@@ -25,6 +31,9 @@ def get_header_value(
         >>> get_header_value(headers, "from")
         'user@example.com'
     """
+    if isinstance(headers, HeaderIndex):
+        return headers.get(header_name, default)
+
     return next(
         (
             header.get("value")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Case-insensitive header index for Gmail API messages.
+"""
+
+from typing import Optional
+
+
+class HeaderIndex:
+    """
+    Headers of one message, keyed by lowercase name.
+
+    The header list is scanned once; every lookup after that is a dict access.
+    When a header appears more than once the first occurrence wins, as with
+    `get_header_value` on a plain list.
+
+    Example:
+        >>> headers = HeaderIndex([{"name": "From", "value": "user@example.com"}])
+        >>> headers.get("from")
+        'user@example.com'
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, headers: list[dict]):
+        values: dict[str, Optional[str]] = {}
+        for header in headers:
+            values.setdefault(header.get("name", "").lower(), header.get("value"))
+        self._values = values
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Return the first value of a header (case-insensitive), or default."""
+        return self._values.get(name.lower(), default)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
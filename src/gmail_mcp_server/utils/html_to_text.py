@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+HTML to plain text conversion for HTML-only emails.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Optional
+
+# Elements whose content is never readable text
+SKIPPED_TAGS = frozenset(
+    {"head", "style", "script", "noscript", "template", "svg", "title", "object"}
+)
+# Elements that start on a new line
+BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "li",
+        "main",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "tr",
+        "ul",
+    }
+)
+# Elements that are followed by a blank line
+PARAGRAPH_TAGS = frozenset({"p", "h1", "h2", "h3", "h4", "h5", "h6", "table", "ul"})
+# Elements that never have an end tag
+VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+_HIDDEN_STYLE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.I)
+_WHITESPACE = re.compile(r"\s+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+class HtmlToTextParser(HTMLParser):
+    """
+    Streaming HTML to text converter.
+
+    Feed HTML in chunks with `feed()` and read the result from `text()`.
+    Style, script and hidden elements are dropped, whitespace is collapsed,
+    block elements start new lines and links are kept as `text (url)`.
+
+    Example:
+        >>> parser = HtmlToTextParser()
+        >>> parser.feed('<p>Hi <a href="https://example.com">there</a></p>')
+        >>> parser.text()
+        'Hi there (https://example.com)'
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._chunks: list[str] = []
+        # Whether the last non-blank output ended a line, and whether the last
+        # output ended in a space
+        self._line_start = True
+        self._trailing_space = False
+        # Open elements, and the depth of the one whose content is dropped
+        self._open: list[str] = []
+        self._skip_depth: Optional[int] = None
+        self._pre_depth = 0
+        self._href: Optional[str] = None
+        self._link_text: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]):
+        if self._skip_depth is None and (tag in SKIPPED_TAGS or _is_hidden(attrs)):
+            if tag in VOID_TAGS:
+                return
+            self._skip_depth = len(self._open)
+        if tag not in VOID_TAGS:
+            self._open.append(tag)
+        if self._skip_depth is not None:
+            return
+
+        if tag == "br":
+            self._write("\n")
+        elif tag in BLOCK_TAGS:
+            self._newline()
+            if tag == "li":
+                self._write("- ")
+            elif tag == "hr":
+                self._write("---\n")
+        elif tag in ("td", "th") and not self._line_start:
+            self._write(" ")
+
+        if tag == "pre":
+            self._pre_depth += 1
+        elif tag == "a":
+            self._href = dict(attrs).get("href")
+            self._link_text = []
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, Optional[str]]]):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str):
+        # Closing an element also closes any children left open inside it
+        for depth in range(len(self._open) - 1, -1, -1):
+            if self._open[depth] == tag:
+                del self._open[depth:]
+                break
+        if self._skip_depth is not None:
+            if len(self._open) <= self._skip_depth:
+                self._skip_depth = None
+            return
+
+        if tag == "a" and self._href is not None:
+            self._close_link()
+        elif tag == "pre":
+            self._pre_depth = max(0, self._pre_depth - 1)
+
+        if tag in PARAGRAPH_TAGS:
+            self._write("\n\n")
+        elif tag in BLOCK_TAGS:
+            self._newline()
+
+    def handle_data(self, data: str):
+        if self._skip_depth is not None:
+            return
+        if not self._pre_depth:
+            data = _WHITESPACE.sub(" ", data)
+            # Whitespace collapses across elements too
+            if self._line_start or self._trailing_space:
+                data = data.lstrip(" ")
+                if not data:
+                    return
+        if self._href is not None:
+            self._link_text.append(data)
+        self._write(data)
+
+    def text(self) -> str:
+        """Close the parser and return the collected text."""
+        self.close()
+        lines = [line.rstrip() for line in "".join(self._chunks).split("\n")]
+        return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+    def _write(self, text: str):
+        self._chunks.append(text)
+        if text.strip(" "):
+            self._line_start = text.endswith("\n")
+        if text:
+            self._trailing_space = text.endswith(" ")
+
+    def _newline(self):
+        if not self._line_start:
+            self._write("\n")
+
+    def _close_link(self):
+        href, text = self._href, "".join(self._link_text).strip()
+        self._href, self._link_text = None, []
+        if not href or href.startswith(("#", "javascript:")):
+            return
+        url = href.removeprefix("mailto:")
+        if url != text:
+            self._write(f" ({url})" if text else url)
+
+
+def html_to_text(html: str) -> str:
+    """
+    Convert an HTML email body to readable plain text.
+
+    Args:
+        html: HTML document or fragment
+
+    Returns:
+        The readable text, with links as `text (url)`
+
+    Example:
+        >>> html_to_text("<style>p {color: red}</style><p>Hello<br>World</p>")
+        'Hello\\nWorld'
+    """
+    parser = HtmlToTextParser()
+    parser.feed(html)
+    return parser.text()
+
+
+def _is_hidden(attrs: list[tuple[str, Optional[str]]]) -> bool:
+    for name, value in attrs:
+        if name == "hidden":
+            return True
+        if name == "aria-hidden" and value == "true":
+            return True
+        if name == "style" and value and _HIDDEN_STYLE.search(value):
+            return True
+    return False
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Compact model of a Gmail API message.
+"""
+
+from typing import Optional
+
+from .get_email_body import get_email_body
+from .header_index import HeaderIndex
+
+BODY_MIME_TYPES = ("text/plain", "text/html")
+
+
+class ParsedMessage:
+    """
+    The parts of a Gmail API message the server uses, without the raw JSON.
+
+    Headers are indexed once, and of the payload only the base64 text bodies
+    are kept. The body is decoded on first access, HTML-only bodies converted
+    to plain text, after which the encoded data is released too.
+
+    Example:
+        >>> message = ParsedMessage.from_api(api_message)
+        >>> message.headers.get("subject")
+        'Hello'
+        >>> message.body
+        'Hello World'
+    """
+
+    __slots__ = (
+        "id",
+        "thread_id",
+        "label_ids",
+        "snippet",
+        "internal_date",
+        "headers",
+        "_body_source",
+        "_body",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        thread_id: str,
+        headers: HeaderIndex,
+        body_source: dict,
+        label_ids: tuple[str, ...] = (),
+        snippet: str = "",
+        internal_date: Optional[str] = None,
+    ):
+        self.id = id
+        self.thread_id = thread_id
+        self.headers = headers
+        self.label_ids = label_ids
+        self.snippet = snippet
+        self.internal_date = internal_date
+        self._body_source: Optional[dict] = body_source
+        self._body: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, message: dict) -> "ParsedMessage":
+        """
+        Parse a message returned by messages.get or threads.get.
+
+        Args:
+            message: Gmail API message object with 'id', 'threadId' and 'payload'
+
+        Returns:
+            A ParsedMessage that holds no reference to `message`
+        """
+        payload = message["payload"]
+        return cls(
+            id=message["id"],
+            thread_id=message["threadId"],
+            headers=HeaderIndex(payload["headers"]),
+            body_source=_prune_body_source(payload, top_level=True),
+            label_ids=tuple(message.get("labelIds", ())),
+            snippet=message.get("snippet", ""),
+            internal_date=message.get("internalDate"),
+        )
+
+    @property
+    def body(self) -> str:
+        """The decoded body text, preferring text/plain over text/html."""
+        if self._body is None:
+            self._body = get_email_body(self._body_source, html_as_text=True)
+            self._body_source = None
+        return self._body
+
+    def __repr__(self) -> str:
+        return f"ParsedMessage(id={self.id!r}, thread_id={self.thread_id!r})"
+
+
+def _prune_body_source(part: dict, top_level: bool = False) -> dict:
+    """
+    Copy only what get_email_body reads from a payload.
+
+    That is the top-level body data, the text/plain and text/html part bodies,
+    and the nesting between them. Headers, attachments and other parts are left
+    out.
+    """
+    pruned: dict = {}
+    body = part.get("body", {})
+    mime_type = part.get("mimeType", "")
+    if "data" in body and (top_level or mime_type in BODY_MIME_TYPES):
+        pruned["mimeType"] = mime_type
+        pruned["body"] = {"data": body["data"]}
+
+    if "parts" in part:
+        parts = [_prune_body_source(child) for child in part["parts"]]
+        parts = [child for child in parts if child]
+        if parts:
+            pruned["parts"] = parts
+    return pruned
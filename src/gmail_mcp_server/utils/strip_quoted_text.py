@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Quoted-reply and signature removal for email bodies.
+"""
+
+import re
+from typing import NamedTuple
+
+# "On Mon, 1 Jan 2024 at 12:00, Jane <jane@example.com> wrote:", possibly
+# wrapped over two lines
+_ATTRIBUTION = re.compile(r"^On\s.*\bwrote:$")
+_ATTRIBUTION_START = re.compile(r"^On\s")
+_ATTRIBUTION_END = re.compile(r"\bwrote:$")
+# Everything after these belongs to an earlier message
+_HISTORY_MARKER = re.compile(
+    r"^-{2,}\s*(Original Message|Forwarded message)\s*-{2,}$", re.IGNORECASE
+)
+_OUTLOOK_FROM = re.compile(r"^From:\s")
+_OUTLOOK_SENT = re.compile(r"^(Sent|Date):\s")
+_SIGNATURE_DELIMITER = {"--", "-- "}
+_MOBILE_SIGNATURE = re.compile(
+    r"^(Sent from my \w+|Sent from (Mail|Outlook) for \w+|Get Outlook for \w+)",
+    re.IGNORECASE,
+)
+_SEPARATOR = re.compile(r"^[\s_\-=*]*$")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+# Text without any of these has nothing to strip
+_HINTS = (">", "wrote:", "--", "From:", "Sent from", "Get Outlook")
+
+
+class StrippedText(NamedTuple):
+    text: str
+    removed_bytes: int
+
+
+def strip_quoted_text(text: str) -> StrippedText:
+    """
+    Remove quoted replies, forwarded history and signatures from a body.
+
+    Works line by line:
+    - `>` quoted lines and their "On ... wrote:" attribution are dropped
+    - everything from an unquoted attribution, an "Original Message" or
+      "Forwarded message" separator, an Outlook "From:/Sent:" header or a
+      "-- " signature delimiter onwards is dropped
+    - "Sent from my iPhone" style lines are dropped
+
+    If nothing would be left, the text is returned unchanged.
+
+    Args:
+        text: Plain-text email body
+
+    Returns:
+        The reduced text and how many UTF-8 bytes were removed
+
+    Example:
+        >>> strip_quoted_text("Sounds good.\\n\\nOn Mon, Jane wrote:\\n> Lunch?")
+        StrippedText(text='Sounds good.', removed_bytes=30)
+    """
+    if not any(hint in text for hint in _HINTS):
+        return StrippedText(text, 0)
+
+    lines = text.split("\n")
+    kept: list[str] = []
+    index = 0
+    while index < len(lines):
+        line = lines[index].strip()
+
+        if line.startswith(">") or _MOBILE_SIGNATURE.match(line):
+            index += 1
+            continue
+
+        attribution_lines = _attribution_length(lines, index)
+        if attribution_lines:
+            after = _next_non_blank(lines, index + attribution_lines)
+            if after < len(lines) and lines[after].lstrip().startswith(">"):
+                # Inline reply: drop only the attribution and the quoted lines
+                index = after
+                continue
+            break
+
+        if (
+            line in _SIGNATURE_DELIMITER
+            or lines[index] in _SIGNATURE_DELIMITER
+            or _HISTORY_MARKER.match(line)
+            or _is_outlook_header(lines, index)
+        ):
+            break
+
+        kept.append(lines[index])
+        index += 1
+
+    while kept and _SEPARATOR.match(kept[-1]):
+        kept.pop()
+    reduced = _BLANK_LINES.sub("\n\n", "\n".join(kept)).strip("\n")
+    if not reduced.strip():
+        return StrippedText(text, 0)
+    return StrippedText(reduced, len(text.encode()) - len(reduced.encode()))
+
+
+def _attribution_length(lines: list[str], index: int) -> int:
+    """Return how many lines an attribution at `index` spans (0 if none)."""
+    line = lines[index].strip()
+    if not _ATTRIBUTION_START.match(line):
+        return 0
+    if _ATTRIBUTION.match(line):
+        return 1
+    if index + 1 < len(lines) and _ATTRIBUTION_END.search(lines[index + 1].strip()):
+        return 2
+    return 0
+
+
+def _is_outlook_header(lines: list[str], index: int) -> bool:
+    return (
+        _OUTLOOK_FROM.match(lines[index].strip()) is not None
+        and index + 1 < len(lines)
+        and _OUTLOOK_SENT.match(lines[index + 1].strip()) is not None
+    )
+
+
+def _next_non_blank(lines: list[str], index: int) -> int:
+    while index < len(lines) and not lines[index].strip():
+        index += 1
+    return index
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Text truncation on clean boundaries.
+"""
+
+# Preferred places to cut, best first
+BOUNDARIES = ("\n\n", "\n", ". ", "! ", "? ", " ")
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """
+    Return the start of `text`, at most `max_chars` long, ending on a clean boundary.
+
+    The cut is made after the last paragraph break, line break, sentence end or
+    space that keeps at least half of the budget, in that order of preference.
+    Text without any such boundary is cut at exactly `max_chars`. The returned
+    prefix keeps its trailing separator, so `len()` of it is the offset where
+    the rest of the text continues.
+
+    Args:
+        text: Text to shorten
+        max_chars: Maximum length of the result
+
+    Returns:
+        A prefix of `text`; `text` itself if it already fits
+
+    Example:
+        >>> truncate_text("First sentence. Second sentence.", 20)
+        'First sentence. '
+    """
+    if len(text) <= max_chars:
+        return text
+    if max_chars <= 0:
+        return ""
+
+    window = text[:max_chars]
+    for boundary in BOUNDARIES:
+        cut = window.rfind(boundary)
+        if cut >= max_chars // 2:
+            return window[: cut + len(boundary)]
+    return window
@@ -3,15 +3,93 @@ Pytest configuration and shared fixtures.
 """
 
 import base64
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from googleapiclient.errors import HttpError
+
+from gmail_mcp_server.services import (
+    calendar_list_cache,
+    drive_export_cache,
+    freebusy_cache,
+    google_oauth_credentials_manager,
+    google_service_registry,
+    label_stats_cache,
+    message_cache,
+    metrics,
+    quota_scheduler,
+    unread_mailbox_sync,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_google_service_registry():
+    """Ensure every test starts without cached API clients, credentials, sync state or quota."""
+    google_service_registry.clear()
+    google_oauth_credentials_manager.reset()
+    unread_mailbox_sync.reset()
+    drive_export_cache.clear()
+    calendar_list_cache.clear()
+    freebusy_cache.clear()
+    label_stats_cache.clear()
+    quota_scheduler.reset()
+    metrics.reset()
+    yield
+    google_service_registry.clear()
+    google_oauth_credentials_manager.reset()
+    unread_mailbox_sync.reset()
+    drive_export_cache.clear()
+    calendar_list_cache.clear()
+    freebusy_cache.clear()
+    label_stats_cache.clear()
+    quota_scheduler.reset()
+    metrics.reset()
+
+
+@pytest.fixture(autouse=True)
+def isolated_message_cache(tmp_path):
+    """Give every test its own empty on-disk message cache."""
+    message_cache.close()
+    with patch.object(message_cache, "path", tmp_path / "messages.sqlite3"):
+        yield message_cache
+        message_cache.close()
+
+
+class FakeBatchHttpRequest:
+    """
+    Stand-in for googleapiclient's BatchHttpRequest.
+
+    Executes each added request in order and reports the outcome through the
+    callbacks, the same way the real batch does after parsing the response.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        request_id = request_id or str(len(self.requests))
+        self.requests.append((request_id, request, callback or self.callback))
+
+    def execute(self, http=None):
+        for request_id, request, callback in self.requests:
+            try:
+                response, exception = request.execute(), None
+            except HttpError as e:
+                response, exception = None, e
+            if callback is not None:
+                callback(request_id, response, exception)
 
 
 @pytest.fixture
 def mock_gmail_service():
     """Mock Gmail API service."""
     service = MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback=None: (
+        FakeBatchHttpRequest(callback)
+    )
+    service.users().getProfile().execute.return_value = {"historyId": "1000"}
+    service.users().history().list().execute.return_value = {"historyId": "1000"}
     return service
 
 
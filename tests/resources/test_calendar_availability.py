@@ -2,6 +2,7 @@
 Tests for calendar availability resources module.
 """
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,6 +13,20 @@ from gmail_mcp_server.resources.calendar_availability import (
 )
 
 
+@pytest.fixture(autouse=True)
+def working_hours():
+    """Pin working hours so free slots do not depend on settings.toml."""
+    module = "gmail_mcp_server.resources.calendar_availability"
+    with (
+        patch(f"{module}.TIME_ZONE", "UTC"),
+        patch(f"{module}.WORKING_HOURS_START", "09:00"),
+        patch(f"{module}.WORKING_HOURS_END", "17:00"),
+        patch(f"{module}.WORKING_DAYS", ["mon", "tue", "wed", "thu", "fri"]),
+        patch(f"{module}.MIN_FREE_SLOT_MINUTES", 30),
+    ):
+        yield
+
+
 class TestGetCalendarAvailability:
     """Tests for get_calendar_availability function."""
 
@@ -59,12 +74,24 @@ class TestGetCalendarAvailability:
         )
 
         # Verify
-        assert "# Calendar Availability" in result
-        assert "My Calendar" in result
-        assert "Work Calendar" in result
-        assert "**Busy**" in result
-        assert "**Free**" in result
-        assert "2025-01-15T10:00:00Z to 2025-01-15T11:00:00Z" in result
+        availability = json.loads(result)
+        calendars = {cal["name"]: cal for cal in availability["calendars"]}
+        assert calendars["My Calendar"]["busy"] == [
+            {"start": "2025-01-15T10:00:00Z", "end": "2025-01-15T11:00:00Z"}
+        ]
+        assert calendars["Work Calendar"]["busy"] == []
+        assert availability["freeSlots"] == [
+            {
+                "start": "2025-01-15T09:00:00+00:00",
+                "end": "2025-01-15T10:00:00+00:00",
+                "minutes": 60,
+            },
+            {
+                "start": "2025-01-15T11:00:00+00:00",
+                "end": "2025-01-15T17:00:00+00:00",
+                "minutes": 360,
+            },
+        ]
 
         # Verify API calls
         mock_service.calendarList().list.assert_called_once()
@@ -174,10 +201,19 @@ class TestGetCalendarAvailability:
             "2025-01-15T09:00:00Z", "2025-01-15T17:00:00Z"
         )
 
-        assert "Calendar 1" in result
-        assert "Calendar 2" in result
-        assert result.count("**Free**") == 2
-        assert "**Busy**" not in result
+        availability = json.loads(result)
+        assert [cal["name"] for cal in availability["calendars"]] == [
+            "Calendar 1",
+            "Calendar 2",
+        ]
+        assert availability["busy"] == []
+        assert availability["freeSlots"] == [
+            {
+                "start": "2025-01-15T09:00:00+00:00",
+                "end": "2025-01-15T17:00:00+00:00",
+                "minutes": 480,
+            }
+        ]
 
     @pytest.mark.asyncio
     @patch(
@@ -222,10 +258,13 @@ class TestGetCalendarAvailability:
             "2025-01-15T09:00:00Z", "2025-01-15T18:00:00Z"
         )
 
-        assert "**Busy** - 3 busy period(s)" in result
-        assert "2025-01-15T10:00:00Z to 2025-01-15T11:00:00Z" in result
-        assert "2025-01-15T14:00:00Z to 2025-01-15T15:00:00Z" in result
-        assert "2025-01-15T16:00:00Z to 2025-01-15T17:00:00Z" in result
+        availability = json.loads(result)
+        assert len(availability["calendars"][0]["busy"]) == 3
+        assert [(slot["start"], slot["end"]) for slot in availability["freeSlots"]] == [
+            ("2025-01-15T09:00:00+00:00", "2025-01-15T10:00:00+00:00"),
+            ("2025-01-15T11:00:00+00:00", "2025-01-15T14:00:00+00:00"),
+            ("2025-01-15T15:00:00+00:00", "2025-01-15T16:00:00+00:00"),
+        ]
 
     @pytest.mark.asyncio
     @patch(
@@ -254,7 +293,7 @@ class TestGetCalendarAvailability:
         )
 
         # Should use calendar ID as fallback
-        assert "[email protected]" in result
+        assert json.loads(result)["calendars"][0]["name"] == "[email protected]"
 
     @pytest.mark.asyncio
     @patch(
@@ -279,8 +318,10 @@ class TestGetCalendarAvailability:
 
         result = await get_calendar_availability(start, end)
 
-        assert "# Calendar Availability" in result
-        assert f"**Time Range:** {start} to {end}" in result
+        availability = json.loads(result)
+        assert availability["timeMin"] == start
+        assert availability["timeMax"] == end
+        assert availability["timeZone"] == "UTC"
 
     @pytest.mark.asyncio
     @patch(
@@ -301,3 +342,70 @@ class TestGetCalendarAvailability:
             await get_calendar_availability(
                 "2025-01-15T09:00:00Z", "2025-01-15T17:00:00Z"
             )
+
+    @pytest.mark.asyncio
+    @patch(
+        "gmail_mcp_server.resources.calendar_availability.get_google_calendar_api_service"
+    )
+    async def test_reuses_cached_calendar_list(self, mock_get_service):
+        """Test that repeated reads list calendars only once."""
+        mock_service = Mock()
+        mock_calendar_list = Mock()
+        mock_calendar_list.execute.return_value = {
+            "items": [{"id": "primary", "summary": "My Calendar"}]
+        }
+        mock_service.calendarList().list.return_value = mock_calendar_list
+        mock_freebusy_query = Mock()
+        mock_freebusy_query.execute.return_value = {"calendars": {"primary": {}}}
+        mock_service.freebusy().query.return_value = mock_freebusy_query
+        mock_get_service.return_value = mock_service
+        mock_service.calendarList().list.reset_mock()
+
+        for _ in range(2):
+            result = await get_calendar_availability(
+                "2025-01-15T09:00:00Z", "2025-01-15T17:00:00Z"
+            )
+
+        assert json.loads(result)["calendars"][0]["name"] == "My Calendar"
+        mock_service.calendarList().list.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch(
+        "gmail_mcp_server.resources.calendar_availability.get_google_calendar_api_service"
+    )
+    async def test_merges_busy_periods_across_calendars(self, mock_get_service):
+        """Test that overlapping busy periods on different calendars block one slot."""
+        mock_service = Mock()
+        mock_calendar_list = Mock()
+        mock_calendar_list.execute.return_value = {
+            "items": [{"id": "cal1"}, {"id": "cal2"}]
+        }
+        mock_service.calendarList().list.return_value = mock_calendar_list
+        mock_freebusy_query = Mock()
+        mock_freebusy_query.execute.return_value = {
+            "calendars": {
+                "cal1": {
+                    "busy": [
+                        {"start": "2025-01-15T09:00:00Z", "end": "2025-01-15T12:00:00Z"}
+                    ]
+                },
+                "cal2": {
+                    "busy": [
+                        {"start": "2025-01-15T11:00:00Z", "end": "2025-01-15T16:45:00Z"}
+                    ]
+                },
+            }
+        }
+        mock_service.freebusy().query.return_value = mock_freebusy_query
+        mock_get_service.return_value = mock_service
+
+        result = await get_calendar_availability(
+            "2025-01-15T00:00:00Z", "2025-01-16T00:00:00Z"
+        )
+
+        availability = json.loads(result)
+        assert availability["busy"] == [
+            {"start": "2025-01-15T09:00:00+00:00", "end": "2025-01-15T16:45:00+00:00"}
+        ]
+        # The 15 minutes left before 17:00 is shorter than the minimum slot
+        assert availability["freeSlots"] == []
@@ -9,6 +9,7 @@ import pytest
 from gmail_mcp_server.resources.email_guidelines import (
     GoogleDriveAPIError,
     get_email_guidelines,
+    preload_email_guidelines,
 )
 
 
@@ -110,3 +111,21 @@ class TestGetEmailGuidelines:
         mock_service.files().export.assert_called_with(
             fileId="test_doc_id", mimeType="text/markdown"
         )
+
+
+class TestPreloadEmailGuidelines:
+    """Tests for preload_email_guidelines function."""
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.resources.email_guidelines.get_email_guidelines")
+    async def test_preloads_every_guideline(self, mock_get_guidelines):
+        """Test that every guideline is fetched and failures are swallowed."""
+        mock_get_guidelines.side_effect = [b"a", RuntimeError("boom"), b"c"]
+
+        await preload_email_guidelines()
+
+        assert [c.args[0] for c in mock_get_guidelines.call_args_list] == [
+            "7cs",
+            "directive",
+            "email_templates",
+        ]
@@ -0,0 +1,31 @@
+"""
+Tests for the server metrics resource.
+"""
+
+import json
+
+import pytest
+
+from gmail_mcp_server.resources.server_metrics import get_server_metrics
+from gmail_mcp_server.services import metrics
+
+
+class TestGetServerMetrics:
+    """Tests for get_server_metrics function."""
+
+    @pytest.mark.asyncio
+    async def test_returns_metrics_snapshot_as_json(self):
+        """Test that the resource serialises the current metrics."""
+        metrics.increment("quota.gmail.units", 5)
+        metrics.add_to_gauge("quota.gmail.queue_depth", 2)
+        metrics.observe("quota.gmail.wait_seconds", 0.25)
+
+        result = json.loads(await get_server_metrics())
+
+        assert result == {
+            "counters": {"quota.gmail.units": 5},
+            "gauges": {"quota.gmail.queue_depth": 2},
+            "timings": {
+                "quota.gmail.wait_seconds": {"count": 1, "total": 0.25, "max": 0.25}
+            },
+        }
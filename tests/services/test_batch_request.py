@@ -0,0 +1,141 @@
+"""
+Tests for the batch request helper.
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from gmail_mcp_server.services.batch_request import execute_batch
+
+
+def _request(*outcomes, method="GET"):
+    """Build a mock request whose execute() yields the given outcomes in turn."""
+    request = MagicMock()
+    request.method = method
+    request.execute.side_effect = list(outcomes)
+    return request
+
+
+def _http_error(status, content=b"error"):
+    return HttpError(resp=Mock(status=status, reason="error"), content=content)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay():
+    with patch("gmail_mcp_server.services.batch_request.asyncio.sleep"):
+        yield
+
+
+class TestExecuteBatch:
+    """Tests for execute_batch function."""
+
+    @pytest.mark.asyncio
+    async def test_returns_responses_in_request_order(self, mock_gmail_service):
+        """Test that responses line up with the input requests."""
+        requests = [_request({"id": f"msg{i}"}) for i in range(5)]
+
+        results = await execute_batch(mock_gmail_service, requests)
+
+        assert results == [{"id": f"msg{i}"} for i in range(5)]
+        mock_gmail_service.new_batch_http_request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_splits_large_request_lists_into_chunks(self, mock_gmail_service):
+        """Test that requests are split into batches of batch_size."""
+        requests = [_request({"id": i}) for i in range(250)]
+
+        results = await execute_batch(mock_gmail_service, requests, batch_size=100)
+
+        assert mock_gmail_service.new_batch_http_request.call_count == 3
+        assert results == [{"id": i} for i in range(250)]
+
+    @pytest.mark.asyncio
+    async def test_caps_batch_size_at_api_limit(self, mock_gmail_service):
+        """Test that batch_size above 100 is capped."""
+        requests = [_request({"id": i}) for i in range(150)]
+
+        await execute_batch(mock_gmail_service, requests, batch_size=500)
+
+        assert mock_gmail_service.new_batch_http_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_only_failed_sub_requests(self, mock_gmail_service):
+        """Test that only sub-requests with transient errors are resent."""
+        succeeded = _request({"id": "ok"})
+        flaky = _request(_http_error(429), {"id": "flaky"})
+
+        results = await execute_batch(mock_gmail_service, [succeeded, flaky])
+
+        assert results == [{"id": "ok"}, {"id": "flaky"}]
+        assert succeeded.execute.call_count == 1
+        assert flaky.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_permanent_errors(self, mock_gmail_service):
+        """Test that non-retryable errors are raised without retrying."""
+        missing = _request(_http_error(404), {"id": "never"})
+
+        with pytest.raises(HttpError):
+            await execute_batch(mock_gmail_service, [missing])
+
+        assert missing.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_non_idempotent_sub_requests(self, mock_gmail_service):
+        """Test that a failed POST is not resent, since it may have been applied."""
+        create = _request(_http_error(503), {"id": "twice"}, method="POST")
+
+        with pytest.raises(HttpError):
+            await execute_batch(mock_gmail_service, [create])
+
+        assert create.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_retry_after(self, mock_gmail_service):
+        """Test that the retry waits as long as the failures ask."""
+        error = HttpError(
+            resp=httplib2.Response({"status": 429, "retry-after": "7"}),
+            content=b"error",
+        )
+        flaky = _request(error, {"id": "flaky"})
+
+        with patch(
+            "gmail_mcp_server.services.batch_request.asyncio.sleep"
+        ) as mock_sleep:
+            await execute_batch(mock_gmail_service, [flaky])
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, mock_gmail_service):
+        """Test that retries stop after max_attempts."""
+        failing = _request(*[_http_error(503)] * 5)
+
+        with pytest.raises(HttpError):
+            await execute_batch(mock_gmail_service, [failing], max_attempts=3)
+
+        assert failing.execute.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_returns_exceptions_in_place(self, mock_gmail_service):
+        """Test that return_exceptions keeps failures alongside successes."""
+        error = _http_error(404)
+        requests = [_request({"id": "ok"}), _request(error)]
+
+        results = await execute_batch(
+            mock_gmail_service, requests, return_exceptions=True
+        )
+
+        assert results[0] == {"id": "ok"}
+        assert results[1] is error
+
+    @pytest.mark.asyncio
+    async def test_handles_empty_request_list(self, mock_gmail_service):
+        """Test that no batch is sent for an empty request list."""
+        results = await execute_batch(mock_gmail_service, [])
+
+        assert results == []
+        mock_gmail_service.new_batch_http_request.assert_not_called()
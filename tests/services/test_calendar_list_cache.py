@@ -0,0 +1,121 @@
+"""
+Tests for the calendar list cache.
+"""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from gmail_mcp_server.services.calendar_list_cache import (
+    CALENDAR_LIST_FIELDS,
+    CalendarListCache,
+)
+
+
+def _calendar_service(*responses):
+    service = MagicMock()
+    service.calendarList().list().execute.side_effect = list(responses)
+    service.calendarList().list.reset_mock()
+    return service
+
+
+class TestCalendarListCache:
+    """Tests for CalendarListCache class."""
+
+    @pytest.mark.asyncio
+    async def test_indexes_names_by_id(self):
+        """Test that calendars are indexed by ID, falling back to the ID."""
+        service = _calendar_service(
+            {"items": [{"id": "primary", "summary": "Me"}, {"id": "shared"}]}
+        )
+
+        names = await CalendarListCache().get_calendar_names(service)
+
+        assert names == {"primary": "Me", "shared": "shared"}
+
+    @pytest.mark.asyncio
+    async def test_follows_next_page_token(self):
+        """Test that every page of the calendar list is read."""
+        service = _calendar_service(
+            {"items": [{"id": "a", "summary": "A"}], "nextPageToken": "page2"},
+            {"items": [{"id": "b", "summary": "B"}], "nextSyncToken": "sync1"},
+        )
+
+        names = await CalendarListCache().get_calendar_names(service)
+
+        assert list(names) == ["a", "b"]
+        service.calendarList().list.assert_called_with(
+            maxResults=250, fields=CALENDAR_LIST_FIELDS, pageToken="page2"
+        )
+
+    @pytest.mark.asyncio
+    async def test_serves_cache_within_ttl(self):
+        """Test that reads within the TTL make no API calls."""
+        service = _calendar_service({"items": [{"id": "a", "summary": "A"}]})
+        cache = CalendarListCache(ttl_seconds=300)
+        await cache.get_calendar_names(service)
+
+        await cache.get_calendar_names(service)
+
+        service.calendarList().list.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refreshes_with_sync_token(self):
+        """Test that refreshes after the TTL apply incremental changes."""
+        service = _calendar_service(
+            {
+                "items": [{"id": "a", "summary": "A"}, {"id": "b", "summary": "B"}],
+                "nextSyncToken": "sync1",
+            },
+            {
+                "items": [
+                    {"id": "a", "deleted": True},
+                    {"id": "b", "summary": "Renamed"},
+                    {"id": "c", "summary": "C"},
+                    {"id": "d", "summary": "D", "hidden": True},
+                ],
+                "nextSyncToken": "sync2",
+            },
+        )
+        cache = CalendarListCache(ttl_seconds=0)
+        await cache.get_calendar_names(service)
+
+        names = await cache.get_calendar_names(service)
+
+        assert names == {"b": "Renamed", "c": "C"}
+        service.calendarList().list.assert_called_with(
+            maxResults=250, fields=CALENDAR_LIST_FIELDS, syncToken="sync1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_relists_when_sync_token_expired(self):
+        """Test that a 410 on the sync token triggers a full listing."""
+        service = _calendar_service(
+            {"items": [{"id": "a", "summary": "A"}], "nextSyncToken": "sync1"},
+            HttpError(resp=Mock(status=410, reason="Gone"), content=b"Gone"),
+            {"items": [{"id": "z", "summary": "Z"}], "nextSyncToken": "sync2"},
+        )
+        cache = CalendarListCache(ttl_seconds=0)
+        await cache.get_calendar_names(service)
+
+        names = await cache.get_calendar_names(service)
+
+        assert names == {"z": "Z"}
+        service.calendarList().list.assert_called_with(
+            maxResults=250, fields=CALENDAR_LIST_FIELDS
+        )
+
+    @pytest.mark.asyncio
+    async def test_keeps_returned_mapping_unchanged_on_refresh(self):
+        """Test that a refresh does not mutate a mapping already handed out."""
+        service = _calendar_service(
+            {"items": [{"id": "a", "summary": "A"}], "nextSyncToken": "sync1"},
+            {"items": [{"id": "a", "deleted": True}], "nextSyncToken": "sync2"},
+        )
+        cache = CalendarListCache(ttl_seconds=0)
+        first = await cache.get_calendar_names(service)
+
+        await cache.get_calendar_names(service)
+
+        assert first == {"a": "A"}
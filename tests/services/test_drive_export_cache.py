@@ -0,0 +1,112 @@
+"""
+Tests for the Drive export cache.
+"""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from gmail_mcp_server.services.drive_export_cache import DriveExportCache
+
+
+def _drive_service(*revisions, content=b"# Guideline"):
+    service = MagicMock()
+    service.files().get().execute.side_effect = [
+        {"version": version, "modifiedTime": f"2025-01-0{version}T00:00:00Z"}
+        for version in revisions
+    ]
+    service.files().export().execute.return_value = content
+    service.files().get.reset_mock()
+    service.files().export.reset_mock()
+    return service
+
+
+class TestDriveExportCache:
+    """Tests for DriveExportCache class."""
+
+    @pytest.mark.asyncio
+    async def test_exports_on_first_read(self):
+        """Test that the first read exports the file."""
+        service = _drive_service("1")
+
+        content = await DriveExportCache().export(service, "doc1", "text/markdown")
+
+        assert content == b"# Guideline"
+        service.files().export.assert_called_once_with(
+            fileId="doc1", mimeType="text/markdown"
+        )
+
+    @pytest.mark.asyncio
+    async def test_serves_cache_within_ttl(self):
+        """Test that reads within the TTL make no API calls."""
+        service = _drive_service("1")
+        cache = DriveExportCache(ttl_seconds=300)
+        await cache.export(service, "doc1", "text/markdown")
+
+        await cache.export(service, "doc1", "text/markdown")
+
+        assert service.files().get.call_count == 1
+        assert service.files().export.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_revalidates_unchanged_file_without_export(self):
+        """Test that an unchanged revision after the TTL skips the export."""
+        service = _drive_service("1", "1")
+        cache = DriveExportCache(ttl_seconds=0)
+        await cache.export(service, "doc1", "text/markdown")
+
+        await cache.export(service, "doc1", "text/markdown")
+
+        assert service.files().get.call_count == 2
+        assert service.files().export.call_count == 1
+        service.files().get.assert_called_with(
+            fileId="doc1", fields="modifiedTime,version"
+        )
+
+    @pytest.mark.asyncio
+    async def test_reexports_changed_file(self):
+        """Test that a new revision is exported again."""
+        service = _drive_service("1", "2")
+        cache = DriveExportCache(ttl_seconds=0)
+        await cache.export(service, "doc1", "text/markdown")
+        service.files().export().execute.return_value = b"# Updated"
+
+        content = await cache.export(service, "doc1", "text/markdown")
+
+        assert content == b"# Updated"
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_export_when_revalidation_fails(self):
+        """Test that a failed revalidation falls back to the cached export."""
+        service = _drive_service("1")
+        cache = DriveExportCache(ttl_seconds=0)
+        await cache.export(service, "doc1", "text/markdown")
+        service.files().get().execute.side_effect = HttpError(
+            resp=Mock(status=500, reason="Server Error"), content=b"Error"
+        )
+
+        assert await cache.export(service, "doc1", "text/markdown") == b"# Guideline"
+
+    @pytest.mark.asyncio
+    async def test_raises_when_nothing_cached(self):
+        """Test that errors propagate when there is no cached export."""
+        service = MagicMock()
+        service.files().get().execute.side_effect = HttpError(
+            resp=Mock(status=404, reason="Not Found"), content=b"Not found"
+        )
+
+        with pytest.raises(HttpError):
+            await DriveExportCache().export(service, "doc1", "text/markdown")
+
+    @pytest.mark.asyncio
+    async def test_clear_forces_export(self):
+        """Test that clear() drops cached exports."""
+        service = _drive_service("1", "1")
+        cache = DriveExportCache(ttl_seconds=300)
+        await cache.export(service, "doc1", "text/markdown")
+
+        cache.clear()
+        await cache.export(service, "doc1", "text/markdown")
+
+        assert service.files().export.call_count == 2
@@ -0,0 +1,223 @@
+"""
+Tests for split free/busy queries.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gmail_mcp_server.services.freebusy import (
+    _merge_busy_periods,
+    _split_time_range,
+    query_freebusy,
+)
+
+
+def _calendar_service(respond):
+    """Build a service whose freebusy query answers via respond(body)."""
+    service = MagicMock()
+    bodies = []
+
+    def _query(body):
+        bodies.append(body)
+        request = MagicMock()
+        request.execute.return_value = respond(body)
+        return request
+
+    service.freebusy().query.side_effect = _query
+    return service, bodies
+
+
+def _utc(day, hour=0):
+    return datetime(2025, 1, day, hour, tzinfo=timezone.utc)
+
+
+class TestQueryFreebusy:
+    """Tests for query_freebusy function."""
+
+    @pytest.mark.asyncio
+    async def test_small_query_is_sent_once(self):
+        """Test that a query within the limits is sent unchanged."""
+        service, bodies = _calendar_service(
+            lambda body: {"calendars": {"primary": {"busy": []}}}
+        )
+
+        result = await query_freebusy(
+            service, ["primary"], "2025-01-15T09:00:00Z", "2025-01-15T17:00:00Z"
+        )
+
+        assert result == {"primary": {"busy": []}}
+        assert bodies == [
+            {
+                "timeMin": "2025-01-15T09:00:00Z",
+                "timeMax": "2025-01-15T17:00:00Z",
+                "items": [{"id": "primary"}],
+            }
+        ]
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.services.freebusy.FREEBUSY_MAX_CALENDARS", 2)
+    async def test_splits_calendars_into_groups(self):
+        """Test that calendars are queried in groups of the maximum size."""
+        service, bodies = _calendar_service(
+            lambda body: {
+                "calendars": {item["id"]: {"busy": []} for item in body["items"]}
+            }
+        )
+
+        result = await query_freebusy(
+            service, ["a", "b", "c"], "2025-01-15T09:00:00Z", "2025-01-15T17:00:00Z"
+        )
+
+        assert [[i["id"] for i in body["items"]] for body in bodies] == [
+            ["a", "b"],
+            ["c"],
+        ]
+        assert list(result) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.services.freebusy.FREEBUSY_MAX_WINDOW_DAYS", 1)
+    async def test_merges_busy_periods_across_windows(self):
+        """Test that an event clipped at a window boundary is joined again."""
+        busy_by_window = {
+            "2025-01-01T00:00:00Z": [
+                {"start": "2025-01-01T23:00:00Z", "end": "2025-01-02T00:00:00Z"}
+            ],
+            "2025-01-02T00:00:00Z": [
+                {"start": "2025-01-02T00:00:00Z", "end": "2025-01-02T01:00:00Z"}
+            ],
+        }
+        service, bodies = _calendar_service(
+            lambda body: {
+                "calendars": {"primary": {"busy": busy_by_window[body["timeMin"]]}}
+            }
+        )
+
+        result = await query_freebusy(
+            service, ["primary"], "2025-01-01T00:00:00Z", "2025-01-03T00:00:00Z"
+        )
+
+        assert len(bodies) == 2
+        assert result["primary"]["busy"] == [
+            {"start": "2025-01-01T23:00:00Z", "end": "2025-01-02T01:00:00Z"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_keeps_calendar_errors(self):
+        """Test that per-calendar errors are passed through."""
+        errors = [{"domain": "global", "reason": "notFound"}]
+        service, _ = _calendar_service(
+            lambda body: {"calendars": {"gone": {"busy": [], "errors": errors}}}
+        )
+
+        result = await query_freebusy(
+            service, ["gone"], "2025-01-15T09:00:00Z", "2025-01-15T17:00:00Z"
+        )
+
+        assert result == {"gone": {"busy": [], "errors": errors}}
+
+    @pytest.mark.asyncio
+    async def test_sends_unparseable_range_as_given(self):
+        """Test that unparseable times are left for the API to judge."""
+        service, bodies = _calendar_service(lambda body: {"calendars": {}})
+
+        await query_freebusy(service, ["primary"], "soon", "later")
+
+        assert [(body["timeMin"], body["timeMax"]) for body in bodies] == [
+            ("soon", "later")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_answers_covered_range_from_cache(self):
+        """Test that a sub-range of an earlier query makes no API call."""
+        busy = [{"start": "2025-01-15T10:00:00Z", "end": "2025-01-15T11:00:00Z"}]
+        service, bodies = _calendar_service(
+            lambda body: {"calendars": {"primary": {"busy": busy}}}
+        )
+        await query_freebusy(
+            service, ["primary"], "2025-01-15T00:00:00Z", "2025-01-16T00:00:00Z"
+        )
+
+        result = await query_freebusy(
+            service, ["primary"], "2025-01-15T10:30:00Z", "2025-01-15T17:00:00Z"
+        )
+
+        assert len(bodies) == 1
+        assert result == {
+            "primary": {
+                "busy": [
+                    {"start": "2025-01-15T10:30:00Z", "end": "2025-01-15T11:00:00Z"}
+                ]
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_fetches_only_missing_sub_ranges(self):
+        """Test that a partly covered range queries only the uncovered part."""
+        service, bodies = _calendar_service(
+            lambda body: {"calendars": {"primary": {"busy": []}}}
+        )
+        await query_freebusy(
+            service, ["primary"], "2025-01-15T09:00:00Z", "2025-01-15T17:00:00Z"
+        )
+
+        await query_freebusy(
+            service, ["primary"], "2025-01-15T12:00:00Z", "2025-01-15T20:00:00Z"
+        )
+
+        assert (bodies[-1]["timeMin"], bodies[-1]["timeMax"]) == (
+            "2025-01-15T17:00:00Z",
+            "2025-01-15T20:00:00Z",
+        )
+
+    @pytest.mark.asyncio
+    async def test_does_not_cache_calendar_errors(self):
+        """Test that calendars reporting errors are queried again."""
+        errors = [{"domain": "global", "reason": "backendError"}]
+        service, bodies = _calendar_service(
+            lambda body: {"calendars": {"primary": {"busy": [], "errors": errors}}}
+        )
+
+        for _ in range(2):
+            await query_freebusy(
+                service, ["primary"], "2025-01-15T09:00:00Z", "2025-01-15T17:00:00Z"
+            )
+
+        assert len(bodies) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_calendars_makes_no_request(self):
+        """Test that an empty calendar list is not queried."""
+        service, bodies = _calendar_service(lambda body: {})
+
+        assert await query_freebusy(service, [], "a", "b") == {}
+        assert bodies == []
+
+
+class TestSplitTimeRange:
+    """Tests for _split_time_range function."""
+
+    @patch("gmail_mcp_server.services.freebusy.FREEBUSY_MAX_WINDOW_DAYS", 2)
+    def test_splits_into_consecutive_windows(self):
+        """Test that windows cover the range without gaps."""
+        windows = _split_time_range(_utc(1), _utc(6))
+
+        assert windows == [(_utc(1), _utc(3)), (_utc(3), _utc(5)), (_utc(5), _utc(6))]
+
+
+class TestMergeBusyPeriods:
+    """Tests for _merge_busy_periods function."""
+
+    def test_sorts_and_merges_overlaps(self):
+        """Test that overlapping periods are merged and the rest sorted."""
+        periods = [
+            {"start": "2025-01-01T14:00:00Z", "end": "2025-01-01T15:00:00Z"},
+            {"start": "2025-01-01T09:00:00Z", "end": "2025-01-01T11:00:00Z"},
+            {"start": "2025-01-01T10:00:00Z", "end": "2025-01-01T10:30:00Z"},
+        ]
+
+        assert _merge_busy_periods(periods) == [
+            {"start": "2025-01-01T09:00:00Z", "end": "2025-01-01T11:00:00Z"},
+            {"start": "2025-01-01T14:00:00Z", "end": "2025-01-01T15:00:00Z"},
+        ]
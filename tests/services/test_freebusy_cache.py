@@ -0,0 +1,82 @@
+"""
+Tests for the free/busy interval cache.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from gmail_mcp_server.services.freebusy_cache import FreeBusyCache
+
+
+def _utc(hour, minute=0):
+    return datetime(2025, 1, 15, hour, minute, tzinfo=timezone.utc)
+
+
+def _busy(start, end):
+    return {"start": f"2025-01-15T{start}:00Z", "end": f"2025-01-15T{end}:00Z"}
+
+
+class TestFreeBusyCache:
+    """Tests for FreeBusyCache class."""
+
+    def test_uncached_range_is_missing(self):
+        """Test that nothing is covered before anything is stored."""
+        cache = FreeBusyCache()
+
+        assert cache.missing("primary", _utc(9), _utc(17)) == [(_utc(9), _utc(17))]
+
+    def test_reports_gaps_between_segments(self):
+        """Test that only uncovered parts are reported missing."""
+        cache = FreeBusyCache()
+        cache.put("primary", _utc(10), _utc(12), [])
+        cache.put("primary", _utc(14), _utc(16), [])
+
+        assert cache.missing("primary", _utc(9), _utc(17)) == [
+            (_utc(9), _utc(10)),
+            (_utc(12), _utc(14)),
+            (_utc(16), _utc(17)),
+        ]
+
+    def test_coverage_is_per_calendar(self):
+        """Test that one calendar's coverage does not apply to another."""
+        cache = FreeBusyCache()
+        cache.put("primary", _utc(9), _utc(17), [])
+
+        assert cache.missing("primary", _utc(9), _utc(17)) == []
+        assert cache.missing("other", _utc(9), _utc(17)) == [(_utc(9), _utc(17))]
+
+    def test_get_busy_clips_to_range(self):
+        """Test that cached busy periods are clipped to the requested range."""
+        cache = FreeBusyCache()
+        cache.put("primary", _utc(9), _utc(17), [_busy("10:00", "12:00")])
+
+        assert cache.get_busy("primary", _utc(11), _utc(17)) == [
+            {"start": "2025-01-15T11:00:00Z", "end": "2025-01-15T12:00:00Z"}
+        ]
+
+    def test_newer_data_replaces_overlapping_segment(self):
+        """Test that storing a range overwrites what was known about it."""
+        cache = FreeBusyCache()
+        cache.put("primary", _utc(9), _utc(17), [_busy("10:00", "11:00")])
+
+        cache.put("primary", _utc(10), _utc(12), [])
+
+        assert cache.missing("primary", _utc(9), _utc(17)) == []
+        assert cache.get_busy("primary", _utc(9), _utc(17)) == []
+
+    def test_segments_expire(self):
+        """Test that coverage older than the TTL is treated as missing."""
+        cache = FreeBusyCache(ttl_seconds=60)
+        with patch("gmail_mcp_server.services.freebusy_cache.time.monotonic") as now:
+            now.return_value = 1000.0
+            cache.put("primary", _utc(9), _utc(17), [])
+            now.return_value = 1061.0
+
+            assert cache.missing("primary", _utc(9), _utc(17)) == [(_utc(9), _utc(17))]
+
+    def test_zero_ttl_disables_caching(self):
+        """Test that a TTL of zero stores nothing."""
+        cache = FreeBusyCache(ttl_seconds=0)
+        cache.put("primary", _utc(9), _utc(17), [])
+
+        assert cache.missing("primary", _utc(9), _utc(17)) == [(_utc(9), _utc(17))]
@@ -0,0 +1,46 @@
+"""
+Tests for Gmail partial-response field masks.
+"""
+
+from gmail_mcp_server.services.gmail_fields import (
+    MESSAGE_DISPLAY_FIELDS,
+    metadata_params,
+    part_fields,
+)
+
+
+class TestPartFields:
+    """Tests for part_fields function."""
+
+    def test_nests_parts_to_depth(self):
+        """Test that nested parts repeat the mask to the given depth."""
+        assert part_fields("mimeType", 3) == (
+            "mimeType,parts(mimeType,parts(mimeType,parts))"
+        )
+
+    def test_depth_one_returns_whole_parts(self):
+        """Test that the deepest level of parts is returned unmasked."""
+        assert part_fields("mimeType", 1) == "mimeType,parts"
+
+    def test_display_fields_exclude_attachment_metadata(self):
+        """Test that the display mask keeps bodies but not attachment details."""
+        assert "body/data" in MESSAGE_DISPLAY_FIELDS
+        assert "attachmentId" not in MESSAGE_DISPLAY_FIELDS
+        assert "filename" not in MESSAGE_DISPLAY_FIELDS
+
+
+class TestMetadataParams:
+    """Tests for metadata_params function."""
+
+    def test_builds_metadata_format(self):
+        """Test that the named headers are requested in metadata format."""
+        assert metadata_params(("Subject", "From")) == {
+            "format": "metadata",
+            "metadataHeaders": ["Subject", "From"],
+        }
+
+    def test_includes_fields_when_given(self):
+        """Test that a fields mask is passed through."""
+        params = metadata_params(["Subject"], fields="messages/id")
+
+        assert params["fields"] == "messages/id"
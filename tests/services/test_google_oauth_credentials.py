@@ -2,13 +2,41 @@
 Tests for Google OAuth credentials module.
 """
 
-from unittest.mock import Mock, mock_open, patch
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
 
 from gmail_mcp_server.services.google_oauth_credentials import (
+    GoogleOAuthCredentialsManager,
     get_google_oauth_credentials,
+    google_oauth_credentials_manager,
 )
 
 
+@pytest.fixture
+def token_file(tmp_path):
+    """Point the shared credentials manager at a temporary token file."""
+    path = tmp_path / "token.json"
+    with patch.object(google_oauth_credentials_manager, "token_file", path):
+        yield path
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _refreshing_to(creds, token_json):
+    """Make a mock refresh change what the credentials serialise to."""
+
+    def _refresh(request):
+        creds.valid = True
+        creds.to_json.return_value = token_json
+
+    return _refresh
+
+
 class TestGetGoogleOAuthCredentials:
     """Tests for get_google_oauth_credentials function."""
 
@@ -33,9 +61,25 @@ class TestGetGoogleOAuthCredentials:
     @patch(
         "gmail_mcp_server.services.google_oauth_credentials.Credentials.from_authorized_user_file"
     )
-    @patch("builtins.open", new_callable=mock_open)
+    def test_keeps_credentials_in_memory(self, mock_from_file, mock_exists):
+        """Test that the token file is only read once."""
+        mock_creds = Mock()
+        mock_creds.valid = True
+        mock_exists.return_value = True
+        mock_from_file.return_value = mock_creds
+
+        first = get_google_oauth_credentials()
+        second = get_google_oauth_credentials()
+
+        assert first is second
+        mock_from_file.assert_called_once()
+
+    @patch("gmail_mcp_server.services.google_oauth_credentials.os.path.exists")
+    @patch(
+        "gmail_mcp_server.services.google_oauth_credentials.Credentials.from_authorized_user_file"
+    )
     def test_refreshes_expired_credentials(
-        self, mock_file, mock_from_file, mock_exists
+        self, mock_from_file, mock_exists, token_file
     ):
         """Test refreshing expired credentials."""
         # Create expired credentials
@@ -43,25 +87,26 @@ class TestGetGoogleOAuthCredentials:
         expired_creds.valid = False
         expired_creds.expired = True
         expired_creds.refresh_token = "refresh_token"
-        expired_creds.to_json.return_value = '{"token": "refreshed"}'
+        expired_creds.to_json.return_value = '{"token": "expired"}'
+        expired_creds.refresh.side_effect = _refreshing_to(
+            expired_creds, '{"token": "refreshed"}'
+        )
 
         mock_exists.return_value = True
         mock_from_file.return_value = expired_creds
 
-        with patch.object(expired_creds, "refresh") as mock_refresh:
-            result = get_google_oauth_credentials()
+        result = get_google_oauth_credentials()
 
-            mock_refresh.assert_called_once()
-            assert result == expired_creds
-            mock_file.assert_called()
+        expired_creds.refresh.assert_called_once()
+        assert result == expired_creds
+        assert token_file.read_text() == '{"token": "refreshed"}'
 
     @patch("gmail_mcp_server.services.google_oauth_credentials.os.path.exists")
     @patch(
         "gmail_mcp_server.services.google_oauth_credentials.InstalledAppFlow.from_client_secrets_file"
     )
-    @patch("builtins.open", new_callable=mock_open)
     def test_creates_new_credentials_when_none_exist(
-        self, mock_file, mock_flow_constructor, mock_exists
+        self, mock_flow_constructor, mock_exists, token_file
     ):
         """Test creating new credentials when none exist."""
         mock_exists.return_value = False
@@ -75,7 +120,7 @@ class TestGetGoogleOAuthCredentials:
 
         assert result == new_creds
         mock_flow.run_local_server.assert_called_once()
-        mock_file.assert_called()
+        assert token_file.exists()
 
     @patch("gmail_mcp_server.services.google_oauth_credentials.os.path.exists")
     @patch(
@@ -84,9 +129,8 @@ class TestGetGoogleOAuthCredentials:
     @patch(
         "gmail_mcp_server.services.google_oauth_credentials.InstalledAppFlow.from_client_secrets_file"
     )
-    @patch("builtins.open", new_callable=mock_open)
     def test_creates_new_credentials_when_invalid_and_no_refresh_token(
-        self, mock_file, mock_flow_constructor, mock_from_file, mock_exists
+        self, mock_flow_constructor, mock_from_file, mock_exists, token_file
     ):
         """Test creating new credentials when existing creds are invalid with no refresh token."""
         invalid_creds = Mock()
@@ -115,36 +159,59 @@ class TestGetGoogleOAuthCredentials:
     @patch(
         "gmail_mcp_server.services.google_oauth_credentials.Credentials.from_authorized_user_file"
     )
-    @patch("builtins.open", new_callable=mock_open)
     def test_saves_credentials_after_refresh(
-        self, mock_file, mock_from_file, mock_exists
+        self, mock_from_file, mock_exists, token_file
     ):
         """Test that credentials are saved after refresh."""
         expired_creds = Mock()
         expired_creds.valid = False
         expired_creds.expired = True
         expired_creds.refresh_token = "refresh_token"
-        expired_creds.to_json.return_value = '{"token": "refreshed_token"}'
+        expired_creds.to_json.return_value = '{"token": "expired_token"}'
+        expired_creds.refresh.side_effect = _refreshing_to(
+            expired_creds, '{"token": "refreshed_token"}'
+        )
+
+        mock_exists.return_value = True
+        mock_from_file.return_value = expired_creds
+
+        get_google_oauth_credentials()
+
+        # Verify credentials JSON was written and no temp files remain
+        assert token_file.read_text() == '{"token": "refreshed_token"}'
+        assert [p.name for p in token_file.parent.iterdir()] == ["token.json"]
+
+    @patch("gmail_mcp_server.services.google_oauth_credentials.os.path.exists")
+    @patch(
+        "gmail_mcp_server.services.google_oauth_credentials.Credentials.from_authorized_user_file"
+    )
+    def test_does_not_rewrite_unchanged_token(
+        self, mock_from_file, mock_exists, token_file
+    ):
+        """Test that the token file is left alone when the token did not change."""
+        expired_creds = Mock()
+        expired_creds.valid = False
+        expired_creds.expired = True
+        expired_creds.refresh_token = "refresh_token"
+        expired_creds.to_json.return_value = '{"token": "same_token"}'
+        expired_creds.refresh.side_effect = _refreshing_to(
+            expired_creds, '{"token": "same_token"}'
+        )
 
         mock_exists.return_value = True
         mock_from_file.return_value = expired_creds
 
-        with patch.object(expired_creds, "refresh"):
-            get_google_oauth_credentials()
+        get_google_oauth_credentials()
 
-            # Verify file was opened for writing
-            mock_file.assert_called()
-            # Verify credentials JSON was written
-            handle = mock_file()
-            handle.write.assert_called_with('{"token": "refreshed_token"}')
+        expired_creds.refresh.assert_called_once()
+        assert not token_file.exists()
 
     @patch("gmail_mcp_server.services.google_oauth_credentials.os.path.exists")
     @patch(
         "gmail_mcp_server.services.google_oauth_credentials.InstalledAppFlow.from_client_secrets_file"
     )
-    @patch("builtins.open", new_callable=mock_open)
     def test_saves_credentials_after_oauth_flow(
-        self, mock_file, mock_flow_constructor, mock_exists
+        self, mock_flow_constructor, mock_exists, token_file
     ):
         """Test that credentials are saved after OAuth flow."""
         mock_exists.return_value = False
@@ -158,5 +225,91 @@ class TestGetGoogleOAuthCredentials:
         get_google_oauth_credentials()
 
         # Verify credentials were saved
-        handle = mock_file()
-        handle.write.assert_called_with('{"token": "oauth_token"}')
+        assert token_file.read_text() == '{"token": "oauth_token"}'
+
+
+class TestGoogleOAuthCredentialsManager:
+    """Tests for background refresh in GoogleOAuthCredentialsManager."""
+
+    def _manager_with(self, creds, tmp_path, margin=timedelta(minutes=5)):
+        manager = GoogleOAuthCredentialsManager(
+            token_file=tmp_path / "token.json", refresh_margin=margin
+        )
+        manager._credentials = creds
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_request(self, tmp_path):
+        """Test that concurrent callers wait on a single in-flight refresh."""
+        creds = Mock()
+        creds.valid = True
+        creds.expiry = _utcnow() + timedelta(minutes=1)
+        creds.to_json.return_value = '{"token": "old"}'
+
+        def _refresh(request):
+            creds.expiry = _utcnow() + timedelta(hours=1)
+            creds.to_json.return_value = '{"token": "new"}'
+
+        creds.refresh.side_effect = _refresh
+        manager = self._manager_with(creds, tmp_path)
+
+        results = await asyncio.gather(*(manager.refresh() for _ in range(5)))
+        manager.stop()
+
+        assert all(result is creds for result in results)
+        creds.refresh.assert_called_once()
+        assert (tmp_path / "token.json").read_text() == '{"token": "new"}'
+
+    @pytest.mark.asyncio
+    async def test_skips_refresh_when_not_due(self, tmp_path):
+        """Test that refresh is a no-op while the token is far from expiry."""
+        creds = Mock()
+        creds.valid = True
+        creds.expiry = _utcnow() + timedelta(hours=1)
+        manager = self._manager_with(creds, tmp_path)
+
+        await manager.refresh()
+        manager.stop()
+
+        creds.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_timer_refreshes_before_expiry(self, tmp_path):
+        """Test that the background timer refreshes ahead of expiry."""
+        creds = Mock()
+        creds.valid = True
+        # Already inside the refresh margin, so the timer fires immediately
+        creds.expiry = _utcnow() + timedelta(minutes=1)
+        creds.to_json.return_value = '{"token": "old"}'
+        refreshed = asyncio.Event()
+
+        def _refresh(request):
+            creds.expiry = _utcnow() + timedelta(hours=1)
+            creds.to_json.return_value = '{"token": "new"}'
+            loop.call_soon_threadsafe(refreshed.set)
+
+        loop = asyncio.get_running_loop()
+        creds.refresh.side_effect = _refresh
+        manager = self._manager_with(creds, tmp_path)
+
+        manager.get_credentials()
+        await asyncio.wait_for(refreshed.wait(), timeout=5)
+        # Let the refresh task finish and re-arm the timer
+        await asyncio.sleep(0.05)
+
+        assert manager._refresh_timer is not None
+        manager.stop()
+        creds.refresh.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_start_without_token_file_skips_oauth_flow(self, tmp_path):
+        """Test that start() never triggers the interactive flow."""
+        manager = GoogleOAuthCredentialsManager(token_file=tmp_path / "token.json")
+
+        with patch(
+            "gmail_mcp_server.services.google_oauth_credentials.InstalledAppFlow"
+        ) as mock_flow:
+            await manager.start()
+
+        mock_flow.from_client_secrets_file.assert_not_called()
+        assert manager._credentials is None
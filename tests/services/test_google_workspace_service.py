@@ -6,7 +6,9 @@ from unittest.mock import MagicMock, patch
 
 from gmail_mcp_server.services.google_workspace_service import (
     get_gmail_api_service,
+    get_google_calendar_api_service,
     get_google_drive_api_service,
+    google_service_registry,
 )
 
 
@@ -108,3 +110,91 @@ class TestGetGoogleDriveApiService:
 
         args, kwargs = mock_build.call_args
         assert kwargs["credentials"] == mock_credentials
+
+
+class TestGoogleWorkspaceServiceRegistry:
+    """Tests for process-wide caching of API service clients."""
+
+    @patch("gmail_mcp_server.services.google_workspace_service.build")
+    @patch(
+        "gmail_mcp_server.services.google_workspace_service.get_google_oauth_credentials"
+    )
+    def test_reuses_built_service(self, mock_get_creds, mock_build):
+        """Test that repeated calls return the same client without rebuilding."""
+        mock_get_creds.return_value = MagicMock(valid=True)
+
+        first = get_gmail_api_service()
+        second = get_gmail_api_service()
+
+        assert first is second
+        mock_build.assert_called_once()
+        mock_get_creds.assert_called_once()
+
+    @patch("gmail_mcp_server.services.google_workspace_service.build")
+    @patch(
+        "gmail_mcp_server.services.google_workspace_service.get_google_oauth_credentials"
+    )
+    def test_shares_credentials_across_apis(self, mock_get_creds, mock_build):
+        """Test that one credentials object is shared by all clients."""
+        mock_credentials = MagicMock(valid=True)
+        mock_get_creds.return_value = mock_credentials
+
+        get_gmail_api_service()
+        get_google_drive_api_service()
+        get_google_calendar_api_service()
+
+        mock_get_creds.assert_called_once()
+        assert mock_build.call_count == 3
+        for call in mock_build.call_args_list:
+            assert call.kwargs["credentials"] is mock_credentials
+
+    @patch("gmail_mcp_server.services.google_workspace_service.build")
+    @patch(
+        "gmail_mcp_server.services.google_workspace_service.get_google_oauth_credentials"
+    )
+    def test_rebuilds_when_credentials_change(self, mock_get_creds, mock_build):
+        """Test that invalid credentials are reloaded and clients rebuilt."""
+        stale_credentials = MagicMock(valid=True)
+        fresh_credentials = MagicMock(valid=True)
+        mock_get_creds.side_effect = [stale_credentials, fresh_credentials]
+
+        get_gmail_api_service()
+        stale_credentials.valid = False
+        get_gmail_api_service()
+
+        assert mock_get_creds.call_count == 2
+        assert mock_build.call_count == 2
+        assert mock_build.call_args.kwargs["credentials"] is fresh_credentials
+
+    @patch("gmail_mcp_server.services.google_workspace_service.build")
+    @patch(
+        "gmail_mcp_server.services.google_workspace_service.get_google_oauth_credentials"
+    )
+    @patch("gmail_mcp_server.services.google_workspace_service.configs")
+    def test_rebuilds_when_scopes_change(
+        self, mock_configs, mock_get_creds, mock_build
+    ):
+        """Test that a scope change invalidates cached clients."""
+        mock_get_creds.return_value = MagicMock(valid=True)
+        mock_configs.get.return_value = ["scope-a"]
+
+        get_gmail_api_service()
+        mock_configs.get.return_value = ["scope-a", "scope-b"]
+        get_gmail_api_service()
+
+        assert mock_build.call_count == 2
+
+    @patch("gmail_mcp_server.services.google_workspace_service.build")
+    @patch(
+        "gmail_mcp_server.services.google_workspace_service.get_google_oauth_credentials"
+    )
+    def test_clear_forces_rebuild(self, mock_get_creds, mock_build):
+        """Test that clearing the registry rebuilds clients on next use."""
+        mock_get_creds.return_value = MagicMock(valid=True)
+
+        get_gmail_api_service()
+        google_service_registry.clear()
+        get_gmail_api_service()
+
+        assert mock_build.call_count == 2
+        assert mock_get_creds.call_count == 2
@@ -0,0 +1,107 @@
+"""
+Tests for the label stats cache.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from gmail_mcp_server.services.gmail_fields import (
+    LABEL_LIST_FIELDS,
+    LABEL_STATS_FIELDS,
+)
+from gmail_mcp_server.services.label_stats_cache import LabelStatsCache
+
+
+def _label(label_id, unread=0, total=0):
+    return {
+        "id": label_id,
+        "name": label_id.title(),
+        "type": "system",
+        "messagesUnread": unread,
+        "messagesTotal": total,
+        "threadsUnread": unread,
+        "threadsTotal": total,
+    }
+
+
+def _mock_labels(service, *labels):
+    listed = dict.fromkeys(label["id"] for label in labels)
+    service.users().labels().list().execute.return_value = {
+        "labels": [{"id": label_id} for label_id in listed]
+    }
+    service.users().labels().get().execute.side_effect = list(labels)
+    service.users().labels().list.reset_mock()
+    service.users().labels().get.reset_mock()
+
+
+class TestLabelStatsCache:
+    """Tests for LabelStatsCache class."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_counts_for_every_label(self, mock_gmail_service):
+        """Test that each listed label is fetched once, in one batch."""
+        _mock_labels(mock_gmail_service, _label("INBOX", 3, 10), _label("UNREAD", 3, 3))
+
+        labels = await LabelStatsCache().get_label_stats(mock_gmail_service)
+
+        assert [label["id"] for label in labels] == ["INBOX", "UNREAD"]
+        assert labels[0]["messagesUnread"] == 3
+        mock_gmail_service.users().labels().list.assert_called_once_with(
+            userId="me", fields=LABEL_LIST_FIELDS
+        )
+        mock_gmail_service.users().labels().get.assert_any_call(
+            userId="me", id="INBOX", fields=LABEL_STATS_FIELDS
+        )
+        mock_gmail_service.new_batch_http_request.assert_called_once()
+        mock_gmail_service.users().messages().list.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_serves_cache_within_ttl(self, mock_gmail_service):
+        """Test that reads within the TTL make no API calls."""
+        _mock_labels(mock_gmail_service, _label("INBOX", 1, 1))
+        cache = LabelStatsCache(ttl_seconds=60)
+        first = await cache.get_label_stats(mock_gmail_service)
+
+        second = await cache.get_label_stats(mock_gmail_service)
+
+        assert second is first
+        mock_gmail_service.users().labels().list.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refreshes_after_ttl(self, mock_gmail_service):
+        """Test that expired counts are fetched again."""
+        _mock_labels(mock_gmail_service, _label("INBOX", 1, 1), _label("INBOX", 2, 2))
+        cache = LabelStatsCache(ttl_seconds=0)
+        await cache.get_label_stats(mock_gmail_service)
+
+        labels = await cache.get_label_stats(mock_gmail_service)
+
+        assert labels[0]["messagesUnread"] == 2
+        assert mock_gmail_service.users().labels().list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_labels_deleted_while_fetching(self, mock_gmail_service):
+        """Test that a label that 404s between list and get is left out."""
+        _mock_labels(mock_gmail_service, _label("INBOX"), _label("Label_1"))
+        mock_gmail_service.users().labels().get().execute.side_effect = [
+            _label("INBOX"),
+            HttpError(Mock(status=404), b"Not found"),
+        ]
+
+        labels = await LabelStatsCache().get_label_stats(mock_gmail_service)
+
+        assert [label["id"] for label in labels] == ["INBOX"]
+
+    @pytest.mark.asyncio
+    async def test_clear_forgets_counts(self, mock_gmail_service):
+        """Test that clear() forces a refresh."""
+        _mock_labels(mock_gmail_service, _label("INBOX"), _label("INBOX"))
+        cache = LabelStatsCache(ttl_seconds=60)
+        await cache.get_label_stats(mock_gmail_service)
+
+        cache.clear()
+        await cache.get_label_stats(mock_gmail_service)
+
+        assert mock_gmail_service.users().labels().list.call_count == 2
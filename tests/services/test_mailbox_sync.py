@@ -0,0 +1,333 @@
+"""
+Tests for the incremental unread mailbox sync.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from gmail_mcp_server.services.gmail_fields import HISTORY_FIELDS, MESSAGE_LIST_FIELDS
+from gmail_mcp_server.services.mailbox_sync import UnreadMailboxSync
+
+
+def _list_response(*message_ids, next_page_token=None):
+    response = {"messages": [{"id": message_id} for message_id in message_ids]}
+    if next_page_token:
+        response["nextPageToken"] = next_page_token
+    return response
+
+
+def _change(message_id, *label_ids, added=None):
+    change = {"message": {"id": message_id, "labelIds": list(label_ids)}}
+    if added is not None:
+        change["labelIds"] = list(added)
+    return change
+
+
+async def _collect(sync, service, limit):
+    return [
+        message_id
+        async for page in sync.iter_unread_message_id_pages(service, limit)
+        for message_id in page
+    ]
+
+
+@pytest.fixture
+def sync():
+    return UnreadMailboxSync()
+
+
+class TestUnreadMailboxSync:
+    """Tests for UnreadMailboxSync class."""
+
+    @pytest.mark.asyncio
+    async def test_first_call_performs_full_sync(self, sync, mock_gmail_service):
+        """Test that the first call lists the UNREAD label."""
+        messages = mock_gmail_service.users().messages()
+        messages.list().execute.return_value = _list_response("msg2", "msg1")
+
+        assert await _collect(sync, mock_gmail_service, 10) == ["msg2", "msg1"]
+        messages.list.assert_called_with(
+            userId="me",
+            labelIds=["UNREAD"],
+            maxResults=10,
+            fields=MESSAGE_LIST_FIELDS,
+        )
+        mock_gmail_service.users().history().list().execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_later_calls_replay_history(self, sync, mock_gmail_service):
+        """Test that later calls apply history instead of listing again."""
+        users = mock_gmail_service.users()
+        users.messages().list().execute.return_value = _list_response("msg2", "msg1")
+        await _collect(sync, mock_gmail_service, 10)
+        users.messages().list.reset_mock()
+        users.history().list().execute.return_value = {
+            "historyId": "1005",
+            "history": [
+                {"id": "1001", "messagesAdded": [_change("msg3", "UNREAD", "INBOX")]},
+                {"id": "1002", "labelsRemoved": [_change("msg1", "INBOX")]},
+                {"id": "1003", "messagesAdded": [_change("sent1", "SENT")]},
+            ],
+        }
+
+        assert await _collect(sync, mock_gmail_service, 10) == ["msg3", "msg2"]
+        users.messages().list.assert_not_called()
+        users.history().list.assert_called_with(
+            userId="me",
+            startHistoryId="1000",
+            maxResults=500,
+            fields=HISTORY_FIELDS,
+        )
+
+    @pytest.mark.asyncio
+    async def test_records_thread_ids(self, sync, mock_gmail_service):
+        """Test that listed and replayed messages keep their thread IDs."""
+        users = mock_gmail_service.users()
+        users.messages().list().execute.return_value = {
+            "messages": [{"id": "msg2", "threadId": "t1"}, {"id": "msg1"}]
+        }
+        first = [
+            page
+            async for page in sync.iter_unread_message_pages(mock_gmail_service, 10)
+        ]
+        change = _change("msg3", "UNREAD")
+        change["message"]["threadId"] = "t1"
+        users.history().list().execute.return_value = {
+            "historyId": "1001",
+            "history": [{"id": "1001", "messagesAdded": [change]}],
+        }
+
+        second = [
+            page
+            async for page in sync.iter_unread_message_pages(mock_gmail_service, 10)
+        ]
+
+        assert first == [{"msg2": "t1", "msg1": None}]
+        assert second == [{"msg3": "t1", "msg2": "t1", "msg1": None}]
+
+    @pytest.mark.asyncio
+    async def test_tracks_latest_history_id(self, sync, mock_gmail_service):
+        """Test that each sync starts from the historyId of the previous one."""
+        users = mock_gmail_service.users()
+        users.messages().list().execute.return_value = _list_response("msg1")
+        await _collect(sync, mock_gmail_service, 10)
+        users.history().list().execute.return_value = {"historyId": "1042"}
+        await _collect(sync, mock_gmail_service, 10)
+
+        await _collect(sync, mock_gmail_service, 10)
+
+        users.history().list.assert_called_with(
+            userId="me",
+            startHistoryId="1042",
+            maxResults=500,
+            fields=HISTORY_FIELDS,
+        )
+
+    @pytest.mark.asyncio
+    async def test_follows_history_pages(self, sync, mock_gmail_service):
+        """Test that every page of history is applied."""
+        users = mock_gmail_service.users()
+        users.messages().list().execute.return_value = _list_response("msg1")
+        await _collect(sync, mock_gmail_service, 10)
+        users.history().list().execute.side_effect = [
+            {
+                "history": [{"messagesAdded": [_change("msg2", "UNREAD")]}],
+                "nextPageToken": "page2",
+            },
+            {
+                "history": [{"messagesAdded": [_change("msg3", "UNREAD")]}],
+                "historyId": "1010",
+            },
+        ]
+
+        assert await _collect(sync, mock_gmail_service, 10) == ["msg3", "msg2", "msg1"]
+        users.history().list.assert_called_with(
+            userId="me",
+            startHistoryId="1000",
+            maxResults=500,
+            fields=HISTORY_FIELDS,
+            pageToken="page2",
+        )
+
+    @pytest.mark.asyncio
+    async def test_drops_deleted_spam_and_trashed_messages(
+        self, sync, mock_gmail_service
+    ):
+        """Test that deleted or hidden messages leave the unread index."""
+        users = mock_gmail_service.users()
+        users.messages().list().execute.return_value = _list_response(
+            "msg3", "msg2", "msg1"
+        )
+        await _collect(sync, mock_gmail_service, 10)
+        users.history().list().execute.return_value = {
+            "historyId": "1005",
+            "history": [
+                {"messagesDeleted": [{"message": {"id": "msg1"}}]},
+                {"labelsAdded": [_change("msg2", "UNREAD", "TRASH")]},
+                {"messagesAdded": [_change("spam1", "UNREAD", "SPAM")]},
+            ],
+        }
+
+        assert await _collect(sync, mock_gmail_service, 10) == ["msg3"]
+
+    @pytest.mark.asyncio
+    async def test_resyncs_when_history_expired(self, sync, mock_gmail_service):
+        """Test that a 404 from history.list triggers a full resync."""
+        users = mock_gmail_service.users()
+        users.messages().list().execute.side_effect = [
+            _list_response("msg1"),
+            _list_response("msg9"),
+        ]
+        await _collect(sync, mock_gmail_service, 10)
+        users.history().list().execute.side_effect = HttpError(
+            resp=Mock(status=404, reason="Not Found"), content=b"Not Found"
+        )
+
+        assert await _collect(sync, mock_gmail_service, 10) == ["msg9"]
+
+    @pytest.mark.asyncio
+    async def test_resyncs_when_older_message_becomes_unread(
+        self, sync, mock_gmail_service
+    ):
+        """Test that a message marked unread again is placed by date, not last."""
+        users = mock_gmail_service.users()
+        users.messages().list().execute.side_effect = [
+            _list_response("msg3", "msg2"),
+            _list_response("msg3", "msg2", "old1"),
+        ]
+        await _collect(sync, mock_gmail_service, 10)
+        users.history().list().execute.return_value = {
+            "historyId": "1001",
+            "history": [{"id": "1001", "labelsAdded": [_change("old1", "UNREAD")]}],
+        }
+
+        assert await _collect(sync, mock_gmail_service, 10) == ["msg3", "msg2", "old1"]
+        assert users.messages().list().execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_partial_index_resyncs_only_when_unread_added(
+        self, sync, mock_gmail_service
+    ):
+        """Test that relabelling unread mail past a partial index keeps the index."""
+        users = mock_gmail_service.users()
+        users.messages().list().execute.side_effect = [
+            _list_response("msg3", "msg2", next_page_token="more"),
+            _list_response("msg3", "old1", "msg2"),
+        ]
+        await _collect(sync, mock_gmail_service, 2)
+        users.history().list().execute.side_effect = [
+            {
+                "historyId": "1001",
+                "history": [
+                    {
+                        "id": "1001",
+                        "labelsAdded": [
+                            _change("old1", "UNREAD", "STARRED", added=["STARRED"])
+                        ],
+                    }
+                ],
+            },
+            {
+                "historyId": "1002",
+                "history": [
+                    {
+                        "id": "1002",
+                        "labelsAdded": [_change("old1", "UNREAD", added=["UNREAD"])],
+                    }
+                ],
+            },
+        ]
+
+        assert await _collect(sync, mock_gmail_service, 2) == ["msg3", "msg2"]
+        assert users.messages().list().execute.call_count == 1
+
+        assert await _collect(sync, mock_gmail_service, 2) == ["msg3", "old1"]
+        assert users.messages().list().execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_propagates_other_history_errors(self, sync, mock_gmail_service):
+        """Test that history errors other than 404 are raised."""
+        users = mock_gmail_service.users()
+        users.messages().list().execute.return_value = _list_response("msg1")
+        await _collect(sync, mock_gmail_service, 10)
+        users.history().list().execute.side_effect = HttpError(
+            resp=Mock(status=500, reason="Server Error"), content=b"Error"
+        )
+
+        with pytest.raises(HttpError):
+            await _collect(sync, mock_gmail_service, 10)
+
+    @pytest.mark.asyncio
+    async def test_resyncs_when_index_too_shallow(self, sync, mock_gmail_service):
+        """Test that a larger limit than the partial index lists again."""
+        messages = mock_gmail_service.users().messages()
+        messages.list().execute.side_effect = [
+            _list_response("msg3", next_page_token="more"),
+            _list_response("msg3", "msg2", "msg1"),
+        ]
+        assert await _collect(sync, mock_gmail_service, 1) == ["msg3"]
+
+        assert await _collect(sync, mock_gmail_service, 3) == ["msg3", "msg2", "msg1"]
+
+    @pytest.mark.asyncio
+    async def test_updates_cached_labels(
+        self, sync, mock_gmail_service, isolated_message_cache
+    ):
+        """Test that label changes and deletions reach the message cache."""
+        isolated_message_cache.put_many(
+            {
+                "msg1": {"id": "msg1", "historyId": "900", "labelIds": ["UNREAD"]},
+                "msg2": {"id": "msg2", "historyId": "900", "labelIds": ["UNREAD"]},
+            }
+        )
+        users = mock_gmail_service.users()
+        users.messages().list().execute.return_value = _list_response("msg2", "msg1")
+        await _collect(sync, mock_gmail_service, 10)
+        users.history().list().execute.return_value = {
+            "historyId": "1005",
+            "history": [
+                {"id": "1001", "labelsRemoved": [_change("msg1", "INBOX")]},
+                {"id": "1002", "messagesDeleted": [{"message": {"id": "msg2"}}]},
+            ],
+        }
+
+        await _collect(sync, mock_gmail_service, 10)
+
+        cached = isolated_message_cache.get_many(["msg1", "msg2"])
+        assert cached == {
+            "msg1": {"id": "msg1", "historyId": "1001", "labelIds": ["INBOX"]}
+        }
+
+    @pytest.mark.asyncio
+    async def test_cache_writes_run_off_the_event_loop(
+        self, sync, mock_gmail_service, isolated_message_cache
+    ):
+        """Test that a history page is written to the cache in one worker call."""
+        users = mock_gmail_service.users()
+        users.messages().list().execute.return_value = _list_response("msg2", "msg1")
+        await _collect(sync, mock_gmail_service, 10)
+        users.history().list().execute.return_value = {
+            "historyId": "1005",
+            "history": [
+                {"id": "1001", "labelsRemoved": [_change("msg1", "INBOX")]},
+                {"id": "1002", "messagesDeleted": [{"message": {"id": "msg2"}}]},
+            ],
+        }
+        threads = []
+        connect = isolated_message_cache._connect
+
+        def record_thread():
+            threads.append(threading.current_thread())
+            return connect()
+
+        with patch.object(
+            isolated_message_cache, "_connect", side_effect=record_thread
+        ):
+            await _collect(sync, mock_gmail_service, 10)
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+        assert len(set(threads)) == 1
@@ -0,0 +1,137 @@
+"""
+Tests for the persistent message cache.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from gmail_mcp_server.services.message_cache import MessageCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = MessageCache(path=tmp_path / "messages.sqlite3")
+    yield cache
+    cache.close()
+
+
+def _message(message_id, history_id="100", body="body"):
+    return {
+        "id": message_id,
+        "threadId": f"thread_{message_id}",
+        "historyId": history_id,
+        "labelIds": ["UNREAD", "INBOX"],
+        "payload": {"headers": [], "body": {"data": body}},
+    }
+
+
+class TestMessageCache:
+    """Tests for MessageCache."""
+
+    def test_returns_stored_messages(self, cache):
+        """Test that stored messages are returned by ID."""
+        cache.put_many({"m1": _message("m1"), "m2": _message("m2")})
+
+        result = cache.get_many(["m1", "m2", "m3"])
+
+        assert result == {"m1": _message("m1"), "m2": _message("m2")}
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that cached messages survive reopening the database."""
+        path = tmp_path / "messages.sqlite3"
+        first = MessageCache(path=path)
+        first.put_many({"m1": _message("m1")})
+        first.close()
+
+        second = MessageCache(path=path)
+        try:
+            assert second.get_many(["m1"]) == {"m1": _message("m1")}
+        finally:
+            second.close()
+
+    def test_keeps_newer_history_id(self, cache):
+        """Test that an older copy never replaces a newer one."""
+        cache.put_many({"m1": _message("m1", history_id="200", body="new")})
+        cache.put_many({"m1": _message("m1", history_id="100", body="old")})
+
+        assert cache.get_many(["m1"])["m1"]["historyId"] == "200"
+
+    def test_update_labels_applies_newer_changes(self, cache):
+        """Test that label changes with a newer historyId are applied."""
+        cache.put_many({"m1": _message("m1", history_id="100")})
+
+        cache.update_labels("m1", ["INBOX"], "150")
+        cache.update_labels("m1", ["UNREAD", "INBOX"], "120")
+
+        message = cache.get_many(["m1"])["m1"]
+        assert message["labelIds"] == ["INBOX"]
+        assert message["historyId"] == "150"
+
+    def test_update_labels_ignores_unknown_messages(self, cache):
+        """Test that label changes for uncached messages are ignored."""
+        cache.update_labels("missing", ["INBOX"], "150")
+
+        assert cache.get_many(["missing"]) == {}
+
+    def test_invalidate_removes_messages(self, cache):
+        """Test that invalidated messages are no longer served."""
+        cache.put_many({"m1": _message("m1"), "m2": _message("m2")})
+
+        cache.invalidate(["m1"])
+
+        assert set(cache.get_many(["m1", "m2"])) == {"m2"}
+
+    def test_evicts_least_recently_used_by_entry_count(self, tmp_path):
+        """Test that the least recently read entry is evicted first."""
+        cache = MessageCache(path=tmp_path / "messages.sqlite3", max_entries=2)
+        try:
+            cache.put_many({"m1": _message("m1")})
+            cache.put_many({"m2": _message("m2")})
+            cache.get_many(["m1"])
+            cache.put_many({"m3": _message("m3")})
+
+            assert set(cache.get_many(["m1", "m2", "m3"])) == {"m1", "m3"}
+        finally:
+            cache.close()
+
+    def test_evicts_by_total_bytes(self, tmp_path):
+        """Test that entries are evicted once the byte budget is exceeded."""
+        cache = MessageCache(path=tmp_path / "messages.sqlite3", max_bytes=500)
+        try:
+            for i in range(5):
+                cache.put_many({f"m{i}": _message(f"m{i}", body="x" * 150)})
+
+            assert len(cache.get_many([f"m{i}" for i in range(5)])) < 5
+            assert "m4" in cache.get_many(["m4"])
+        finally:
+            cache.close()
+
+    def test_disabled_cache_stores_nothing(self, tmp_path):
+        """Test that a disabled cache never touches disk."""
+        path = tmp_path / "messages.sqlite3"
+        cache = MessageCache(path=path, enabled=False)
+
+        cache.put_many({"m1": _message("m1")})
+
+        assert cache.get_many(["m1"]) == {}
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_off_the_event_loop(self, cache):
+        """Test that aput_many and aget_many do their SQLite work on another thread."""
+        threads = []
+        connect = cache._connect
+
+        def record_thread():
+            threads.append(threading.current_thread())
+            return connect()
+
+        with patch.object(cache, "_connect", side_effect=record_thread):
+            await cache.aput_many({"m1": _message("m1")})
+            result = await cache.aget_many(["m1"])
+
+        assert result == {"m1": _message("m1")}
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
@@ -0,0 +1,60 @@
+"""
+Tests for the in-process metrics registry.
+"""
+
+from gmail_mcp_server.services.metrics import Metrics
+
+
+class TestMetrics:
+    """Tests for Metrics."""
+
+    def test_counters_accumulate(self):
+        """Test that increments add up."""
+        metrics = Metrics()
+
+        metrics.increment("requests")
+        metrics.increment("requests", 4)
+
+        assert metrics.snapshot()["counters"] == {"requests": 5}
+
+    def test_gauges_move_up_and_down(self):
+        """Test that gauges track the current level."""
+        metrics = Metrics()
+
+        metrics.add_to_gauge("queue_depth", 1)
+        metrics.add_to_gauge("queue_depth", 1)
+        metrics.add_to_gauge("queue_depth", -1)
+
+        assert metrics.snapshot()["gauges"] == {"queue_depth": 1}
+
+    def test_timings_keep_count_total_and_max(self):
+        """Test that timing samples are summarised."""
+        metrics = Metrics()
+
+        metrics.observe("wait_seconds", 0.5)
+        metrics.observe("wait_seconds", 1.5)
+
+        assert metrics.snapshot()["timings"] == {
+            "wait_seconds": {"count": 2, "total": 2.0, "max": 1.5}
+        }
+
+    def test_snapshot_is_a_copy(self):
+        """Test that later updates do not change an earlier snapshot."""
+        metrics = Metrics()
+        metrics.observe("wait_seconds", 1.0)
+
+        snapshot = metrics.snapshot()
+        metrics.observe("wait_seconds", 2.0)
+
+        assert snapshot["timings"]["wait_seconds"]["count"] == 1
+
+    def test_reset_clears_everything(self):
+        """Test that reset drops every metric."""
+        metrics = Metrics()
+        metrics.increment("requests")
+        metrics.add_to_gauge("queue_depth", 1)
+        metrics.observe("wait_seconds", 1.0)
+
+        metrics.reset()
+
+        assert metrics.snapshot() == {"counters": {}, "gauges": {}, "timings": {}}
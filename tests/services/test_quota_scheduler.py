@@ -0,0 +1,166 @@
+"""
+Tests for the quota-aware request scheduler.
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from googleapiclient.http import BatchHttpRequest
+
+from gmail_mcp_server.services.metrics import metrics
+from gmail_mcp_server.services.quota_scheduler import (
+    QuotaScheduler,
+    _TokenBucket,
+    request_quota_cost,
+)
+
+
+def api_request(method_id):
+    return Mock(methodId=method_id)
+
+
+class TestRequestQuotaCost:
+    """Tests for request_quota_cost function."""
+
+    def test_uses_gmail_method_cost(self):
+        """Test that Gmail methods are charged their documented units."""
+        assert request_quota_cost(api_request("gmail.users.messages.get")) == (
+            "gmail",
+            5,
+        )
+        assert request_quota_cost(api_request("gmail.users.drafts.create")) == (
+            "gmail",
+            10,
+        )
+
+    def test_unknown_methods_cost_one_unit(self):
+        """Test that unlisted methods are charged one unit for their API."""
+        assert request_quota_cost(api_request("calendar.freebusy.query")) == (
+            "calendar",
+            1,
+        )
+
+    def test_batch_costs_sum_of_its_requests(self):
+        """Test that a batch is charged for every request inside it."""
+        batch = BatchHttpRequest()
+        batch._requests = {
+            "0": api_request("gmail.users.messages.get"),
+            "1": api_request("gmail.users.messages.get"),
+            "2": api_request("gmail.users.history.list"),
+        }
+
+        assert request_quota_cost(batch) == ("gmail", 12)
+
+    def test_request_without_method_id_is_not_charged(self):
+        """Test that requests of unknown origin are not attributed to an API."""
+        assert request_quota_cost(object()) == (None, 0)
+
+
+class TestTokenBucket:
+    """Tests for _TokenBucket."""
+
+    @patch("gmail_mcp_server.services.quota_scheduler.time.monotonic")
+    def test_waits_once_capacity_is_spent(self, mock_monotonic):
+        """Test that reservations beyond capacity wait for the refill."""
+        mock_monotonic.return_value = 100.0
+        bucket = _TokenBucket(rate=10)
+
+        assert bucket.reserve(10) == 0
+        assert bucket.reserve(5) == pytest.approx(0.5)
+        # Later reservations queue behind earlier ones
+        assert bucket.reserve(5) == pytest.approx(1.0)
+
+    @patch("gmail_mcp_server.services.quota_scheduler.time.monotonic")
+    def test_refills_over_time_up_to_capacity(self, mock_monotonic):
+        """Test that tokens refill at the rate without exceeding capacity."""
+        mock_monotonic.return_value = 100.0
+        bucket = _TokenBucket(rate=10)
+        bucket.reserve(10)
+
+        mock_monotonic.return_value = 200.0
+
+        assert bucket.reserve(10) == 0
+        assert bucket.reserve(10) == pytest.approx(1.0)
+
+
+class TestQuotaScheduler:
+    """Tests for QuotaScheduler."""
+
+    @pytest.mark.asyncio
+    @patch(
+        "gmail_mcp_server.services.quota_scheduler.asyncio.sleep",
+        new_callable=AsyncMock,
+    )
+    @patch("gmail_mcp_server.services.quota_scheduler.time.monotonic")
+    async def test_queues_requests_over_budget(self, mock_monotonic, mock_sleep):
+        """Test that requests beyond the budget wait instead of failing."""
+        mock_monotonic.return_value = 100.0
+        scheduler = QuotaScheduler({"gmail": 10})
+
+        await scheduler.acquire(api_request("gmail.users.messages.get"))
+        await scheduler.acquire(api_request("gmail.users.messages.get"))
+        mock_sleep.assert_not_called()
+
+        await scheduler.acquire(api_request("gmail.users.threads.get"))
+
+        mock_sleep.assert_awaited_once_with(pytest.approx(1.0))
+
+    @pytest.mark.asyncio
+    @patch(
+        "gmail_mcp_server.services.quota_scheduler.asyncio.sleep",
+        new_callable=AsyncMock,
+    )
+    async def test_apis_have_separate_budgets(self, mock_sleep):
+        """Test that spending one API's quota does not delay another's."""
+        scheduler = QuotaScheduler({"gmail": 5, "calendar": 5})
+
+        await scheduler.acquire(api_request("gmail.users.messages.get"))
+        await scheduler.acquire(api_request("calendar.freebusy.query"))
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(
+        "gmail_mcp_server.services.quota_scheduler.asyncio.sleep",
+        new_callable=AsyncMock,
+    )
+    async def test_does_not_throttle_unknown_requests(self, mock_sleep):
+        """Test that requests without a known API pass straight through."""
+        scheduler = QuotaScheduler({"gmail": 1})
+
+        for _ in range(3):
+            await scheduler.acquire(Mock(spec=[]))
+            await scheduler.acquire(api_request("youtube.videos.list"))
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.services.quota_scheduler.time.monotonic")
+    async def test_records_queue_depth_and_wait_time(self, mock_monotonic):
+        """Test that waiting requests show up in queue depth and wait time."""
+        mock_monotonic.return_value = 100.0
+        scheduler = QuotaScheduler({"gmail": 5})
+        depth_while_waiting = []
+
+        async def fake_sleep(seconds):
+            depth_while_waiting.append(
+                metrics.snapshot()["gauges"]["quota.gmail.queue_depth"]
+            )
+
+        with patch(
+            "gmail_mcp_server.services.quota_scheduler.asyncio.sleep",
+            side_effect=fake_sleep,
+        ):
+            await scheduler.acquire(api_request("gmail.users.messages.get"))
+            await scheduler.acquire(api_request("gmail.users.messages.get"))
+
+        snapshot = metrics.snapshot()
+        assert depth_while_waiting == [1]
+        assert snapshot["gauges"]["quota.gmail.queue_depth"] == 0
+        assert snapshot["counters"]["quota.gmail.requests"] == 2
+        assert snapshot["counters"]["quota.gmail.units"] == 10
+        assert snapshot["timings"]["quota.gmail.wait_seconds"] == {
+            "count": 2,
+            "total": pytest.approx(1.0),
+            "max": pytest.approx(1.0),
+        }
@@ -0,0 +1,173 @@
+"""
+Tests for the bounded Google API request executor.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.errors import HttpError
+
+from gmail_mcp_server.services.metrics import metrics
+from gmail_mcp_server.services.request_executor import (
+    _get_thread_http,
+    execute_request,
+)
+from gmail_mcp_server.services.retry_policy import RetryPolicy
+
+
+def _http_error(status):
+    return HttpError(resp=Mock(status=status, reason="error"), content=b"error")
+
+
+class TestExecuteRequest:
+    """Tests for execute_request function."""
+
+    @pytest.mark.asyncio
+    async def test_returns_response(self):
+        """Test that the request response is returned."""
+        request = MagicMock()
+        request.execute.return_value = {"id": "msg1"}
+
+        result = await execute_request(request)
+
+        assert result == {"id": "msg1"}
+        request.execute.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop_thread(self):
+        """Test that execute() runs in a worker thread."""
+        request = MagicMock()
+        request.execute.side_effect = lambda: threading.current_thread().name
+
+        thread_name = await execute_request(request)
+
+        assert thread_name != threading.current_thread().name
+        assert thread_name.startswith("google-api")
+
+    @pytest.mark.asyncio
+    async def test_runs_requests_concurrently(self):
+        """Test that several requests are in flight at the same time."""
+        # Every request blocks until all three are running
+        barrier = threading.Barrier(3, timeout=5)
+        requests = []
+        for _ in range(3):
+            request = MagicMock()
+            request.execute.side_effect = barrier.wait
+            requests.append(request)
+
+        await asyncio.gather(*(execute_request(r) for r in requests))
+
+        assert not barrier.broken
+
+    @pytest.mark.asyncio
+    async def test_propagates_exceptions(self):
+        """Test that errors raised by execute() reach the caller."""
+        request = MagicMock()
+        request.execute.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await execute_request(request)
+
+    @pytest.mark.asyncio
+    async def test_waits_for_quota_before_executing(self):
+        """Test that every request goes through the quota scheduler first."""
+        calls = []
+        request = MagicMock()
+        request.execute.side_effect = lambda: calls.append("execute")
+
+        with patch(
+            "gmail_mcp_server.services.request_executor.quota_scheduler.acquire",
+            new_callable=AsyncMock,
+            side_effect=lambda r: calls.append("acquire"),
+        ) as mock_acquire:
+            await execute_request(request)
+
+        mock_acquire.assert_awaited_once_with(request)
+        assert calls == ["acquire", "execute"]
+
+    @pytest.mark.asyncio
+    @patch(
+        "gmail_mcp_server.services.request_executor.asyncio.sleep",
+        new_callable=AsyncMock,
+    )
+    async def test_retries_transient_errors_for_idempotent_requests(self, mock_sleep):
+        """Test that a GET failing with 503 is retried and counted."""
+        request = MagicMock(method="GET", methodId="gmail.users.messages.get")
+        request.execute.side_effect = [_http_error(503), {"id": "msg1"}]
+
+        result = await execute_request(request)
+
+        assert result == {"id": "msg1"}
+        assert request.execute.call_count == 2
+        mock_sleep.assert_awaited_once()
+        counters = metrics.snapshot()["counters"]
+        assert counters["requests.gmail.attempts"] == 2
+        assert counters["requests.gmail.retries"] == 1
+
+    @pytest.mark.asyncio
+    @patch(
+        "gmail_mcp_server.services.request_executor.asyncio.sleep",
+        new_callable=AsyncMock,
+    )
+    async def test_does_not_retry_non_idempotent_requests(self, mock_sleep):
+        """Test that a POST is attempted once, since it may have been applied."""
+        request = MagicMock(method="POST", methodId="gmail.users.drafts.create")
+        request.execute.side_effect = [_http_error(503), {"id": "draft1"}]
+
+        with pytest.raises(HttpError):
+            await execute_request(request)
+
+        assert request.execute.call_count == 1
+        mock_sleep.assert_not_awaited()
+        assert metrics.snapshot()["counters"]["requests.gmail.failures"] == 1
+
+    @pytest.mark.asyncio
+    @patch(
+        "gmail_mcp_server.services.request_executor.asyncio.sleep",
+        new_callable=AsyncMock,
+    )
+    async def test_raises_once_retries_are_exhausted(self, mock_sleep):
+        """Test that the last error is raised after max attempts."""
+        request = MagicMock(method="GET", methodId="gmail.users.messages.get")
+        request.execute.side_effect = _http_error(500)
+
+        with patch(
+            "gmail_mcp_server.services.request_executor.retry_policy",
+            RetryPolicy(max_attempts=3),
+        ):
+            with pytest.raises(HttpError):
+                await execute_request(request)
+
+        assert request.execute.call_count == 3
+        assert mock_sleep.await_count == 2
+
+
+class TestGetThreadHttp:
+    """Tests for per-thread HTTP client selection."""
+
+    def test_returns_none_for_non_authorized_http(self):
+        """Test that unknown transports are left to the request."""
+        assert _get_thread_http(Mock()) is None
+        assert _get_thread_http(None) is None
+
+    def test_reuses_http_for_same_credentials(self):
+        """Test that a thread reuses its HTTP client for the same credentials."""
+        credentials = Mock()
+        http = AuthorizedHttp(credentials, http=Mock())
+
+        first = _get_thread_http(http)
+        second = _get_thread_http(http)
+
+        assert first is second
+        assert first is not http
+        assert first.credentials is credentials
+
+    def test_rebuilds_http_when_credentials_change(self):
+        """Test that new credentials get a new HTTP client."""
+        first = _get_thread_http(AuthorizedHttp(Mock(), http=Mock()))
+        second = _get_thread_http(AuthorizedHttp(Mock(), http=Mock()))
+
+        assert first is not second
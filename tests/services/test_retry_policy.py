@@ -0,0 +1,150 @@
+"""
+Tests for the retry policy.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, Mock, patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest
+
+from gmail_mcp_server.services.retry_policy import (
+    RetryPolicy,
+    is_idempotent,
+    is_retryable,
+)
+
+
+def _http_error(status, content=b"error", headers=None):
+    resp = httplib2.Response({"status": status, **(headers or {})})
+    return HttpError(resp=resp, content=content)
+
+
+def _request(method, method_id="gmail.users.messages.get"):
+    return Mock(method=method, methodId=method_id)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy.next_delay."""
+
+    @patch("gmail_mcp_server.services.retry_policy.random.uniform")
+    def test_backs_off_exponentially_with_jitter(self, mock_uniform):
+        """Test that the jitter ceiling doubles with each attempt."""
+        mock_uniform.side_effect = lambda low, high: high
+        policy = RetryPolicy(
+            max_attempts=10, base_delay_seconds=0.5, max_delay_seconds=100
+        )
+        deadline = policy.deadline()
+
+        delays = [
+            policy.next_delay(attempt, _http_error(503), deadline)
+            for attempt in range(1, 5)
+        ]
+
+        assert delays == [0.5, 1.0, 2.0, 4.0]
+        mock_uniform.assert_called_with(0, 4.0)
+
+    @patch("gmail_mcp_server.services.retry_policy.random.uniform")
+    def test_caps_the_delay(self, mock_uniform):
+        """Test that backoff never exceeds max_delay_seconds."""
+        mock_uniform.side_effect = lambda low, high: high
+        policy = RetryPolicy(max_attempts=20, base_delay_seconds=1, max_delay_seconds=8)
+
+        assert policy.next_delay(10, _http_error(503), policy.deadline()) == 8
+
+    def test_honours_retry_after_seconds(self):
+        """Test that a Retry-After header sets the minimum wait."""
+        policy = RetryPolicy(base_delay_seconds=0.1)
+        error = _http_error(429, headers={"retry-after": "5"})
+
+        assert policy.next_delay(1, error, policy.deadline()) == 5.0
+
+    def test_honours_retry_after_http_date(self):
+        """Test that Retry-After given as an HTTP date is understood."""
+        policy = RetryPolicy(base_delay_seconds=0.1)
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+        error = _http_error(503, headers={"retry-after": format_datetime(retry_at)})
+
+        assert policy.next_delay(1, error, policy.deadline()) == pytest.approx(
+            10, abs=1.5
+        )
+
+    def test_gives_up_after_max_attempts(self):
+        """Test that the last attempt is not retried."""
+        policy = RetryPolicy(max_attempts=3)
+        deadline = policy.deadline()
+
+        assert policy.next_delay(2, _http_error(503), deadline) is not None
+        assert policy.next_delay(3, _http_error(503), deadline) is None
+
+    def test_gives_up_when_wait_would_pass_the_deadline(self):
+        """Test that a retry is skipped if it could not start before the deadline."""
+        policy = RetryPolicy(deadline_seconds=3)
+        error = _http_error(429, headers={"retry-after": "10"})
+
+        assert policy.next_delay(1, error, policy.deadline()) is None
+
+    def test_does_not_retry_permanent_errors(self):
+        """Test that non-transient errors are not retried."""
+        policy = RetryPolicy()
+
+        assert policy.next_delay(1, _http_error(404), policy.deadline()) is None
+
+
+class TestIsRetryable:
+    """Tests for is_retryable function."""
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_transient_status_codes_are_retryable(self, status):
+        """Test that rate limits and server errors are retried."""
+        assert is_retryable(_http_error(status))
+
+    @pytest.mark.parametrize("status", [400, 401, 404])
+    def test_client_errors_are_not_retryable(self, status):
+        """Test that client errors are not retried."""
+        assert not is_retryable(_http_error(status))
+
+    def test_rate_limited_403_is_retryable(self):
+        """Test that 403 rate limit responses are retried."""
+        content = (
+            b'{"error": {"code": 403, "message": "Rate Limit Exceeded",'
+            b' "errors": [{"reason": "rateLimitExceeded"}]}}'
+        )
+        assert is_retryable(_http_error(403, content))
+
+    def test_other_exceptions_are_not_retryable(self):
+        """Test that non-HTTP errors are not retried."""
+        assert not is_retryable(ValueError("boom"))
+
+
+class TestIsIdempotent:
+    """Tests for is_idempotent function."""
+
+    @pytest.mark.parametrize("method", ["GET", "PUT", "DELETE"])
+    def test_safe_http_methods_are_idempotent(self, method):
+        """Test that reads, replacements and deletes may be repeated."""
+        assert is_idempotent(_request(method))
+
+    def test_post_is_not_idempotent(self):
+        """Test that creating calls are never repeated."""
+        assert not is_idempotent(_request("POST", "gmail.users.drafts.create"))
+
+    def test_read_only_post_is_idempotent(self):
+        """Test that POST methods that only read may be repeated."""
+        assert is_idempotent(_request("POST", "calendar.freebusy.query"))
+
+    def test_batch_is_idempotent_only_if_every_request_is(self):
+        """Test that one non-idempotent sub-request makes the batch unsafe."""
+        batch = BatchHttpRequest()
+        batch._requests = {"0": _request("GET"), "1": _request("GET")}
+        assert is_idempotent(batch)
+
+        batch._requests["2"] = _request("POST", "gmail.users.drafts.create")
+        assert not is_idempotent(batch)
+
+    def test_unknown_requests_are_not_idempotent(self):
+        """Test that requests without an HTTP method are not retried."""
+        assert not is_idempotent(MagicMock())
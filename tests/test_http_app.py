@@ -0,0 +1,85 @@
+"""
+Tests for the Streamable HTTP transport.
+"""
+
+import pytest
+from starlette.testclient import TestClient
+
+from gmail_mcp_server.http_app import create_http_app, is_loopback_host
+
+HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "Content-Type": "application/json",
+}
+
+
+def _initialize(client, request_id=1):
+    return client.post(
+        "/mcp/",
+        headers=HEADERS,
+        json={
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "test-client", "version": "1.0"},
+            },
+        },
+    )
+
+
+class TestHttpApp:
+    """Tests for create_http_app function."""
+
+    def test_initializes_session(self):
+        """Test that a client can open a session over HTTP."""
+        with TestClient(create_http_app(json_response=True)) as client:
+            response = _initialize(client)
+
+        assert response.status_code == 200
+        assert response.headers["mcp-session-id"]
+        result = response.json()["result"]
+        assert result["serverInfo"]["name"] == "gmail-mcp-server"
+
+    def test_serves_concurrent_sessions(self):
+        """Test that each client gets its own session on the one server."""
+        with TestClient(create_http_app(json_response=True)) as client:
+            first = _initialize(client, 1)
+            second = _initialize(client, 2)
+
+        assert first.headers["mcp-session-id"] != second.headers["mcp-session-id"]
+
+    def test_lists_tools_within_session(self):
+        """Test that requests in an established session reach the server."""
+        with TestClient(create_http_app(json_response=True)) as client:
+            session_id = _initialize(client).headers["mcp-session-id"]
+            session_headers = {**HEADERS, "mcp-session-id": session_id}
+            client.post(
+                "/mcp/",
+                headers=session_headers,
+                json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+            )
+            response = client.post(
+                "/mcp/",
+                headers=session_headers,
+                json={"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+            )
+
+        tools = response.json()["result"]["tools"]
+        assert "get_unread_emails" in [tool["name"] for tool in tools]
+
+
+class TestIsLoopbackHost:
+    """Tests for is_loopback_host function."""
+
+    @pytest.mark.parametrize("host", ["127.0.0.1", "127.0.0.2", "::1", "localhost"])
+    def test_accepts_loopback_hosts(self, host):
+        """Test that loopback addresses count as local-only."""
+        assert is_loopback_host(host)
+
+    @pytest.mark.parametrize("host", ["0.0.0.0", "::", "192.168.1.10", "example.com"])
+    def test_rejects_other_hosts(self, host):
+        """Test that wildcard, LAN and named hosts are not local-only."""
+        assert not is_loopback_host(host)
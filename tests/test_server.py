@@ -17,11 +17,14 @@ class TestHandleListTools:
         """Test that all tools are listed."""
         tools = await handle_list_tools()  # type: ignore[call-arg]
 
-        assert len(tools) == 2
+        assert len(tools) == 5
 
         tool_names = [tool.name for tool in tools]
         assert "get_unread_emails" in tool_names
+        assert "get_email" in tool_names
+        assert "get_thread" in tool_names
         assert "create_draft_email" in tool_names
+        assert "mailbox_stats" in tool_names
 
     @pytest.mark.asyncio
     async def test_get_unread_emails_tool_schema(self):
@@ -33,6 +36,11 @@ class TestHandleListTools:
         assert get_unread_tool.inputSchema["type"] == "object"
         assert "limit" in get_unread_tool.inputSchema["properties"]
         assert get_unread_tool.inputSchema["properties"]["limit"]["type"] == "integer"
+        assert get_unread_tool.inputSchema["properties"]["mode"]["enum"] == [
+            "metadata",
+            "snippet",
+            "full",
+        ]
 
     @pytest.mark.asyncio
     async def test_create_draft_email_tool_schema(self):
@@ -71,7 +79,7 @@ class TestHandleCallTool:
 
         await handle_call_tool("get_unread_emails", {"limit": 10})
 
-        mock_get_unread.assert_called_once_with(10)
+        mock_get_unread.assert_called_once_with(10, "full", False)
 
     @pytest.mark.asyncio
     @patch("gmail_mcp_server.server.get_unread_emails")
@@ -82,7 +90,7 @@ class TestHandleCallTool:
         await handle_call_tool("get_unread_emails", {})
 
         # Default limit should be used from config (max_email_limit = 5)
-        mock_get_unread.assert_called_once_with(5)
+        mock_get_unread.assert_called_once_with(5, "full", False)
 
     @pytest.mark.asyncio
     @patch("gmail_mcp_server.server.create_draft_reply")
@@ -95,6 +103,40 @@ class TestHandleCallTool:
 
         mock_create_draft.assert_called_once_with(arguments)
 
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.server.get_email")
+    async def test_calls_get_email_tool(self, mock_get_email):
+        """Test calling get_email tool with and without an offset."""
+        mock_get_email.return_value = []
+
+        await handle_call_tool("get_email", {"message_id": "msg1", "offset": 4000})
+        await handle_call_tool("get_email", {"message_id": "msg2"})
+
+        mock_get_email.assert_any_call("msg1", 4000, None)
+        mock_get_email.assert_any_call("msg2", 0, None)
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.server.get_thread")
+    async def test_calls_get_thread_tool(self, mock_get_thread):
+        """Test calling get_thread tool with paging arguments."""
+        mock_get_thread.return_value = []
+
+        await handle_call_tool(
+            "get_thread", {"thread_id": "t1", "offset": 100, "length": 500}
+        )
+
+        mock_get_thread.assert_called_once_with("t1", 100, 500)
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.server.get_mailbox_stats")
+    async def test_calls_mailbox_stats_tool(self, mock_get_stats):
+        """Test calling mailbox_stats tool."""
+        mock_get_stats.return_value = []
+
+        await handle_call_tool("mailbox_stats", {})
+
+        mock_get_stats.assert_called_once_with()
+
     @pytest.mark.asyncio
     async def test_raises_error_for_unknown_tool(self):
         """Test that ValueError is raised for unknown tool."""
@@ -134,7 +176,27 @@ class TestHandleCallTool:
 
         await handle_call_tool("get_unread_emails", {"limit": 20})
 
-        mock_get_unread.assert_called_once_with(20)
+        mock_get_unread.assert_called_once_with(20, "full", False)
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.server.get_unread_emails")
+    async def test_passes_mode_argument_correctly(self, mock_get_unread):
+        """Test that the mode argument is passed through."""
+        mock_get_unread.return_value = []
+
+        await handle_call_tool("get_unread_emails", {"limit": 50, "mode": "snippet"})
+
+        mock_get_unread.assert_called_once_with(50, "snippet", False)
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.server.get_unread_emails")
+    async def test_passes_group_by_thread_argument_correctly(self, mock_get_unread):
+        """Test that the group_by_thread argument is passed through."""
+        mock_get_unread.return_value = []
+
+        await handle_call_tool("get_unread_emails", {"group_by_thread": True})
+
+        mock_get_unread.assert_called_once_with(5, "full", True)
 
     @pytest.mark.asyncio
     @patch("gmail_mcp_server.server.create_draft_reply")
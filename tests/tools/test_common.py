@@ -0,0 +1,131 @@
+"""
+Tests for the helpers shared by the email tools.
+"""
+
+import pytest
+
+from gmail_mcp_server.services.gmail_fields import MESSAGE_DISPLAY_FIELDS
+from gmail_mcp_server.tools._common import (
+    MAX_BODY_CHARS,
+    MAX_RESPONSE_CHARS,
+    GmailAPIError,
+    get_message,
+    list_email_content,
+    validate_page,
+)
+
+
+class TestValidatePage:
+    """Tests for validate_page function."""
+
+    def test_defaults_to_body_budget(self):
+        """Test that a missing length falls back to max_body_chars."""
+        assert validate_page(0, None) == MAX_BODY_CHARS
+
+    def test_uses_given_default(self):
+        """Test that callers can choose their own default length."""
+        assert validate_page(0, None, default=MAX_RESPONSE_CHARS) == (
+            MAX_RESPONSE_CHARS
+        )
+
+    def test_caps_length_at_response_budget(self):
+        """Test that a length over max_response_chars is capped."""
+        assert validate_page(0, MAX_RESPONSE_CHARS + 1) == MAX_RESPONSE_CHARS
+
+    @pytest.mark.parametrize("offset, length", [(-1, None), (0, 0)])
+    def test_rejects_invalid_arguments(self, offset, length):
+        """Test that negative offsets and empty pages are refused."""
+        with pytest.raises(ValueError):
+            validate_page(offset, length)
+
+
+class TestGetMessage:
+    """Tests for get_message function."""
+
+    @pytest.mark.asyncio
+    async def test_downloads_and_caches_message(
+        self, mock_gmail_service, isolated_message_cache
+    ):
+        """Test that a cache miss is fetched once and then served locally."""
+        message = {"id": "msg1", "threadId": "thread1", "payload": {"headers": []}}
+        mock_get = mock_gmail_service.users().messages().get
+        mock_get().execute.return_value = message
+        mock_get.reset_mock()
+
+        first = await get_message(mock_gmail_service, "msg1")
+        second = await get_message(mock_gmail_service, "msg1")
+
+        assert first == second == message
+        mock_get.assert_called_once_with(
+            userId="me", id="msg1", fields=MESSAGE_DISPLAY_FIELDS
+        )
+
+
+class TestListEmailContent:
+    """Tests for list_email_content function."""
+
+    @pytest.mark.asyncio
+    async def test_retrieves_multiple_emails_in_parallel(self, mock_gmail_service):
+        """Test retrieving multiple emails in parallel."""
+        messages = [
+            {"id": "msg1", "threadId": "thread1", "payload": {"headers": []}},
+            {"id": "msg2", "threadId": "thread2", "payload": {"headers": []}},
+            {"id": "msg3", "threadId": "thread3", "payload": {"headers": []}},
+        ]
+
+        # Mock returns different message for each call
+        mock_gmail_service.users().messages().get().execute.side_effect = messages
+
+        message_ids = ["msg1", "msg2", "msg3"]
+        results = await list_email_content(mock_gmail_service, message_ids)
+
+        # Requests run concurrently, so responses may arrive in any order
+        assert len(results) == 3
+        assert sorted(results, key=lambda m: m["id"]) == messages
+
+    @pytest.mark.asyncio
+    async def test_fetches_messages_in_one_batch(self, mock_gmail_service):
+        """Test that message retrieval uses a single batch round trip."""
+        mock_gmail_service.users().messages().get().execute.return_value = {
+            "id": "msg",
+            "threadId": "thread",
+            "payload": {"headers": []},
+        }
+
+        await list_email_content(mock_gmail_service, ["msg1", "msg2", "msg3"])
+
+        mock_gmail_service.new_batch_http_request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_handles_empty_message_list(self, mock_gmail_service):
+        """Test handling empty message list."""
+        results = await list_email_content(mock_gmail_service, [])
+
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_retrieves_single_email_in_list(self, mock_gmail_service):
+        """Test retrieving a single email in a list."""
+        message = {"id": "msg1", "threadId": "thread1", "payload": {"headers": []}}
+
+        mock_gmail_service.users().messages().get().execute.return_value = message
+
+        results = await list_email_content(mock_gmail_service, ["msg1"])
+
+        assert len(results) == 1
+        assert results[0] == message
+
+
+class TestGmailAPIError:
+    """Tests for GmailAPIError exception."""
+
+    def test_gmail_api_error_is_exception(self):
+        """Test that GmailAPIError is an Exception."""
+        assert issubclass(GmailAPIError, Exception)
+
+    def test_gmail_api_error_can_be_raised(self):
+        """Test that GmailAPIError can be raised with message."""
+        with pytest.raises(GmailAPIError) as exc_info:
+            raise GmailAPIError("Test error message")
+
+        assert str(exc_info.value) == "Test error message"
@@ -42,6 +42,29 @@ class TestCreateDraftReply:
         assert "Draft reply created successfully" in results[0].text
         assert "draft123" in results[0].text
 
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.create_draft_reply.get_gmail_api_service")
+    async def test_fetches_only_reply_headers(
+        self, mock_get_service, mock_gmail_service, sample_thread
+    ):
+        """Test that the thread is fetched as metadata with only reply headers."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_get = mock_gmail_service.users().threads().get
+        mock_get().execute.return_value = sample_thread
+        mock_gmail_service.users().drafts().create().execute.return_value = {
+            "id": "draft123"
+        }
+
+        await create_draft_reply({"thread_id": "thread123", "reply_body": "Reply"})
+
+        mock_get.assert_called_with(
+            userId="me",
+            id="thread123",
+            format="metadata",
+            metadataHeaders=["Subject", "Message-ID", "References", "From"],
+            fields="messages(id,payload/headers)",
+        )
+
     @pytest.mark.asyncio
     @patch("gmail_mcp_server.tools.create_draft_reply.get_gmail_api_service")
     async def test_creates_draft_with_correct_threading_headers(
@@ -0,0 +1,160 @@
+"""
+Tests for get_email tool.
+"""
+
+import base64
+from unittest.mock import Mock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from gmail_mcp_server.services import message_cache
+from gmail_mcp_server.services.gmail_fields import MESSAGE_DISPLAY_FIELDS
+from gmail_mcp_server.tools._common import GmailAPIError
+from gmail_mcp_server.tools.get_email import get_email
+
+
+def _message(body):
+    return {
+        "id": "msg1",
+        "threadId": "thread1",
+        "payload": {
+            "headers": [{"name": "Subject", "value": "Newsletter"}],
+            "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()},
+        },
+    }
+
+
+class TestGetEmail:
+    """Tests for get_email function."""
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_email.get_gmail_api_service")
+    async def test_returns_formatted_email(self, mock_get_service, mock_gmail_service):
+        """Test that the message is fetched and formatted."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().get().execute.return_value = _message(
+            "Short body"
+        )
+
+        result = await get_email("msg1")
+
+        assert len(result) == 1
+        assert "Subject: Newsletter" in result[0].text
+        assert "Short body" in result[0].text
+        mock_gmail_service.users().messages().get.assert_called_with(
+            userId="me", id="msg1", fields=MESSAGE_DISPLAY_FIELDS
+        )
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_email.get_gmail_api_service")
+    async def test_pages_through_long_body(self, mock_get_service, mock_gmail_service):
+        """Test that offsets from the truncation marker continue the body."""
+        mock_get_service.return_value = mock_gmail_service
+        body = "Line number one.\nLine number two.\nLine number three.\n"
+        mock_gmail_service.users().messages().get().execute.return_value = _message(
+            body
+        )
+
+        first = (await get_email("msg1", length=30))[0].text
+        second = (await get_email("msg1", offset=17, length=30))[0].text
+
+        assert 'message_id "msg1" and offset 17' in first
+        assert "Line number two." in second
+        assert "offset 34" in second
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_email.get_gmail_api_service")
+    async def test_serves_cached_message(self, mock_get_service, mock_gmail_service):
+        """Test that a cached message is not downloaded again."""
+        mock_get_service.return_value = mock_gmail_service
+        message_cache.put_many({"msg1": _message("Cached body")})
+
+        result = await get_email("msg1")
+
+        assert "Cached body" in result[0].text
+        mock_gmail_service.users().messages().get().execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_email.STRIP_QUOTED_TEXT", True)
+    @patch("gmail_mcp_server.tools.get_email.get_gmail_api_service")
+    async def test_strips_quotes_when_enabled(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that the strip_quoted_text setting applies to get_email."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().get().execute.return_value = _message(
+            "New text\n\nOn Mon, Jane wrote:\n> Old text"
+        )
+
+        result = await get_email("msg1")
+
+        assert "New text" in result[0].text
+        assert "Old text" not in result[0].text
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_email.get_gmail_api_service")
+    async def test_length_sets_page_size(self, mock_get_service, mock_gmail_service):
+        """Test that length limits the body characters returned."""
+        mock_get_service.return_value = mock_gmail_service
+        body = "Word " * 100
+        mock_gmail_service.users().messages().get().execute.return_value = _message(
+            body
+        )
+
+        result = (await get_email("msg1", offset=10, length=20))[0].text
+
+        assert "Body (characters 10-30 of 500):\nWord Word Word Word \n" in result
+        assert 'message_id "msg1" and offset 30' in result
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools._common.MAX_RESPONSE_CHARS", 50)
+    @patch("gmail_mcp_server.tools.get_email.get_gmail_api_service")
+    async def test_length_is_capped(self, mock_get_service, mock_gmail_service):
+        """Test that length cannot exceed max_response_chars."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().get().execute.return_value = _message(
+            "Word " * 100
+        )
+
+        result = (await get_email("msg1", length=10_000))[0].text
+
+        assert 'message_id "msg1" and offset 50' in result
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_email.get_gmail_api_service")
+    async def test_offset_past_end_is_reported(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that an offset at or past the end of the body says so."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().get().execute.return_value = _message(
+            "Word " * 100
+        )
+
+        result = (await get_email("msg1", offset=500))[0].text
+
+        assert "[Offset 500 is beyond the end of the body (500 chars).]" in result
+        assert "Truncated" not in result
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_arguments(self):
+        """Test that a missing ID, negative offset or empty page is rejected."""
+        with pytest.raises(ValueError, match="Missing message_id"):
+            await get_email("")
+        with pytest.raises(ValueError, match="offset"):
+            await get_email("msg1", offset=-1)
+        with pytest.raises(ValueError, match="length"):
+            await get_email("msg1", length=0)
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_email.get_gmail_api_service")
+    async def test_wraps_api_errors(self, mock_get_service, mock_gmail_service):
+        """Test that Gmail API errors are raised as GmailAPIError."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().get().execute.side_effect = HttpError(
+            resp=Mock(status=404, reason="Not Found"), content=b"Not found"
+        )
+
+        with pytest.raises(GmailAPIError, match="Gmail API Error"):
+            await get_email("missing")
@@ -0,0 +1,84 @@
+"""
+Tests for get_mailbox_stats tool.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from gmail_mcp_server.tools._common import GmailAPIError
+from gmail_mcp_server.tools.get_mailbox_stats import get_mailbox_stats
+
+
+def _label(label_id, name, messages_unread, messages_total, threads_unread):
+    return {
+        "id": label_id,
+        "name": name,
+        "messagesUnread": messages_unread,
+        "messagesTotal": messages_total,
+        "threadsUnread": threads_unread,
+        "threadsTotal": threads_unread,
+    }
+
+
+class TestGetMailboxStats:
+    """Tests for get_mailbox_stats function."""
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_mailbox_stats.label_stats_cache")
+    @patch("gmail_mcp_server.tools.get_mailbox_stats.get_gmail_api_service")
+    async def test_summarises_unread_counts(self, mock_get_service, mock_cache):
+        """Test that totals come first, then labels with unread mail, most first."""
+
+        async def get_label_stats(gmail_service):
+            return [
+                _label("INBOX", "INBOX", 12, 1530, 9),
+                _label("UNREAD", "UNREAD", 17, 17, 12),
+                _label("Label_1", "Work", 5, 80, 3),
+                _label("Label_2", "Receipts", 0, 200, 0),
+            ]
+
+        mock_cache.get_label_stats.side_effect = get_label_stats
+
+        results = await get_mailbox_stats()
+
+        assert len(results) == 1
+        assert results[0].text == (
+            "Unread: 17 messages in 12 threads\n"
+            "Inbox: 12 unread of 1530 messages (9 unread threads)\n"
+            "\n"
+            "Unread by label:\n"
+            "- INBOX: 12 messages, 9 threads\n"
+            "- Work: 5 messages, 3 threads"
+        )
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_mailbox_stats.get_gmail_api_service")
+    async def test_reads_counts_from_labels(self, mock_get_service, mock_gmail_service):
+        """Test that stats come from labels.get without any message requests."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().labels().list().execute.return_value = {
+            "labels": [{"id": "UNREAD"}]
+        }
+        mock_gmail_service.users().labels().get().execute.return_value = _label(
+            "UNREAD", "UNREAD", 0, 0, 0
+        )
+
+        results = await get_mailbox_stats()
+
+        assert results[0].text.startswith("Unread: 0 messages in 0 threads")
+        assert "Unread by label" not in results[0].text
+        mock_gmail_service.users().messages().get.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_mailbox_stats.get_gmail_api_service")
+    async def test_handles_http_error(self, mock_get_service, mock_gmail_service):
+        """Test that API failures surface as GmailAPIError."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().labels().list().execute.side_effect = HttpError(
+            Mock(status=500), b"Server error"
+        )
+
+        with pytest.raises(GmailAPIError, match="Gmail API Error"):
+            await get_mailbox_stats()
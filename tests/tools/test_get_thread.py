@@ -0,0 +1,126 @@
+"""
+Tests for get_thread tool.
+"""
+
+import base64
+from unittest.mock import Mock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from gmail_mcp_server.services import message_cache
+from gmail_mcp_server.services.gmail_fields import THREAD_MESSAGE_IDS_FIELDS
+from gmail_mcp_server.tools._common import GmailAPIError
+from gmail_mcp_server.tools.get_thread import get_thread
+
+
+def _message(message_id, body):
+    return {
+        "id": message_id,
+        "threadId": "thread1",
+        "payload": {
+            "headers": [{"name": "From", "value": f"{message_id}@example.com"}],
+            "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()},
+        },
+    }
+
+
+@pytest.fixture
+def thread_service(mock_gmail_service):
+    """Gmail service whose thread1 holds msg1 and msg2."""
+    mock_gmail_service.users().threads().get().execute.return_value = {
+        "id": "thread1",
+        "messages": [{"id": "msg1"}, {"id": "msg2"}],
+    }
+    mock_gmail_service.users().messages().get().execute.side_effect = [
+        _message("msg1", "First message."),
+        _message("msg2", "Second message."),
+    ]
+    with patch(
+        "gmail_mcp_server.tools.get_thread.get_gmail_api_service",
+        return_value=mock_gmail_service,
+    ):
+        yield mock_gmail_service
+
+
+class TestGetThread:
+    """Tests for get_thread function."""
+
+    @pytest.mark.asyncio
+    async def test_returns_all_messages_in_order(self, thread_service):
+        """Test that the thread is rendered as one transcript."""
+        result = await get_thread("thread1")
+
+        assert len(result) == 1
+        text = result[0].text
+        assert text.startswith("Thread ID: thread1\nMessages: 2\n")
+        assert text.index("First message.") < text.index("Second message.")
+        assert "Truncated" not in text
+        thread_service.users().threads().get.assert_called_with(
+            userId="me",
+            id="thread1",
+            format="minimal",
+            fields=THREAD_MESSAGE_IDS_FIELDS,
+        )
+
+    @pytest.mark.asyncio
+    async def test_serves_cached_messages(self, thread_service):
+        """Test that cached messages are not downloaded again."""
+        message_cache.put_many(
+            {
+                "msg1": _message("msg1", "Cached one."),
+                "msg2": _message("msg2", "Cached two."),
+            }
+        )
+
+        text = (await get_thread("thread1"))[0].text
+
+        assert "Cached one." in text
+        assert "Cached two." in text
+        thread_service.users().messages().get().execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pages_with_offset_and_length(self, thread_service):
+        """Test that a page names the offset of the next one."""
+        first = (await get_thread("thread1", length=100))[0].text
+        offset = int(first.rsplit("offset ", 1)[1].split(" ")[0])
+        thread_service.users().messages().get().execute.side_effect = [
+            _message("msg1", "First message."),
+            _message("msg2", "Second message."),
+        ]
+        message_cache.clear()
+        second = (await get_thread("thread1", offset=offset, length=10_000))[0].text
+
+        assert 'get_thread with thread_id "thread1"' in first
+        assert "Second message." not in first
+        assert f"Characters: {offset}-" in second
+        assert "Second message." in second
+
+    @pytest.mark.asyncio
+    async def test_offset_past_end_is_reported(self, thread_service):
+        """Test that an offset past the end of the transcript says so."""
+        text = (await get_thread("thread1", offset=1_000_000))[0].text
+
+        assert text.startswith("Thread ID: thread1\nMessages: 2\n")
+        assert "[Offset 1000000 is beyond the end of the thread (" in text
+        assert "First message." not in text
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_arguments(self):
+        """Test that a missing ID or invalid page is rejected."""
+        with pytest.raises(ValueError, match="Missing thread_id"):
+            await get_thread("")
+        with pytest.raises(ValueError, match="offset"):
+            await get_thread("thread1", offset=-5)
+        with pytest.raises(ValueError, match="length"):
+            await get_thread("thread1", length=0)
+
+    @pytest.mark.asyncio
+    async def test_wraps_api_errors(self, thread_service):
+        """Test that Gmail API errors are raised as GmailAPIError."""
+        thread_service.users().threads().get().execute.side_effect = HttpError(
+            resp=Mock(status=404, reason="Not Found"), content=b"Not found"
+        )
+
+        with pytest.raises(GmailAPIError, match="Gmail API Error"):
+            await get_thread("missing")
@@ -2,17 +2,24 @@
 Tests for get_unread_emails tool.
 """
 
+import asyncio
 import base64
 from unittest.mock import Mock, patch
 
 import pytest
 from googleapiclient.errors import HttpError
 
+from gmail_mcp_server.services import unread_mailbox_sync
+from gmail_mcp_server.services.gmail_fields import (
+    MESSAGE_DISPLAY_FIELDS,
+    MESSAGE_LIST_FIELDS,
+    MESSAGE_TRIAGE_FIELDS,
+    THREAD_DISPLAY_FIELDS,
+)
+from gmail_mcp_server.tools._common import GmailAPIError, list_email_content
 from gmail_mcp_server.tools.get_unread_emails import (
-    GmailAPIError,
-    _get_email_content,
-    _list_all_email_content,
     get_unread_emails,
+    iter_unread_emails,
 )
 
 
@@ -78,7 +85,12 @@ class TestGetUnreadEmails:
 
         # Verify maxResults parameter is passed
         list_call = mock_gmail_service.users().messages().list
-        list_call.assert_called_with(userId="me", labelIds=["UNREAD"], maxResults=3)
+        list_call.assert_called_with(
+            userId="me",
+            labelIds=["UNREAD"],
+            maxResults=3,
+            fields=MESSAGE_LIST_FIELDS,
+        )
 
     @pytest.mark.asyncio
     @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
@@ -164,80 +176,593 @@ class TestGetUnreadEmails:
         assert "Plain text" in results[0].text
 
 
-class TestGetEmailContent:
-    """Tests for _get_email_content helper function."""
+class TestUnreadEmailCaching:
+    """Tests for serving unread emails from the message cache."""
 
     @pytest.mark.asyncio
-    async def test_retrieves_single_email(self, mock_gmail_service):
-        """Test retrieving a single email."""
-        message_data = {
-            "id": "msg123",
-            "threadId": "thread123",
-            "payload": {"headers": []},
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_repeat_call_makes_no_message_requests(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that a repeated call for the same unread set is served locally."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}, {"id": "msg2"}]
         }
+        mock_get = mock_gmail_service.users().messages().get
+        mock_get().execute.return_value = {
+            "id": "msg1",
+            "threadId": "thread1",
+            "payload": {"headers": [], "body": {}},
+        }
+        mock_get.reset_mock()
 
-        mock_gmail_service.users().messages().get().execute.return_value = message_data
+        first = await get_unread_emails(limit=2)
+        requests_after_first_call = mock_get().execute.call_count
+        second = await get_unread_emails(limit=2)
 
-        result = await _get_email_content(mock_gmail_service, "msg123")
+        assert requests_after_first_call == 2
+        assert mock_get().execute.call_count == 2
+        assert [r.text for r in first] == [r.text for r in second]
 
-        assert result == message_data
-        # Verify the get method was called with correct parameters
-        mock_gmail_service.users().messages().get.assert_called_with(
-            userId="me", id="msg123"
+    @pytest.mark.asyncio
+    async def test_fetches_only_uncached_messages(
+        self, mock_gmail_service, isolated_message_cache
+    ):
+        """Test that only cache misses are downloaded."""
+        cached = {"id": "msg1", "threadId": "thread1", "payload": {"headers": []}}
+        fetched = {"id": "msg2", "threadId": "thread2", "payload": {"headers": []}}
+        isolated_message_cache.put_many({"msg1": cached})
+        mock_get = mock_gmail_service.users().messages().get
+        mock_get().execute.return_value = fetched
+        mock_get.reset_mock()
+
+        results = await list_email_content(mock_gmail_service, ["msg1", "msg2"])
+
+        assert results == [cached, fetched]
+        mock_get.assert_called_once_with(
+            userId="me", id="msg2", fields=MESSAGE_DISPLAY_FIELDS
         )
 
 
-class TestListAllEmailContent:
-    """Tests for _list_all_email_content helper function."""
+class TestUnreadEmailBodyBudget:
+    """Tests for the per-message and per-response body budgets."""
+
+    @staticmethod
+    def _long_message(message_id):
+        body = "A sentence of newsletter text. " * 100
+        return {
+            "id": message_id,
+            "threadId": f"thread-{message_id}",
+            "payload": {
+                "headers": [],
+                "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()},
+            },
+        }
 
     @pytest.mark.asyncio
-    async def test_retrieves_multiple_emails_in_parallel(self, mock_gmail_service):
-        """Test retrieving multiple emails in parallel."""
-        messages = [
-            {"id": "msg1", "threadId": "thread1", "payload": {"headers": []}},
-            {"id": "msg2", "threadId": "thread2", "payload": {"headers": []}},
-            {"id": "msg3", "threadId": "thread3", "payload": {"headers": []}},
-        ]
+    @patch("gmail_mcp_server.tools.get_unread_emails.MAX_BODY_CHARS", 100)
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_truncates_each_body(self, mock_get_service, mock_gmail_service):
+        """Test that long bodies are cut with a get_email continuation marker."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}]
+        }
+        mock_gmail_service.users().messages().get().execute.return_value = (
+            self._long_message("msg1")
+        )
 
-        # Mock returns different message for each call
-        mock_gmail_service.users().messages().get().execute.side_effect = messages
+        results = await get_unread_emails(limit=1)
+
+        assert len(results) == 1
+        assert len(results[0].text) < 400
+        assert 'Call get_email with message_id "msg1" and offset 93' in (
+            results[0].text
+        )
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_unread_emails.MAX_BODY_CHARS", 1000)
+    @patch("gmail_mcp_server.tools.get_unread_emails.MAX_RESPONSE_CHARS", 1500)
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_shares_response_budget_across_messages(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that the response stays within budget and counts what is left out."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}, {"id": "msg2"}, {"id": "msg3"}]
+        }
+        mock_gmail_service.users().messages().get().execute.side_effect = [
+            self._long_message(f"msg{i}") for i in range(1, 4)
+        ]
 
-        message_ids = ["msg1", "msg2", "msg3"]
-        results = await _list_all_email_content(mock_gmail_service, message_ids)
+        results = await get_unread_emails(limit=3)
 
+        # The second body shrinks to fit, the third message is left out
+        assert sum(len(r.text) for r in results) <= 1500
+        assert [r.text.split("\n")[0] for r in results[:2]] == [
+            "ID: msg1",
+            "ID: msg2",
+        ]
+        assert 'message_id "msg2" and offset' in results[1].text
+        assert results[2].text.startswith("[Omitted 1 more unread email(s)")
         assert len(results) == 3
-        assert results == messages
+
+
+class TestUnreadEmailModes:
+    """Tests for the metadata and snippet triage modes."""
+
+    @staticmethod
+    def _metadata_message(message_id):
+        return {
+            "id": message_id,
+            "threadId": f"thread-{message_id}",
+            "snippet": "Are you free on Friday? I&#39;ll book a table",
+            "payload": {
+                "headers": [
+                    {"name": "From", "value": "jane@example.com"},
+                    {"name": "Subject", "value": "Lunch"},
+                    {"name": "Date", "value": "Mon, 01 Jan 2024 12:00:00"},
+                ]
+            },
+        }
 
     @pytest.mark.asyncio
-    async def test_handles_empty_message_list(self, mock_gmail_service):
-        """Test handling empty message list."""
-        results = await _list_all_email_content(mock_gmail_service, [])
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_metadata_mode_returns_one_line_per_email(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that metadata mode returns compact header lines."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}, {"id": "msg2"}]
+        }
+        mock_gmail_service.users().messages().get().execute.side_effect = [
+            self._metadata_message("msg1"),
+            self._metadata_message("msg2"),
+        ]
 
-        assert results == []
+        results = await get_unread_emails(limit=2, mode="metadata")
+
+        assert [r.text for r in results] == [
+            "ID: msg1 | Thread ID: thread-msg1 | Date: Mon, 01 Jan 2024 12:00:00 | "
+            "From: jane@example.com | Subject: Lunch",
+            "ID: msg2 | Thread ID: thread-msg2 | Date: Mon, 01 Jan 2024 12:00:00 | "
+            "From: jane@example.com | Subject: Lunch",
+        ]
 
     @pytest.mark.asyncio
-    async def test_retrieves_single_email_in_list(self, mock_gmail_service):
-        """Test retrieving a single email in a list."""
-        message = {"id": "msg1", "threadId": "thread1", "payload": {"headers": []}}
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_snippet_mode_adds_unescaped_snippet(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that snippet mode adds Gmail's snippet as a second line."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}]
+        }
+        mock_gmail_service.users().messages().get().execute.return_value = (
+            self._metadata_message("msg1")
+        )
+
+        results = await get_unread_emails(limit=1, mode="snippet")
+
+        assert results[0].text.endswith(
+            "\nSnippet: Are you free on Friday? I'll book a table"
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetches_metadata_format_without_caching(
+        self, mock_gmail_service, isolated_message_cache
+    ):
+        """Test that triage fetches only headers and keeps them out of the cache."""
+        mock_get = mock_gmail_service.users().messages().get
+        mock_get().execute.return_value = self._metadata_message("msg1")
+        mock_get.reset_mock()
+
+        await list_email_content(mock_gmail_service, ["msg1"], metadata_only=True)
+
+        mock_get.assert_called_once_with(
+            userId="me",
+            id="msg1",
+            format="metadata",
+            metadataHeaders=["From", "Subject", "Date"],
+            fields=MESSAGE_TRIAGE_FIELDS,
+        )
+        assert isolated_message_cache.get_many(["msg1"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_metadata_mode_uses_cached_full_messages(
+        self, mock_gmail_service, isolated_message_cache
+    ):
+        """Test that cached full messages serve triage without a request."""
+        cached = self._metadata_message("msg1")
+        isolated_message_cache.put_many({"msg1": cached})
+        mock_get = mock_gmail_service.users().messages().get
+        mock_get.reset_mock()
+
+        results = await list_email_content(
+            mock_gmail_service, ["msg1"], metadata_only=True
+        )
+
+        assert results == [cached]
+        mock_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_unread_emails.MAX_RESPONSE_CHARS", 300)
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_budgets_summary_lines(self, mock_get_service, mock_gmail_service):
+        """Test that triage lines past the response budget become one note."""
+        mock_get_service.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": f"msg{i}"} for i in (1, 2, 3)]
+        }
+        mock_gmail_service.users().messages().get().execute.side_effect = [
+            self._metadata_message(f"msg{i}") for i in (1, 2, 3)
+        ]
+
+        results = await get_unread_emails(limit=3, mode="metadata")
+
+        assert len(results) == 2
+        assert results[0].text.startswith("ID: msg1 |")
+        assert results[1].text.startswith("[Omitted 2 more unread email(s)")
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_mode(self):
+        """Test that an unknown mode is refused before any request."""
+        with pytest.raises(ValueError, match="mode must be one of"):
+            await get_unread_emails(limit=5, mode="headers")
+
+
+class TestUnreadEmailThreads:
+    """Tests for grouping unread emails by conversation."""
+
+    @staticmethod
+    def _message(message_id, thread_id, body, internal_date=None):
+        message = {
+            "id": message_id,
+            "threadId": thread_id,
+            "payload": {
+                "headers": [{"name": "Subject", "value": f"About {thread_id}"}],
+                "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()},
+            },
+        }
+        if internal_date is not None:
+            message["internalDate"] = internal_date
+        return message
+
+    @staticmethod
+    def _list_unread(mock_gmail_service, *messages):
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": m, "threadId": t} for m, t in messages]
+        }
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_fetches_each_thread_once(
+        self, mock_get_service, mock_gmail_service, isolated_message_cache
+    ):
+        """Test that a thread with several unread messages is one threads.get."""
+        mock_get_service.return_value = mock_gmail_service
+        self._list_unread(
+            mock_gmail_service, ("msg3", "t1"), ("msg2", "t2"), ("msg1", "t1")
+        )
+        mock_thread_get = mock_gmail_service.users().threads().get
+        mock_thread_get().execute.return_value = {
+            "id": "t1",
+            "messages": [
+                self._message("msg0", "t1", "Already read"),
+                self._message("msg1", "t1", "First"),
+                self._message("msg3", "t1", "Third"),
+            ],
+        }
+        mock_thread_get.reset_mock()
+        mock_message_get = mock_gmail_service.users().messages().get
+        mock_message_get().execute.return_value = self._message("msg2", "t2", "Other")
+        mock_message_get.reset_mock()
+
+        results = await get_unread_emails(limit=3, group_by_thread=True)
+
+        assert len(results) == 2
+        assert results[0].text.startswith("Thread ID: t1\nUnread messages: 2\n")
+        assert results[0].text.index("First") < results[0].text.index("Third")
+        assert "Already read" not in results[0].text
+        assert results[1].text.startswith("Thread ID: t2\nUnread messages: 1\n")
+        mock_thread_get.assert_called_once_with(
+            userId="me", id="t1", fields=THREAD_DISPLAY_FIELDS
+        )
+        mock_message_get.assert_called_once_with(
+            userId="me", id="msg2", fields=MESSAGE_DISPLAY_FIELDS
+        )
+        mock_gmail_service.new_batch_http_request.assert_called_once()
+        # The whole thread is cached for a later get_thread
+        assert set(isolated_message_cache.get_many(["msg0", "msg1", "msg3"])) == {
+            "msg0",
+            "msg1",
+            "msg3",
+        }
 
-        mock_gmail_service.users().messages().get().execute.return_value = message
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_collapses_repeated_bodies(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that a body seen earlier in the thread is not shown again."""
+        mock_get_service.return_value = mock_gmail_service
+        self._list_unread(mock_gmail_service, ("msg2", "t1"), ("msg1", "t1"))
+        mock_gmail_service.users().threads().get().execute.return_value = {
+            "id": "t1",
+            "messages": [
+                self._message("msg1", "t1", "Quarterly numbers attached."),
+                self._message("msg2", "t1", "Quarterly numbers attached."),
+            ],
+        }
 
-        results = await _list_all_email_content(mock_gmail_service, ["msg1"])
+        results = await get_unread_emails(limit=2, group_by_thread=True)
 
         assert len(results) == 1
-        assert results[0] == message
+        assert results[0].text.count("Quarterly numbers attached.") == 1
+        assert "[Same body as message msg1]" in results[0].text
 
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_groups_summary_lines(self, mock_get_service, mock_gmail_service):
+        """Test that triage modes list one line per message under the thread."""
+        mock_get_service.return_value = mock_gmail_service
+        self._list_unread(mock_gmail_service, ("msg2", "t1"), ("msg1", "t1"))
+        mock_thread_get = mock_gmail_service.users().threads().get
+        mock_thread_get().execute.return_value = {
+            "id": "t1",
+            "messages": [
+                self._message("msg1", "t1", ""),
+                self._message("msg2", "t1", ""),
+            ],
+        }
+        mock_thread_get.reset_mock()
 
-class TestGmailAPIError:
-    """Tests for GmailAPIError exception."""
+        results = await get_unread_emails(
+            limit=2, mode="metadata", group_by_thread=True
+        )
 
-    def test_gmail_api_error_is_exception(self):
-        """Test that GmailAPIError is an Exception."""
-        assert issubclass(GmailAPIError, Exception)
+        lines = results[0].text.splitlines()
+        assert lines[3].startswith("ID: msg1 | Thread ID: t1")
+        assert lines[4].startswith("ID: msg2 | Thread ID: t1")
+        assert mock_thread_get.call_args.kwargs["format"] == "metadata"
 
-    def test_gmail_api_error_can_be_raised(self):
-        """Test that GmailAPIError can be raised with message."""
-        with pytest.raises(GmailAPIError) as exc_info:
-            raise GmailAPIError("Test error message")
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_orders_conversation_by_internal_date(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that messages follow internalDate, not their place in the index."""
+        mock_get_service.return_value = mock_gmail_service
+        # Listed newest first, but msgA was re-marked unread and is older
+        self._list_unread(mock_gmail_service, ("msgA", "t1"), ("msgB", "t1"))
+        mock_gmail_service.users().threads().get().execute.return_value = {
+            "id": "t1",
+            "messages": [
+                self._message("msgA", "t1", "Original", internal_date="1000"),
+                self._message("msgB", "t1", "Follow-up", internal_date="2000"),
+            ],
+        }
+
+        results = await get_unread_emails(limit=2, group_by_thread=True)
+
+        assert results[0].text.index("Original") < results[0].text.index("Follow-up")
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_unread_emails.MAX_RESPONSE_CHARS", 250)
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_budgets_grouped_summary_lines(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that grouped triage lines stop at the response budget."""
+        mock_get_service.return_value = mock_gmail_service
+        self._list_unread(
+            mock_gmail_service, ("msg3", "t1"), ("msg2", "t1"), ("msg1", "t1")
+        )
+        mock_gmail_service.users().threads().get().execute.return_value = {
+            "id": "t1",
+            "messages": [self._message(f"msg{i}", "t1", "") for i in (1, 2, 3)],
+        }
+
+        results = await get_unread_emails(
+            limit=3, mode="metadata", group_by_thread=True
+        )
+
+        assert len(results) == 2
+        assert results[0].text.count("| Thread ID: t1 |") == 1
+        assert results[1].text.startswith("[Omitted 2 more unread email(s)")
+        assert sum(len(r.text) for r in results) <= 250
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_unread_emails.MAX_BODY_CHARS", 1000)
+    @patch("gmail_mcp_server.tools.get_unread_emails.MAX_RESPONSE_CHARS", 1700)
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_budgets_grouped_bodies(self, mock_get_service, mock_gmail_service):
+        """Test that conversations past the response budget are left out."""
+        mock_get_service.return_value = mock_gmail_service
+        self._list_unread(
+            mock_gmail_service, ("msg1", "t1"), ("msg2", "t2"), ("msg3", "t3")
+        )
+        mock_gmail_service.users().messages().get().execute.side_effect = [
+            self._message(f"msg{i}", f"t{i}", "A sentence of text. " * 100)
+            for i in (1, 2, 3)
+        ]
+
+        results = await get_unread_emails(limit=3, group_by_thread=True)
+
+        assert [r.text.split("\n")[0] for r in results[:2]] == [
+            "Thread ID: t1",
+            "Thread ID: t2",
+        ]
+        assert results[2].text.startswith("[Omitted 1 more unread email(s)")
+        assert sum(len(r.text) for r in results) <= 1700
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_unread_emails.MAX_RESPONSE_CHARS", 500)
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_budgets_repeated_body_lines(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that lines standing in for repeated bodies count against the budget."""
+        mock_get_service.return_value = mock_gmail_service
+        ids = [f"msg{i}" for i in range(10, 0, -1)]
+        self._list_unread(mock_gmail_service, *((m, "t1") for m in ids))
+        mock_gmail_service.users().threads().get().execute.return_value = {
+            "id": "t1",
+            "messages": [self._message(m, "t1", "Same text") for m in reversed(ids)],
+        }
+
+        results = await get_unread_emails(limit=10, group_by_thread=True)
+
+        assert "[Same body as message msg1]" in results[0].text
+        assert results[-1].text.startswith("[Omitted ")
+        assert sum(len(r.text) for r in results) <= 500
+
+
+class TestUnreadEmailPagination:
+    """Tests for paginated listing and streaming of unread emails."""
+
+    @staticmethod
+    def _message(message_id):
+        return {
+            "id": message_id,
+            "threadId": f"thread_{message_id}",
+            "payload": {
+                "headers": [{"name": "Subject", "value": f"Subject {message_id}"}],
+                "body": {"data": base64.urlsafe_b64encode(b"Body").decode()},
+            },
+        }
+
+    def _setup_pages(self, mock_gmail_service, pages):
+        """Serve list pages keyed by pageToken and messages keyed by ID."""
+        list_calls = []
+
+        def _list(**kwargs):
+            list_calls.append(kwargs)
+            request = Mock()
+            request.execute.return_value = pages[kwargs.get("pageToken")]
+            return request
+
+        def _get(**kwargs):
+            request = Mock()
+            request.execute.return_value = self._message(kwargs["id"])
+            return request
+
+        mock_gmail_service.users().messages().list.side_effect = _list
+        mock_gmail_service.users().messages().get.side_effect = _get
+        return list_calls
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.services.mailbox_sync.LIST_PAGE_SIZE", 2)
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_follows_next_page_token(self, mock_get_service, mock_gmail_service):
+        """Test that results span several pages in order."""
+        mock_get_service.return_value = mock_gmail_service
+        list_calls = self._setup_pages(
+            mock_gmail_service,
+            {
+                None: {"messages": [{"id": "m1"}, {"id": "m2"}], "nextPageToken": "p2"},
+                "p2": {"messages": [{"id": "m3"}, {"id": "m4"}], "nextPageToken": "p3"},
+                "p3": {"messages": [{"id": "m5"}]},
+            },
+        )
+
+        results = await get_unread_emails(limit=10)
+
+        assert [r.text.split("\n")[0] for r in results] == [
+            f"ID: m{i}" for i in range(1, 6)
+        ]
+        assert [call.get("pageToken") for call in list_calls] == [None, "p2", "p3"]
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.services.mailbox_sync.LIST_PAGE_SIZE", 2)
+    async def test_stops_listing_once_limit_reached(self, mock_gmail_service):
+        """Test that no further pages are requested after the limit."""
+        list_calls = self._setup_pages(
+            mock_gmail_service,
+            {
+                None: {"messages": [{"id": "m1"}, {"id": "m2"}], "nextPageToken": "p2"},
+                "p2": {"messages": [{"id": "m3"}, {"id": "m4"}], "nextPageToken": "p3"},
+            },
+        )
+
+        pages = [
+            page
+            async for page in unread_mailbox_sync.iter_unread_message_id_pages(
+                mock_gmail_service, 3
+            )
+        ]
+
+        assert pages == [["m1", "m2"], ["m3"]]
+        assert [call["maxResults"] for call in list_calls] == [2, 1]
+        assert len(list_calls) == 2
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.services.mailbox_sync.LIST_PAGE_SIZE", 2)
+    async def test_prefetches_next_page(self, mock_gmail_service):
+        """Test that the next page is requested before the current one is consumed."""
+        list_calls = self._setup_pages(
+            mock_gmail_service,
+            {
+                None: {"messages": [{"id": "m1"}, {"id": "m2"}], "nextPageToken": "p2"},
+                "p2": {"messages": [{"id": "m3"}]},
+            },
+        )
+
+        pages = unread_mailbox_sync.iter_unread_message_id_pages(mock_gmail_service, 10)
+        first_page = await anext(pages)
+        # Give the prefetch a chance to run
+        await asyncio.sleep(0.05)
+
+        assert first_page == ["m1", "m2"]
+        assert [call.get("pageToken") for call in list_calls] == [None, "p2"]
+        await pages.aclose()
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.services.mailbox_sync.LIST_PAGE_SIZE", 2)
+    @patch("gmail_mcp_server.tools.get_unread_emails.MAX_RESPONSE_CHARS", 250)
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_stops_fetching_once_budget_spent(
+        self, mock_get_service, mock_gmail_service
+    ):
+        """Test that no further pages are listed or downloaded past the budget."""
+        mock_get_service.return_value = mock_gmail_service
+        list_calls = self._setup_pages(
+            mock_gmail_service,
+            {
+                None: {"messages": [{"id": "m1"}, {"id": "m2"}], "nextPageToken": "p2"},
+                "p2": {"messages": [{"id": "m3"}, {"id": "m4"}], "nextPageToken": "p3"},
+                "p3": {"messages": [{"id": "m5"}, {"id": "m6"}], "nextPageToken": "p4"},
+                "p4": {"messages": [{"id": "m7"}]},
+            },
+        )
+
+        results = await get_unread_emails(limit=10)
+
+        requested = {
+            call.kwargs["id"]
+            for call in mock_gmail_service.users().messages().get.call_args_list
+        }
+        assert sum(len(r.text) for r in results) <= 250
+        assert results[-1].text.startswith("[Omitted 3 more unread email(s)")
+        assert len(list_calls) < 4
+        assert not requested & {"m5", "m6", "m7"}
+
+    @pytest.mark.asyncio
+    @patch("gmail_mcp_server.tools.get_unread_emails.get_gmail_api_service")
+    async def test_streams_results(self, mock_get_service, mock_gmail_service):
+        """Test that iter_unread_emails yields formatted emails one by one."""
+        mock_get_service.return_value = mock_gmail_service
+        self._setup_pages(
+            mock_gmail_service, {None: {"messages": [{"id": "m1"}, {"id": "m2"}]}}
+        )
+
+        stream = iter_unread_emails(limit=2)
+        first = await anext(stream)
+        await stream.aclose()
 
-        assert str(exc_info.value) == "Test error message"
+        assert first.type == "text"
+        assert "ID: m1" in first.text
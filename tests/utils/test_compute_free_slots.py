@@ -0,0 +1,127 @@
+"""
+Tests for compute_free_slots utility.
+"""
+
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from gmail_mcp_server.utils.compute_free_slots import (
+    compute_free_slots,
+    merge_intervals,
+)
+
+
+def _utc(day, hour, minute=0):
+    return datetime(2025, 1, day, hour, minute, tzinfo=timezone.utc)
+
+
+class TestMergeIntervals:
+    """Tests for merge_intervals function."""
+
+    def test_merges_overlapping_and_touching(self):
+        """Test that overlapping and touching intervals are joined."""
+        intervals = [
+            (_utc(15, 13), _utc(15, 14)),
+            (_utc(15, 9), _utc(15, 10)),
+            (_utc(15, 10), _utc(15, 11)),
+            (_utc(15, 9, 30), _utc(15, 10, 30)),
+        ]
+
+        assert merge_intervals(intervals) == [
+            (_utc(15, 9), _utc(15, 11)),
+            (_utc(15, 13), _utc(15, 14)),
+        ]
+
+    def test_empty_input(self):
+        """Test that no intervals merge to none."""
+        assert merge_intervals([]) == []
+
+
+class TestComputeFreeSlots:
+    """Tests for compute_free_slots function."""
+
+    def test_whole_working_day_when_not_busy(self):
+        """Test that an empty calendar yields the working hours."""
+        slots = compute_free_slots([], _utc(15, 0), _utc(16, 0))
+
+        assert slots == [(_utc(15, 9), _utc(15, 17))]
+
+    def test_subtracts_busy_periods(self):
+        """Test that busy periods split the working day."""
+        busy = [(_utc(15, 10), _utc(15, 11)), (_utc(15, 8), _utc(15, 9, 30))]
+
+        slots = compute_free_slots(busy, _utc(15, 0), _utc(16, 0))
+
+        assert slots == [
+            (_utc(15, 9, 30), _utc(15, 10)),
+            (_utc(15, 11), _utc(15, 17)),
+        ]
+
+    def test_drops_slots_shorter_than_minimum(self):
+        """Test that slots below min_duration are left out."""
+        busy = [(_utc(15, 9, 15), _utc(15, 16, 30))]
+
+        slots = compute_free_slots(
+            busy, _utc(15, 0), _utc(16, 0), min_duration=timedelta(minutes=20)
+        )
+
+        assert slots == [(_utc(15, 16, 30), _utc(15, 17))]
+
+    def test_skips_non_working_days(self):
+        """Test that weekends are not offered."""
+        # 17 January 2025 is a Friday
+        slots = compute_free_slots([], _utc(17, 0), _utc(21, 0))
+
+        assert [slot[0].date().day for slot in slots] == [17, 20]
+
+    def test_clips_to_requested_range(self):
+        """Test that slots never extend outside the requested range."""
+        slots = compute_free_slots([], _utc(15, 12), _utc(15, 15))
+
+        assert slots == [(_utc(15, 12), _utc(15, 15))]
+
+    def test_busy_period_spanning_days(self):
+        """Test that a multi-day busy period blocks every day it covers."""
+        busy = [(_utc(15, 12), _utc(16, 12))]
+
+        slots = compute_free_slots(busy, _utc(15, 0), _utc(17, 0))
+
+        assert slots == [
+            (_utc(15, 9), _utc(15, 12)),
+            (_utc(16, 12), _utc(16, 17)),
+        ]
+
+    def test_working_hours_in_time_zone(self):
+        """Test that working hours are applied in the given time zone."""
+        tz = ZoneInfo("America/New_York")
+
+        slots = compute_free_slots(
+            [],
+            _utc(15, 0),
+            _utc(16, 12),
+            working_hours=(time(9), time(10)),
+            tz=tz,
+        )
+
+        assert slots == [
+            (
+                datetime(2025, 1, 15, 9, tzinfo=tz),
+                datetime(2025, 1, 15, 10, tzinfo=tz),
+            )
+        ]
+        assert slots[0][0] == _utc(15, 14)
+
+    def test_overnight_working_hours(self):
+        """Test that working hours may run past midnight."""
+        slots = compute_free_slots(
+            [],
+            _utc(15, 0),
+            _utc(16, 12),
+            working_hours=(time(22), time(6)),
+            working_days=range(7),
+        )
+
+        assert slots == [
+            (_utc(15, 0), _utc(15, 6)),
+            (_utc(15, 22), _utc(16, 6)),
+        ]
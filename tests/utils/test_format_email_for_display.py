@@ -157,3 +157,67 @@ class TestFormatEmailForDisplay:
 
         assert long_body in result
         assert "ID: msg_long" in result
+
+    def test_truncates_body_with_continuation_marker(self):
+        """Test that a long body is cut and names the get_email call to continue."""
+        body = "First sentence here. " * 20
+        message = {
+            "id": "msg42",
+            "threadId": "thread42",
+            "payload": {
+                "headers": [],
+                "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()},
+            },
+        }
+
+        result = format_email_for_display(message, max_body_chars=50)
+
+        assert "Body:\nFirst sentence here. First sentence here. \n" in result
+        assert (
+            f"[Truncated: {len(body) - 42} more characters. Call get_email with "
+            f'message_id "msg42" and offset 42 to read on.]'
+        ) in result
+
+    def test_continues_body_from_offset(self):
+        """Test that a body can be read on from an offset."""
+        body = "First sentence here. " * 3
+        message = {
+            "id": "msg42",
+            "threadId": "thread42",
+            "payload": {
+                "headers": [],
+                "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()},
+            },
+        }
+
+        result = format_email_for_display(message, max_body_chars=50, body_offset=42)
+
+        assert f"Body (characters 42-{len(body)} of {len(body)}):" in result
+        assert "Truncated" not in result
+
+    def test_untruncated_body_has_no_marker(self, sample_email_message):
+        """Test that bodies within the budget are shown in full."""
+        result = format_email_for_display(sample_email_message, max_body_chars=1000)
+
+        assert result == format_email_for_display(sample_email_message)
+        assert "Truncated" not in result
+
+    def test_strips_quotes_when_asked(self):
+        """Test that quoted history is removed and the saving reported."""
+        body = "Works for me.\n\nOn Mon, Jane wrote:\n> Shall we meet at 3?"
+        message = {
+            "id": "msg7",
+            "threadId": "thread7",
+            "payload": {
+                "headers": [],
+                "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()},
+            },
+        }
+
+        stripped = format_email_for_display(message, strip_quotes=True)
+        unstripped = format_email_for_display(message)
+
+        assert "Body:\nWorks for me.\n" in stripped
+        assert "Shall we meet" not in stripped
+        assert "[Quoted text and signature removed: 43 bytes]" in stripped
+        assert "Shall we meet" in unstripped
@@ -0,0 +1,53 @@
+"""
+Tests for format_email_summary utility.
+"""
+
+from gmail_mcp_server.utils.format_email_summary import format_email_summary
+
+
+class TestFormatEmailSummary:
+    """Tests for format_email_summary function."""
+
+    def test_formats_one_line(self, sample_email_message):
+        """Test that IDs and headers share a single line."""
+        result = format_email_summary(sample_email_message)
+
+        assert result == (
+            "ID: msg123 | Thread ID: thread456 | "
+            "Date: Mon, 01 Jan 2024 12:00:00 +0000 | "
+            "From: sender@example.com | Subject: Test Email"
+        )
+
+    def test_uses_placeholders_for_missing_headers(self):
+        """Test that missing headers fall back to placeholders."""
+        message = {"id": "msg1", "threadId": "thread1", "payload": {"headers": []}}
+
+        result = format_email_summary(message)
+
+        assert "Date: Unknown" in result
+        assert "From: Unknown" in result
+        assert "Subject: (No Subject)" in result
+
+    def test_adds_unescaped_snippet(self):
+        """Test that the snippet is unescaped onto a second line."""
+        message = {
+            "id": "msg1",
+            "threadId": "thread1",
+            "snippet": "Tom &amp; Jerry&#39;s plans",
+            "payload": {"headers": []},
+        }
+
+        result = format_email_summary(message, include_snippet=True)
+
+        assert result.splitlines()[1] == "Snippet: Tom & Jerry's plans"
+
+    def test_omits_snippet_by_default(self):
+        """Test that the snippet is left out unless requested."""
+        message = {
+            "id": "msg1",
+            "threadId": "thread1",
+            "snippet": "Preview",
+            "payload": {"headers": []},
+        }
+
+        assert "\n" not in format_email_summary(message)
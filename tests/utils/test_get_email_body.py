@@ -226,3 +226,40 @@ class TestGetEmailBody:
 
         result = get_email_body(payload)
         assert result == body_text
+
+    def test_html_as_text_converts_html_fallback(self):
+        """Test that HTML-only multipart bodies are converted when asked."""
+        text_html = "<html><style>p{}</style><body><p>HTML only</p></body></html>"
+        payload = {
+            "parts": [
+                {
+                    "mimeType": "text/html",
+                    "body": {
+                        "data": base64.urlsafe_b64encode(text_html.encode()).decode()
+                    },
+                }
+            ]
+        }
+
+        assert get_email_body(payload, html_as_text=True) == "HTML only"
+        assert get_email_body(payload) == text_html
+
+    def test_html_as_text_converts_single_part_html(self):
+        """Test that a single-part text/html message is converted when asked."""
+        payload = {
+            "mimeType": "text/html",
+            "body": {
+                "data": base64.urlsafe_b64encode(b"<p>Hi <b>there</b></p>").decode()
+            },
+        }
+
+        assert get_email_body(payload, html_as_text=True) == "Hi there"
+
+    def test_html_as_text_leaves_plain_text_alone(self):
+        """Test that text/plain bodies are never run through the converter."""
+        payload = {
+            "mimeType": "text/plain",
+            "body": {"data": base64.urlsafe_b64encode(b"a <b> c").decode()},
+        }
+
+        assert get_email_body(payload, html_as_text=True) == "a <b> c"
@@ -3,6 +3,7 @@ Tests for get_header_value utility.
 """
 
 from gmail_mcp_server.utils.get_header_value import get_header_value
+from gmail_mcp_server.utils.header_index import HeaderIndex
 
 
 class TestGetHeaderValue:
@@ -94,3 +95,14 @@ class TestGetHeaderValue:
         assert get_header_value(headers, "To") == "recipient@example.com"
         assert get_header_value(headers, "Subject") == "Test"
         assert get_header_value(headers, "Date") == "Mon, 01 Jan 2024 12:00:00"
+
+    def test_accepts_header_index(self):
+        """Test that a prebuilt HeaderIndex is looked up the same way."""
+        headers = HeaderIndex(
+            [
+                {"name": "From", "value": "sender@example.com"},
+                {"name": "Subject", "value": "Test Subject"},
+            ]
+        )
+        assert get_header_value(headers, "from") == "sender@example.com"
+        assert get_header_value(headers, "To", "default") == "default"
@@ -0,0 +1,48 @@
+"""
+Tests for HeaderIndex utility.
+"""
+
+from gmail_mcp_server.utils.header_index import HeaderIndex
+
+
+class TestHeaderIndex:
+    """Tests for HeaderIndex class."""
+
+    def test_lookup_is_case_insensitive(self):
+        """Test that names match regardless of case."""
+        headers = HeaderIndex([{"name": "Content-Type", "value": "text/html"}])
+
+        assert headers.get("content-type") == "text/html"
+        assert headers.get("CONTENT-TYPE") == "text/html"
+        assert "Content-TYPE" in headers
+
+    def test_missing_header_returns_default(self):
+        """Test that the default is returned for absent headers."""
+        headers = HeaderIndex([{"name": "From", "value": "sender@example.com"}])
+
+        assert headers.get("To") is None
+        assert headers.get("To", "default@example.com") == "default@example.com"
+        assert "To" not in headers
+
+    def test_first_duplicate_wins(self):
+        """Test that repeated headers resolve to their first occurrence."""
+        headers = HeaderIndex(
+            [
+                {"name": "Received", "value": "first"},
+                {"name": "received", "value": "second"},
+            ]
+        )
+
+        assert headers.get("Received") == "first"
+        assert len(headers) == 1
+
+    def test_malformed_headers(self):
+        """Test that headers missing a name or value do not break the index."""
+        headers = HeaderIndex([{"value": "orphan"}, {"name": "Subject"}])
+
+        assert headers.get("Subject", "default") is None
+        assert headers.get("From") is None
+
+    def test_uses_slots(self):
+        """Test that instances carry no per-instance __dict__."""
+        assert not hasattr(HeaderIndex([]), "__dict__")
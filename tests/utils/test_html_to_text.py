@@ -0,0 +1,162 @@
+"""
+Tests for html_to_text utility.
+"""
+
+import time
+
+import pytest
+
+from gmail_mcp_server.utils.html_to_text import HtmlToTextParser, html_to_text
+
+
+def _newsletter(articles):
+    """Build a table-layout marketing email like those sent by mailing tools."""
+    style = "font-family:Helvetica,Arial,sans-serif;font-size:14px;color:#333333;"
+    rows = "".join(
+        f'<tr><td style="{style}padding:12px 24px;" class="article-{i}">'
+        f'<h2 style="{style}font-size:20px;margin:0;">Headline number {i}</h2>'
+        f'<p style="{style}line-height:1.5;">Story {i} is about something '
+        f"worth reading, told in a couple of sentences of body copy.</p>"
+        f'<a href="https://click.example.com/track?u=abcdef0123456789&amp;id={i}" '
+        f'style="{style}color:#0066cc;text-decoration:underline;">Read more</a>'
+        f"</td></tr>"
+        for i in range(articles)
+    )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        "<style>@media only screen and (max-width:600px){.article{width:100%}}"
+        "</style></head><body>"
+        '<div style="display:none;max-height:0;overflow:hidden;">Preview text</div>'
+        f'<table width="600" cellpadding="0" cellspacing="0">{rows}</table>'
+        '<img src="https://open.example.com/pixel.gif" width="1" height="1" alt="">'
+        "</body></html>"
+    )
+
+
+class TestHtmlToText:
+    """Tests for html_to_text function."""
+
+    def test_drops_style_script_and_head(self):
+        """Test that non-content elements contribute no text."""
+        html = (
+            "<html><head><title>Title</title><style>p {color: red}</style></head>"
+            "<body><script>track()</script><p>Hello</p></body></html>"
+        )
+
+        assert html_to_text(html) == "Hello"
+
+    @pytest.mark.parametrize(
+        "attributes",
+        [
+            'style="display: none"',
+            'style="visibility:hidden"',
+            "hidden",
+            'aria-hidden="true"',
+        ],
+    )
+    def test_drops_hidden_elements(self, attributes):
+        """Test that hidden preheaders and similar are dropped."""
+        html = f"<div {attributes}>Preheader <b>text</b></div><p>Visible</p>"
+
+        assert html_to_text(html) == "Visible"
+
+    def test_hidden_element_ends_with_its_parent(self):
+        """Test that an unclosed hidden child does not hide the rest of the mail."""
+        html = "<div><span hidden>hidden<i>x</div><p>Visible</p>"
+
+        assert html_to_text(html) == "Visible"
+
+    def test_collapses_whitespace(self):
+        """Test that runs of whitespace become single spaces."""
+        html = "<p>  Hello \n\n   <b>big</b>\t world  </p>"
+
+        assert html_to_text(html) == "Hello big world"
+
+    def test_preserves_preformatted_text(self):
+        """Test that whitespace inside pre is kept."""
+        assert html_to_text("<pre>a  b\n  c</pre>") == "a  b\n  c"
+
+    def test_block_elements_start_new_lines(self):
+        """Test that paragraphs, breaks and list items are separated."""
+        html = "<h1>Title</h1><p>One<br>Two</p><ul><li>A<li>B</ul><div>End</div>"
+
+        assert html_to_text(html) == "Title\n\nOne\nTwo\n\n- A\n- B\n\nEnd"
+
+    def test_keeps_links_compactly(self):
+        """Test that links become text followed by the URL."""
+        html = (
+            '<p><a href="https://example.com/a">Docs</a>, '
+            '<a href="https://example.com">https://example.com</a>, '
+            '<a href="mailto:me@example.com">me@example.com</a>, '
+            '<a href="#top">top</a></p>'
+        )
+
+        assert html_to_text(html) == (
+            "Docs (https://example.com/a), https://example.com, me@example.com, top"
+        )
+
+    def test_decodes_character_references(self):
+        """Test that entities are converted to characters."""
+        assert html_to_text("<p>Fish &amp; chips &mdash; &#163;5</p>") == (
+            "Fish & chips — £5"
+        )
+
+    def test_table_cells_are_separated(self):
+        """Test that adjacent cells do not run together."""
+        html = "<table><tr><td>Name</td><td>Value</td></tr></table>"
+
+        assert html_to_text(html) == "Name Value"
+
+    def test_streams_chunks(self):
+        """Test that HTML fed in arbitrary chunks gives the same text."""
+        html = _newsletter(5)
+        parser = HtmlToTextParser()
+        for start in range(0, len(html), 37):
+            parser.feed(html[start : start + 37])
+
+        assert parser.text() == html_to_text(html)
+
+    def test_newsletter_is_reduced_to_readable_text(self):
+        """Test that markup, CSS, preheaders and pixels are removed."""
+        text = html_to_text(_newsletter(2))
+
+        assert text == (
+            "Headline number 0\n\n"
+            "Story 0 is about something worth reading, told in a couple of "
+            "sentences of body copy.\n\n"
+            "Read more (https://click.example.com/track?u=abcdef0123456789&id=0)\n"
+            "Headline number 1\n\n"
+            "Story 1 is about something worth reading, told in a couple of "
+            "sentences of body copy.\n\n"
+            "Read more (https://click.example.com/track?u=abcdef0123456789&id=1)"
+        )
+
+
+@pytest.mark.slow
+class TestHtmlToTextBenchmark:
+    """Throughput of html_to_text on newsletter-sized HTML."""
+
+    @pytest.mark.parametrize("articles", [20, 100, 1000])
+    def test_converts_real_world_sizes_quickly(self, articles):
+        """Test 10 KB to 1 MB newsletters convert fast and shrink several-fold."""
+        html = _newsletter(articles)
+
+        started = time.perf_counter()
+        text = html_to_text(html)
+        elapsed = time.perf_counter() - started
+
+        # About 1 KB of HTML per article; allow slow CI machines plenty of room
+        assert elapsed < len(html) / 200_000
+        assert len(text) * 3 < len(html)
+
+    def test_whitespace_inline_runs_stay_linear(self):
+        """Test that long runs of whitespace-only inline elements stay fast."""
+        html = "<p>Start" + "<span> </span>" * 32_000 + "end</p>"
+
+        started = time.perf_counter()
+        text = html_to_text(html)
+        elapsed = time.perf_counter() - started
+
+        # About 448 KB; checking the line start by rescanning output took ~20 s
+        assert elapsed < len(html) / 200_000
+        assert text == "Start end"
@@ -0,0 +1,117 @@
+"""
+Tests for ParsedMessage utility.
+"""
+
+import base64
+
+from gmail_mcp_server.utils.format_email_for_display import format_email_for_display
+from gmail_mcp_server.utils.get_email_body import get_email_body
+from gmail_mcp_server.utils.parsed_message import ParsedMessage
+
+
+def _encode(text):
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+class TestParsedMessage:
+    """Tests for ParsedMessage class."""
+
+    def test_parses_message_fields(self, sample_email_message):
+        """Test that the displayed fields are taken from the API message."""
+        sample_email_message.update(
+            labelIds=["UNREAD", "INBOX"], snippet="Hello", internalDate="1704110400000"
+        )
+
+        message = ParsedMessage.from_api(sample_email_message)
+
+        assert message.id == "msg123"
+        assert message.thread_id == "thread456"
+        assert message.label_ids == ("UNREAD", "INBOX")
+        assert message.snippet == "Hello"
+        assert message.internal_date == "1704110400000"
+        assert message.headers.get("subject") == "Test Email"
+
+    def test_optional_fields_default(self):
+        """Test that messages without labels, snippet or date still parse."""
+        message = ParsedMessage.from_api(
+            {"id": "msg1", "threadId": "t1", "payload": {"headers": []}}
+        )
+
+        assert message.label_ids == ()
+        assert message.snippet == ""
+        assert message.internal_date is None
+
+    def test_body_is_decoded_once_and_source_released(self, sample_email_message):
+        """Test that the body is decoded lazily and the encoded data dropped."""
+        message = ParsedMessage.from_api(sample_email_message)
+        assert message._body is None
+
+        assert message.body == "Hello, this is a test email."
+        assert message._body_source is None
+        assert message.body == "Hello, this is a test email."
+
+    def test_keeps_only_text_bodies(self):
+        """Test that attachments and other parts are not retained."""
+        message = ParsedMessage.from_api(
+            {
+                "id": "msg1",
+                "threadId": "t1",
+                "payload": {
+                    "mimeType": "multipart/mixed",
+                    "headers": [{"name": "Subject", "value": "Report"}],
+                    "parts": [
+                        {
+                            "mimeType": "multipart/alternative",
+                            "parts": [
+                                {
+                                    "mimeType": "text/plain",
+                                    "body": {"data": _encode("See attached")},
+                                }
+                            ],
+                        },
+                        {
+                            "mimeType": "application/pdf",
+                            "body": {"data": _encode("%PDF"), "size": 4},
+                        },
+                    ],
+                },
+            }
+        )
+
+        assert message._body_source == {
+            "parts": [
+                {
+                    "parts": [
+                        {
+                            "mimeType": "text/plain",
+                            "body": {"data": _encode("See attached")},
+                        }
+                    ]
+                }
+            ]
+        }
+        assert message.body == "See attached"
+
+    def test_body_matches_get_email_body(self, sample_email_payload_multipart):
+        """Test that body selection is the same as on the raw payload."""
+        payload = {"headers": [], **sample_email_payload_multipart}
+        message = ParsedMessage.from_api(
+            {"id": "msg1", "threadId": "t1", "payload": payload}
+        )
+
+        assert message.body == get_email_body(payload)
+
+    def test_helpers_accept_parsed_message(self, sample_email_message):
+        """Test that get_email_body and format_email_for_display take the model."""
+        message = ParsedMessage.from_api(sample_email_message)
+
+        assert get_email_body(message) == "Hello, this is a test email."
+        assert format_email_for_display(message) == format_email_for_display(
+            sample_email_message
+        )
+
+    def test_uses_slots(self, sample_email_message):
+        """Test that instances carry no per-instance __dict__."""
+        message = ParsedMessage.from_api(sample_email_message)
+
+        assert not hasattr(message, "__dict__")
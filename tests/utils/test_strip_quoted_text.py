@@ -0,0 +1,110 @@
+"""
+Tests for strip_quoted_text utility.
+"""
+
+import time
+
+import pytest
+
+from gmail_mcp_server.utils.strip_quoted_text import StrippedText, strip_quoted_text
+
+
+class TestStripQuotedText:
+    """Tests for strip_quoted_text function."""
+
+    def test_removes_attribution_and_quote(self):
+        """Test that a top-posted reply loses the quoted message."""
+        text = (
+            "Sounds good.\n\nOn Mon, 1 Jan 2024, Jane <j@example.com> wrote:\n> Lunch?"
+        )
+
+        assert strip_quoted_text(text) == StrippedText(
+            "Sounds good.", len(text) - len("Sounds good.")
+        )
+
+    def test_removes_attribution_wrapped_over_two_lines(self):
+        """Test that Gmail's wrapped attribution line is recognised."""
+        text = (
+            "Yes.\n\nOn Mon, Jan 1, 2024 at 12:00 PM Jane Doe <jane@example.com>\n"
+            "wrote:\n> Can you make it?"
+        )
+
+        assert strip_quoted_text(text).text == "Yes."
+
+    def test_removes_unquoted_history_after_attribution(self):
+        """Test that history converted from HTML (no > markers) is cut off."""
+        text = "Yes.\n\nOn Mon, Jane wrote:\nCan you make it?\nThanks"
+
+        assert strip_quoted_text(text).text == "Yes."
+
+    def test_keeps_inline_replies(self):
+        """Test that answers between quoted lines are kept."""
+        text = (
+            "On Mon, Jane wrote:\n> First question?\nFirst answer.\n"
+            "> Second question?\nSecond answer."
+        )
+
+        assert strip_quoted_text(text).text == "First answer.\nSecond answer."
+
+    @pytest.mark.parametrize(
+        "history",
+        [
+            "-----Original Message-----\nFrom: Bob\nOld text",
+            "---------- Forwarded message ---------\nFrom: Bob\nOld text",
+            "________________________________\nFrom: Bob\nSent: Monday\nOld text",
+            "From: Bob <bob@example.com>\nDate: Monday\nSubject: Hi\n\nOld text",
+        ],
+    )
+    def test_removes_earlier_message_history(self, history):
+        """Test that Outlook and forwarded chains are cut off."""
+        assert strip_quoted_text(f"New text\n\n{history}").text == "New text"
+
+    def test_removes_signature(self):
+        """Test that everything after the -- delimiter is dropped."""
+        text = "Thanks!\n\n-- \nJohn Smith\nCEO, Example Ltd\n+44 20 7946 0000"
+
+        assert strip_quoted_text(text).text == "Thanks!"
+
+    def test_removes_mobile_signature(self):
+        """Test that 'Sent from my iPhone' lines are dropped."""
+        text = "On my way.\n\nSent from my iPhone"
+
+        assert strip_quoted_text(text).text == "On my way."
+
+    def test_counts_removed_bytes_in_utf8(self):
+        """Test that removed size is reported in bytes, not characters."""
+        text = "Merci\n> déjà vu"
+
+        assert strip_quoted_text(text).removed_bytes == len(text.encode()) - 5
+
+    def test_leaves_text_without_quotes_unchanged(self):
+        """Test that ordinary text passes through."""
+        text = "Hello,\n\nThe meeting moved to 3pm - see you there.\n\nBest,\nJane"
+
+        assert strip_quoted_text(text) == StrippedText(text, 0)
+
+    def test_never_removes_everything(self):
+        """Test that a message that is all quote is left alone."""
+        text = "> Only quoted text"
+
+        assert strip_quoted_text(text) == StrippedText(text, 0)
+
+
+@pytest.mark.slow
+class TestStripQuotedTextBenchmark:
+    """Throughput of strip_quoted_text on long threads."""
+
+    def test_reduces_long_thread_quickly(self):
+        """Test a 40-deep reply chain is reduced severalfold in well under a second."""
+        text = "Latest reply on top."
+        for depth in range(40):
+            quoted = "\n".join(f"> {line}" for line in text.split("\n"))
+            text = f"Reply {depth}.\n\nOn Mon, Person {depth} wrote:\n{quoted}"
+
+        started = time.perf_counter()
+        result = strip_quoted_text(text)
+        elapsed = time.perf_counter() - started
+
+        assert result.text == "Reply 39."
+        assert result.removed_bytes * 10 > len(text.encode())
+        assert elapsed < 1
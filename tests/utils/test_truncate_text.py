@@ -0,0 +1,52 @@
+"""
+Tests for truncate_text utility.
+"""
+
+from gmail_mcp_server.utils.truncate_text import truncate_text
+
+
+class TestTruncateText:
+    """Tests for truncate_text function."""
+
+    def test_returns_short_text_unchanged(self):
+        """Test that text within the limit is not cut."""
+        assert truncate_text("Hello", 10) == "Hello"
+        assert truncate_text("Hello", 5) == "Hello"
+
+    def test_prefers_paragraph_breaks(self):
+        """Test that a paragraph break wins over later sentence ends."""
+        text = "First paragraph here.\n\nSecond one. More words follow"
+
+        assert truncate_text(text, 40) == "First paragraph here.\n\n"
+
+    def test_falls_back_to_sentence_end(self):
+        """Test that sentences are kept whole when there is no line break."""
+        text = "First sentence. Second sentence. Third sentence."
+
+        assert truncate_text(text, 40) == "First sentence. Second sentence. "
+
+    def test_falls_back_to_word_boundary(self):
+        """Test that words are not split when there is no sentence end."""
+        assert truncate_text("alpha beta gamma delta", 13) == "alpha beta "
+
+    def test_ignores_boundaries_that_waste_the_budget(self):
+        """Test that a boundary in the first half of the budget is not used."""
+        text = "Hi.\n" + "x" * 50
+
+        assert truncate_text(text, 20) == text[:20]
+
+    def test_hard_cuts_text_without_boundaries(self):
+        """Test that unbroken text is cut at exactly the limit."""
+        assert truncate_text("x" * 100, 30) == "x" * 30
+
+    def test_prefix_length_is_continuation_offset(self):
+        """Test that the rest of the text starts where the prefix ends."""
+        text = "One two three. Four five six.\nSeven eight nine."
+        prefix = truncate_text(text, 25)
+
+        assert text.startswith(prefix)
+        assert prefix + text[len(prefix) :] == text
+
+    def test_zero_budget_returns_empty_string(self):
+        """Test that no characters are returned for a zero budget."""
+        assert truncate_text("Hello world", 0) == ""